@@ -0,0 +1,27 @@
+"""
+Ticket attachment admin configuration.
+"""
+from django.contrib import admin
+
+from .models import Attachment, Blob
+
+
+@admin.register(Attachment)
+class AttachmentAdmin(admin.ModelAdmin):
+    """Admin configuration for Attachment model."""
+
+    list_display = ['id', 'filename', 'content_type', 'ticket', 'uploaded_by', 'created_at']
+    list_select_related = ['ticket', 'uploaded_by']
+    search_fields = ['=id', '=ticket__id']
+    readonly_fields = ['id', 'created_at']
+    raw_id_fields = ['ticket', 'blob', 'uploaded_by']
+    ordering = ['-created_at']
+
+
+@admin.register(Blob)
+class BlobAdmin(admin.ModelAdmin):
+    """Admin configuration for Blob model."""
+
+    list_display = ['sha256', 'size', 'created_at']
+    search_fields = ['=sha256']
+    readonly_fields = ['sha256', 'size', 'created_at']
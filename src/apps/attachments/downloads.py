@@ -0,0 +1,135 @@
+"""
+Attachment download responses.
+
+Files are returned with FileResponse, which the WSGI server turns into a
+sendfile() call when it provides wsgi.file_wrapper (gunicorn does), or
+handed over to nginx with X-Accel-Redirect when
+ATTACHMENTS_ACCEL_REDIRECT_PREFIX is set. Single byte ranges are
+supported in both cases.
+"""
+import io
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpRequest, HttpResponse
+
+from .models import Attachment
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class RangeFile(io.RawIOBase):
+    """
+    Read-only view of a byte range of a file.
+
+    The underlying file is positioned at the start of the range and its
+    descriptor is exposed, so sendfile() sends exactly Content-Length
+    bytes from there; plain reads stop at the end of the range.
+    """
+
+    def __init__(self, file, start: int, length: int) -> None:
+        super().__init__()
+        self._file = file
+        self._file.seek(start)
+        self._remaining = length
+
+    def readable(self) -> bool:
+        return True
+
+    def fileno(self) -> int:
+        return self._file.fileno()
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._file.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """
+    Parse a single-range Range header.
+
+    Args:
+        header: Value of the Range header
+        size: Size of the file
+
+    Returns:
+        Tuple of (first byte, last byte), or None if the range is invalid,
+        unsatisfiable or not a single byte range
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+
+    first, last = match.groups()
+    if first == '':
+        start, end = max(0, size - int(last)), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start > end or start >= size:
+        return None
+    return start, end
+
+
+def _content_disposition(filename: str) -> str:
+    """Return an attachment Content-Disposition header value."""
+    return f"attachment; filename*=utf-8''{quote(filename)}"
+
+
+def build_download_response(request: HttpRequest, attachment: Attachment) -> HttpResponse:
+    """
+    Build the response sending an attachment's content.
+
+    Args:
+        request: HTTP request, possibly with a Range header
+        attachment: Attachment to send
+
+    Returns:
+        200 or 206 response with the content, or 416 for a bad range
+    """
+    blob = attachment.blob
+    etag = f'"{blob.sha256}"'
+    if request.headers.get('If-None-Match') == etag:
+        response = HttpResponse(status=304)
+        response['ETag'] = etag
+        return response
+
+    byte_range = None
+    range_header = request.headers.get('Range')
+    if range_header and request.headers.get('If-Range', etag) == etag:
+        byte_range = parse_range(range_header, blob.size)
+        if byte_range is None:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{blob.size}'
+            return response
+
+    prefix = settings.ATTACHMENTS_ACCEL_REDIRECT_PREFIX
+    if prefix:
+        # nginx serves the file and handles Range itself
+        response = HttpResponse(content_type=attachment.content_type)
+        response['X-Accel-Redirect'] = prefix.rstrip('/') + '/' + blob.relative_path
+    elif byte_range is None:
+        response = FileResponse(open(blob.path, 'rb'), content_type=attachment.content_type)
+        response['Content-Length'] = blob.size
+    else:
+        start, end = byte_range
+        response = FileResponse(
+            RangeFile(open(blob.path, 'rb'), start, end - start + 1),
+            status=206,
+            content_type=attachment.content_type,
+        )
+        response['Content-Length'] = end - start + 1
+        response['Content-Range'] = f'bytes {start}-{end}/{blob.size}'
+
+    response['Content-Disposition'] = _content_disposition(attachment.filename)
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    return response
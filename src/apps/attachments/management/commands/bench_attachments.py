@@ -0,0 +1,163 @@
+"""
+Management command to benchmark attachment upload and download.
+"""
+import io
+import os
+import resource
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.handlers.wsgi import WSGIRequest
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from django.test.utils import override_settings
+
+from apps.attachments.models import Attachment
+from apps.attachments.views import (
+    AttachmentDownloadView,
+    TicketAttachmentListCreateView,
+)
+from apps.tickets.models import Ticket
+from apps.users.models import UserRole
+
+User = get_user_model()
+
+CHUNK = 1024 * 1024
+
+
+class MultipartBody(io.RawIOBase):
+    """Multipart/form-data body streamed from a file on disk."""
+
+    def __init__(self, path: str, boundary: str) -> None:
+        super().__init__()
+        self.boundary = boundary
+        head = (
+            f'--{boundary}\r\n'
+            f'Content-Disposition: form-data; name="file"; filename="{os.path.basename(path)}"\r\n'
+            f'Content-Type: application/octet-stream\r\n\r\n'
+        ).encode()
+        tail = f'\r\n--{boundary}--\r\n'.encode()
+        self.length = len(head) + os.path.getsize(path) + len(tail)
+        self._parts = [io.BytesIO(head), open(path, 'rb'), io.BytesIO(tail)]
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while self._parts:
+            count = self._parts[0].readinto(buffer)
+            if count:
+                return count
+            self._parts.pop(0).close()
+        return 0
+
+
+class Command(BaseCommand):
+    """Upload and download a large file through the attachment views."""
+
+    help = 'Measures throughput and Python memory of streamed attachment upload and download'
+
+    def add_arguments(self, parser) -> None:
+        """Register command arguments."""
+        parser.add_argument('--size-mb', type=int, default=512, help='Size of the test file')
+        parser.add_argument('--keep', action='store_true', help='Do not delete benchmark data')
+
+    def handle(self, *args, **options) -> None:
+        """Execute the command."""
+        run_id = uuid.uuid4().hex[:8]
+        size = options['size_mb'] * CHUNK
+        user = User.objects.create(email=f'bench-{run_id}-applicant@bench.local', role=UserRole.APPLICANT, password='!')
+        ticket = Ticket.objects.create(title=f'bench {run_id}', description='benchmark', created_by=user)
+
+        with tempfile.NamedTemporaryFile(suffix='.bin') as source:
+            for _ in range(options['size_mb']):
+                source.write(os.urandom(CHUNK))
+            source.flush()
+
+            try:
+                with override_settings(ATTACHMENTS_MAX_SIZE=max(size, settings.ATTACHMENTS_MAX_SIZE)):
+                    attachment_id = self._bench_upload(source.name, size, ticket, user)
+                    self._bench_download(attachment_id, size, user, None)
+                    byte_range = f'bytes={size // 4}-{size // 4 + size // 2 - 1}'
+                    self._bench_download(attachment_id, size // 2, user, byte_range)
+                    self._bench_dedup(source.name, size, ticket, user)
+            finally:
+                if not options['keep']:
+                    blobs = {a.blob for a in Attachment.objects.filter(ticket=ticket).select_related('blob')}
+                    ticket.delete()
+                    for blob in blobs:
+                        if not blob.attachments.exists():
+                            blob.path.unlink(missing_ok=True)
+                            blob.delete()
+                    user.delete()
+
+    def _request(self, method: str, path: str, user, body: MultipartBody | None = None, **headers) -> WSGIRequest:
+        """Build an authenticated request, streaming the body if given."""
+        environ = {'PATH_INFO': path, 'REQUEST_METHOD': method, **headers}
+        if body is not None:
+            environ.update({
+                'CONTENT_TYPE': f'multipart/form-data; boundary={body.boundary}',
+                'CONTENT_LENGTH': str(body.length),
+                'wsgi.input': io.BufferedReader(body, CHUNK),
+            })
+        request = WSGIRequest(RequestFactory()._base_environ(**environ))
+        request._force_auth_user = user
+        return request
+
+    def _measure(self, label: str, size: int, func):
+        """Run a step and print throughput and memory peaks."""
+        tracemalloc.start()
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        self.stdout.write(
+            f'{label:<10} {size / CHUNK:8.0f} MiB in {elapsed:6.2f}s '
+            f'({size / CHUNK / elapsed:7.1f} MiB/s), python peak {peak / CHUNK:6.1f} MiB, max RSS {max_rss:6.0f} MiB'
+        )
+        return result
+
+    def _upload(self, path: str, ticket, user):
+        """Upload a file through the view and return the response."""
+        body = MultipartBody(path, f'bench{uuid.uuid4().hex}')
+        request = self._request('POST', f'/api/tickets/{ticket.id}/attachments/', user, body)
+        response = TicketAttachmentListCreateView.as_view()(request, ticket_id=ticket.id)
+        response.render()
+        return response
+
+    def _bench_upload(self, path: str, size: int, ticket, user) -> str:
+        """Upload a new file."""
+        response = self._measure('upload', size, lambda: self._upload(path, ticket, user))
+        if response.status_code != 201:
+            raise RuntimeError(f'Upload failed: {response.status_code} {response.data}')
+        return response.data['id']
+
+    def _bench_dedup(self, path: str, size: int, ticket, user) -> None:
+        """Upload the same content again; it must reuse the stored blob."""
+        response = self._measure('dedup', size, lambda: self._upload(path, ticket, user))
+        attachments = Attachment.objects.filter(ticket=ticket)
+        blobs = attachments.values('blob').distinct().count()
+        self.stdout.write(f'{"":<10} {attachments.count()} attachments share {blobs} blob(s)')
+        if response.status_code != 201:
+            raise RuntimeError(f'Upload failed: {response.status_code} {response.data}')
+
+    def _bench_download(self, attachment_id: str, size: int, user, byte_range: str | None) -> None:
+        """Download the file, optionally a range of it, without sendfile."""
+        headers = {'HTTP_RANGE': byte_range} if byte_range else {}
+
+        def download() -> int:
+            request = self._request('GET', f'/api/attachments/{attachment_id}/', user, **headers)
+            response = AttachmentDownloadView.as_view()(request, attachment_id=attachment_id)
+            received = sum(len(chunk) for chunk in response.streaming_content)
+            response.close()
+            return received
+
+        received = self._measure('range' if byte_range else 'download', size, download)
+        if received != size:
+            raise RuntimeError(f'Downloaded {received} bytes, expected {size}')
@@ -0,0 +1,82 @@
+"""
+Ticket attachment models.
+"""
+import uuid
+from pathlib import Path
+
+from django.conf import settings
+from django.db import models
+
+
+class Blob(models.Model):
+    """
+    File content stored once per distinct SHA-256 digest.
+
+    Attachments with identical content share a blob, stored on disk under
+    ATTACHMENTS_ROOT/blobs/<aa>/<bb>/<digest>.
+    """
+
+    sha256 = models.CharField('SHA-256', max_length=64, unique=True)
+    size = models.PositiveBigIntegerField('Размер, байт')
+    created_at = models.DateTimeField('Дата создания', auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Содержимое файла'
+        verbose_name_plural = 'Содержимое файлов'
+
+    def __str__(self) -> str:
+        return self.sha256
+
+    @property
+    def relative_path(self) -> str:
+        """Path of the content relative to ATTACHMENTS_ROOT."""
+        return f'blobs/{self.sha256[:2]}/{self.sha256[2:4]}/{self.sha256}'
+
+    @property
+    def path(self) -> Path:
+        """Absolute path of the content."""
+        return Path(settings.ATTACHMENTS_ROOT) / self.relative_path
+
+
+class Attachment(models.Model):
+    """File attached to a ticket."""
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+    ticket = models.ForeignKey(
+        'tickets.Ticket',
+        on_delete=models.CASCADE,
+        related_name='attachments',
+        verbose_name='Заявка',
+    )
+    blob = models.ForeignKey(
+        Blob,
+        on_delete=models.PROTECT,
+        related_name='attachments',
+        verbose_name='Содержимое',
+    )
+    filename = models.CharField('Имя файла', max_length=255)
+    content_type = models.CharField('Тип содержимого', max_length=255)
+    uploaded_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        related_name='attachments',
+        verbose_name='Загрузил',
+        null=True,
+        blank=True,
+    )
+    created_at = models.DateTimeField('Дата загрузки', auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Вложение'
+        verbose_name_plural = 'Вложения'
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['ticket', 'created_at']),
+        ]
+
+    def __str__(self) -> str:
+        return self.filename
@@ -0,0 +1,34 @@
+"""
+Ticket attachment database query selectors.
+"""
+from uuid import UUID
+
+from django.db.models import QuerySet
+
+from .models import Attachment
+
+
+def get_ticket_attachments(ticket_id: UUID) -> QuerySet[Attachment]:
+    """
+    Get attachments of a ticket with their content and uploader.
+
+    Args:
+        ticket_id: Ticket's UUID
+
+    Returns:
+        QuerySet of the ticket's attachments, oldest first
+    """
+    return Attachment.objects.select_related('blob', 'uploaded_by').filter(ticket_id=ticket_id)
+
+
+def get_attachment_by_id(attachment_id: UUID) -> Attachment | None:
+    """
+    Get attachment by ID with its content.
+
+    Args:
+        attachment_id: Attachment's UUID
+
+    Returns:
+        Attachment instance or None if not found
+    """
+    return Attachment.objects.select_related('blob').filter(id=attachment_id).first()
@@ -0,0 +1,34 @@
+"""
+Ticket attachment serializers.
+"""
+from rest_framework import serializers
+
+from apps.users.serializers import UserShortSerializer
+
+from .models import Attachment
+
+
+class AttachmentSerializer(serializers.ModelSerializer):
+    """Serializer for attachment metadata."""
+
+    size = serializers.IntegerField(source='blob.size', read_only=True)
+    sha256 = serializers.CharField(source='blob.sha256', read_only=True)
+    uploaded_by = UserShortSerializer(read_only=True)
+
+    class Meta:
+        model = Attachment
+        fields = [
+            'id',
+            'filename',
+            'content_type',
+            'size',
+            'sha256',
+            'uploaded_by',
+            'created_at',
+        ]
+
+
+class AttachmentUploadSerializer(serializers.Serializer):
+    """Serializer for attachment upload."""
+
+    file = serializers.FileField()
@@ -0,0 +1,99 @@
+"""
+Ticket attachment business logic services.
+"""
+import os
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from apps.tickets.models import Ticket
+
+from .models import Attachment, Blob
+from .uploads import HashedUploadedFile
+
+User = get_user_model()
+
+
+def create_attachment(
+    *,
+    ticket: Ticket,
+    upload: HashedUploadedFile,
+    uploaded_by: User,
+) -> Attachment:
+    """
+    Attach an uploaded file to a ticket.
+
+    Content already stored under the same digest is reused and the upload
+    is discarded; otherwise the temporary file is renamed into the blob
+    store, without copying it.
+
+    Args:
+        ticket: Ticket to attach the file to
+        upload: File received by AttachmentUploadHandler
+        uploaded_by: User uploading the file
+
+    Returns:
+        Created attachment instance
+    """
+    with transaction.atomic():
+        # The blob stays locked until the attachment referring to it is
+        # committed, so delete_unreferenced_blobs() can't drop it meanwhile
+        blob = Blob.objects.select_for_update().filter(sha256=upload.sha256).first()
+        if blob is None:
+            blob = Blob(sha256=upload.sha256, size=upload.size)
+            blob.path.parent.mkdir(parents=True, exist_ok=True)
+            # Concurrent uploads of the same content rename identical files
+            # onto the same path, so the race is harmless.
+            os.replace(upload.temporary_file_path(), blob.path)
+            blob, _ = Blob.objects.select_for_update().get_or_create(
+                sha256=upload.sha256,
+                defaults={'size': upload.size},
+            )
+        attachment = Attachment.objects.create(
+            ticket=ticket,
+            blob=blob,
+            filename=os.path.basename(upload.name)[:255],
+            content_type=upload.content_type or 'application/octet-stream',
+            uploaded_by=uploaded_by,
+        )
+    upload.close()
+    return attachment
+
+
+def delete_unreferenced_blobs(blob_ids: list[int]) -> int:
+    """
+    Delete the blobs among blob_ids that no attachment refers to any more.
+
+    Called after attachments were deleted in bulk. The rows are deleted in
+    the caller's transaction and the files once it commits, unless the
+    same content has been uploaded again in the meantime.
+
+    Args:
+        blob_ids: IDs of the blobs the deleted attachments referred to
+
+    Returns:
+        Number of deleted blobs
+    """
+    with transaction.atomic():
+        locked = list(Blob.objects.select_for_update().filter(id__in=blob_ids).order_by('id'))
+        # Checked after locking, in a statement of its own, so attachments
+        # committed by create_attachment() while it held a lock are seen
+        referenced = set(
+            Attachment.objects.filter(blob__in=locked).values_list('blob_id', flat=True)
+        )
+        blobs = [blob for blob in locked if blob.id not in referenced]
+        if not blobs:
+            return 0
+        Blob.objects.filter(id__in=[blob.id for blob in blobs]).delete()
+        transaction.on_commit(lambda: _remove_blob_files(blobs))
+    return len(blobs)
+
+
+def _remove_blob_files(blobs: list[Blob]) -> None:
+    """Remove the files of deleted blobs whose content wasn't stored again."""
+    stored_again = set(
+        Blob.objects.filter(sha256__in=[blob.sha256 for blob in blobs]).values_list('sha256', flat=True)
+    )
+    for blob in blobs:
+        if blob.sha256 not in stored_again:
+            blob.path.unlink(missing_ok=True)
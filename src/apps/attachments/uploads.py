@@ -0,0 +1,90 @@
+"""
+Streaming upload handling for attachments.
+
+Uploaded files are written chunk by chunk to a temporary file inside
+ATTACHMENTS_ROOT while their SHA-256 digest is computed, so neither the
+file nor a second pass over it is needed in memory. The temporary file
+lives on the same filesystem as the blobs and is moved into place with a
+rename.
+"""
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+
+from core.exceptions import AttachmentTooLargeError
+
+
+class HashedUploadedFile(UploadedFile):
+    """Uploaded file in a temporary file with its SHA-256 digest."""
+
+    def __init__(self, name: str, content_type: str, charset: str | None, content_type_extra: dict | None) -> None:
+        directory = Path(settings.ATTACHMENTS_ROOT) / 'tmp'
+        directory.mkdir(parents=True, exist_ok=True)
+        file = tempfile.NamedTemporaryFile(suffix='.upload', dir=directory, delete=False)
+        super().__init__(file, name, content_type, 0, charset, content_type_extra)
+        self.hasher = hashlib.sha256()
+
+    @property
+    def sha256(self) -> str:
+        """Hex digest of the uploaded content."""
+        return self.hasher.hexdigest()
+
+    def temporary_file_path(self) -> str:
+        """Return the path of the temporary file."""
+        return self.file.name
+
+    def close(self) -> None:
+        """Close and remove the temporary file if it was not moved."""
+        try:
+            self.file.close()
+        finally:
+            Path(self.file.name).unlink(missing_ok=True)
+
+
+class AttachmentUploadHandler(FileUploadHandler):
+    """Upload handler streaming files to disk and hashing them on the way."""
+
+    chunk_size = 1024 * 1024
+
+    def new_file(self, *args, **kwargs) -> None:
+        """Start writing a new file."""
+        super().new_file(*args, **kwargs)
+        self.file = HashedUploadedFile(
+            self.file_name, self.content_type, self.charset, self.content_type_extra,
+        )
+        self.received = 0
+
+    def receive_data_chunk(self, raw_data: bytes, start: int) -> None:
+        """
+        Write a chunk and update the digest.
+
+        Raises:
+            AttachmentTooLargeError: If the file exceeds ATTACHMENTS_MAX_SIZE
+        """
+        self.received += len(raw_data)
+        if self.received > settings.ATTACHMENTS_MAX_SIZE:
+            self.file.close()
+            raise AttachmentTooLargeError(
+                f'Файл превышает допустимый размер {settings.ATTACHMENTS_MAX_SIZE} байт.'
+            )
+        self.file.write(raw_data)
+        self.file.hasher.update(raw_data)
+        return None
+
+    def file_complete(self, file_size: int) -> HashedUploadedFile:
+        """Finish the file and flush it to disk."""
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.seek(0)
+        self.file.size = file_size
+        return self.file
+
+    def upload_interrupted(self) -> None:
+        """Remove the partial file of an aborted upload."""
+        if hasattr(self, 'file'):
+            self.file.close()
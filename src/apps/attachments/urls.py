@@ -0,0 +1,21 @@
+"""
+Ticket attachment URL routes.
+"""
+from django.urls import path
+
+from .views import AttachmentDownloadView, TicketAttachmentListCreateView
+
+app_name = 'attachments'
+
+urlpatterns = [
+    path(
+        'tickets/<uuid:ticket_id>/attachments/',
+        TicketAttachmentListCreateView.as_view(),
+        name='ticket-attachments',
+    ),
+    path(
+        'attachments/<uuid:attachment_id>/',
+        AttachmentDownloadView.as_view(),
+        name='attachment-download',
+    ),
+]
@@ -0,0 +1,130 @@
+"""
+Ticket attachment API views.
+"""
+from django.http import HttpResponse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, extend_schema_view
+from rest_framework import status
+from rest_framework.parsers import MultiPartParser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.tickets.models import Ticket
+from apps.tickets.selectors import get_visible_tickets
+from core.exceptions import NotFoundError
+
+from .downloads import build_download_response
+from .selectors import get_attachment_by_id, get_ticket_attachments
+from .serializers import AttachmentSerializer, AttachmentUploadSerializer
+from .services import create_attachment
+from .uploads import AttachmentUploadHandler
+
+
+def _get_visible_ticket(request: Request, ticket_id) -> Ticket:
+    """Return the ticket if the user can see it, 404 otherwise."""
+    ticket = get_visible_tickets(request.user).filter(id=ticket_id).first()
+    if not ticket:
+        raise NotFoundError('Заявка не найдена.')
+    return ticket
+
+
+@extend_schema_view(
+    get=extend_schema(
+        responses={200: AttachmentSerializer(many=True)},
+        summary='Вложения заявки',
+        description='Список файлов, прикреплённых к заявке',
+    ),
+    post=extend_schema(
+        request={'multipart/form-data': AttachmentUploadSerializer},
+        responses={201: AttachmentSerializer},
+        summary='Прикрепить файл',
+        description='Загрузка файла к заявке (автор заявки, исполнитель или оператор)',
+    ),
+)
+class TicketAttachmentListCreateView(APIView):
+    """API view for listing and uploading ticket attachments."""
+
+    parser_classes = [MultiPartParser]
+
+    @property
+    def throttle_scope(self) -> str:
+        """Return throttle scope based on HTTP method."""
+        if self.request.method == 'POST':
+            return 'attachments_write'
+        return 'attachments_read'
+
+    def get(self, request: Request, ticket_id: str) -> Response:
+        """
+        Get ticket's attachments.
+
+        Args:
+            request: HTTP request
+            ticket_id: Ticket's UUID
+
+        Returns:
+            Response with list of attachments
+        """
+        ticket = _get_visible_ticket(request, ticket_id)
+        attachments = get_ticket_attachments(ticket.id)
+        return Response(AttachmentSerializer(attachments, many=True).data)
+
+    def post(self, request: Request, ticket_id: str) -> Response:
+        """
+        Upload a file to the ticket.
+
+        The file is streamed to disk and hashed while the request body is
+        read; the visibility check runs before the body is touched.
+
+        Args:
+            request: HTTP request with multipart 'file' field
+            ticket_id: Ticket's UUID
+
+        Returns:
+            Response with created attachment data
+        """
+        ticket = _get_visible_ticket(request, ticket_id)
+
+        request.upload_handlers = [AttachmentUploadHandler(request)]
+        serializer = AttachmentUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        attachment = create_attachment(
+            ticket=ticket,
+            upload=serializer.validated_data['file'],
+            uploaded_by=request.user,
+        )
+
+        return Response(
+            AttachmentSerializer(attachment).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class AttachmentDownloadView(APIView):
+    """API view for downloading an attachment."""
+
+    throttle_scope = 'attachments_read'
+
+    @extend_schema(
+        responses={(200, 'application/octet-stream'): OpenApiTypes.BINARY},
+        summary='Скачать вложение',
+        description='Скачивание файла; поддерживаются запросы диапазонов (Range)',
+    )
+    def get(self, request: Request, attachment_id: str) -> HttpResponse:
+        """
+        Download attachment's content.
+
+        Args:
+            request: HTTP request, optionally with a Range header
+            attachment_id: Attachment's UUID
+
+        Returns:
+            Streaming file response
+        """
+        attachment = get_attachment_by_id(attachment_id)
+        if not attachment:
+            raise NotFoundError('Вложение не найдено.')
+        _get_visible_ticket(request, attachment.ticket_id)
+
+        return build_download_response(request, attachment)
@@ -0,0 +1,26 @@
+"""
+Background job admin configuration.
+"""
+from django.contrib import admin
+
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    """Admin configuration for Job model."""
+
+    list_display = [
+        'id',
+        'name',
+        'status',
+        'attempts',
+        'run_at',
+        'created_at',
+        'finished_at',
+    ]
+    list_filter = ['status', 'name']
+    search_fields = ['=id', 'name']
+    readonly_fields = ['id', 'created_at', 'updated_at', 'locked_at', 'locked_by', 'finished_at']
+    raw_id_fields = ['created_by']
+    ordering = ['-created_at']
@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class JobsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.jobs'
+    verbose_name = 'Фоновые задачи'
+
+    def ready(self) -> None:
+        # Job handlers are registered in <app>/tasks.py modules
+        autodiscover_modules('tasks')
+        # Register gauges before the first /metrics scrape
+        from . import metrics  # noqa: F401
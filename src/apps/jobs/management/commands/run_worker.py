@@ -0,0 +1,111 @@
+"""
+Management command to process background jobs.
+"""
+import os
+import signal
+import socket
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+
+from apps.jobs.models import Job, JobStatus
+from apps.jobs.services import claim_jobs, extend_job_locks, requeue_stale_jobs, run_job
+
+
+def _run_in_thread(job: Job) -> Job:
+    """Run a job and release the thread's database connection if needed."""
+    close_old_connections()
+    try:
+        return run_job(job)
+    finally:
+        close_old_connections()
+
+
+class Command(BaseCommand):
+    """Claim queued jobs and run them in a thread pool."""
+
+    help = 'Runs a worker that processes background jobs from the database queue'
+
+    def add_arguments(self, parser) -> None:
+        """Register command arguments."""
+        parser.add_argument('--concurrency', type=int, default=4)
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=1.0,
+            help='Seconds to sleep when the queue is empty',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit when there are no due jobs left',
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Execute the command."""
+        concurrency = options['concurrency']
+        worker_id = f'{socket.gethostname()}:{os.getpid()}'
+        stopping = threading.Event()
+
+        def stop(signum, frame) -> None:
+            self.stdout.write('Shutting down after running jobs finish...')
+            stopping.set()
+
+        signal.signal(signal.SIGINT, stop)
+        signal.signal(signal.SIGTERM, stop)
+
+        self.stdout.write(self.style.SUCCESS(f'Worker {worker_id} started'))
+        running: dict[Future, Job] = {}
+        last_recovery = 0.0
+        last_heartbeat = time.monotonic()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            while not stopping.is_set():
+                if time.monotonic() - last_recovery > 60:
+                    requeued = requeue_stale_jobs()
+                    if requeued:
+                        self.stdout.write(self.style.WARNING(f'Requeued {requeued} stale jobs'))
+                    last_recovery = time.monotonic()
+
+                if time.monotonic() - last_heartbeat >= settings.JOBS_HEARTBEAT_INTERVAL:
+                    extend_job_locks(worker_id=worker_id, job_ids=[job.id for job in running.values()])
+                    last_heartbeat = time.monotonic()
+
+                jobs = claim_jobs(worker_id=worker_id, limit=concurrency - len(running))
+                for job in jobs:
+                    running[pool.submit(_run_in_thread, job)] = job
+
+                if not running:
+                    if options['once']:
+                        break
+                    stopping.wait(options['poll_interval'])
+                    continue
+
+                # A full pool still wakes up to renew the locks of long jobs
+                full = len(running) >= concurrency
+                done, _ = wait(
+                    running,
+                    timeout=settings.JOBS_HEARTBEAT_INTERVAL if full else options['poll_interval'],
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    del running[future]
+                    try:
+                        job = future.result()
+                    except Exception as exc:
+                        self.stderr.write(self.style.ERROR(f'Job outcome was not saved: {exc}'))
+                        continue
+                    style = self.style.SUCCESS if job.status == JobStatus.SUCCEEDED else self.style.WARNING
+                    self.stdout.write(style(f'Job {job.id} ({job.name}): {job.status}'))
+
+            while running:
+                done, _ = wait(running, timeout=settings.JOBS_HEARTBEAT_INTERVAL)
+                for future in done:
+                    del running[future]
+                extend_job_locks(worker_id=worker_id, job_ids=[job.id for job in running.values()])
+
+        connection.close()
+        self.stdout.write(self.style.SUCCESS(f'Worker {worker_id} stopped'))
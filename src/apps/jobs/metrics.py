@@ -0,0 +1,12 @@
+"""
+Background job metrics.
+"""
+from core.metrics import Gauge
+
+from .selectors import get_queued_jobs_count
+
+JOBS_QUEUED = Gauge(
+    'helpdesk_jobs_queued',
+    'Jobs waiting to run',
+    collect=lambda: [((), get_queued_jobs_count())],
+)
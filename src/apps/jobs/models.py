@@ -0,0 +1,73 @@
+"""
+Background job models.
+"""
+import uuid
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+
+class JobStatus(models.TextChoices):
+    """Job status choices."""
+    QUEUED = 'queued', 'В очереди'
+    RUNNING = 'running', 'Выполняется'
+    SUCCEEDED = 'succeeded', 'Выполнена'
+    FAILED = 'failed', 'Ошибка'
+
+
+class Job(models.Model):
+    """Deferred unit of work processed by the run_worker command."""
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+    name = models.CharField('Обработчик', max_length=100)
+    payload = models.JSONField('Параметры', default=dict, encoder=DjangoJSONEncoder)
+    status = models.CharField(
+        'Статус',
+        max_length=20,
+        choices=JobStatus.choices,
+        default=JobStatus.QUEUED,
+    )
+    attempts = models.PositiveIntegerField('Попыток', default=0)
+    max_attempts = models.PositiveIntegerField('Максимум попыток', default=5)
+    run_at = models.DateTimeField('Запуск не ранее', default=timezone.now)
+    locked_at = models.DateTimeField('Взята в работу', null=True, blank=True)
+    locked_by = models.CharField('Воркер', max_length=100, blank=True)
+    result = models.JSONField('Результат', null=True, blank=True, encoder=DjangoJSONEncoder)
+    last_error = models.TextField('Последняя ошибка', blank=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        related_name='jobs',
+        verbose_name='Создал',
+        null=True,
+        blank=True,
+    )
+    created_at = models.DateTimeField('Дата создания', auto_now_add=True)
+    updated_at = models.DateTimeField('Дата обновления', auto_now=True)
+    finished_at = models.DateTimeField('Дата завершения', null=True, blank=True)
+
+    class Meta:
+        verbose_name = 'Фоновая задача'
+        verbose_name_plural = 'Фоновые задачи'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['run_at'],
+                condition=models.Q(status=JobStatus.QUEUED),
+                name='jobs_job_queued_run_at_idx',
+            ),
+            models.Index(
+                fields=['locked_at'],
+                condition=models.Q(status=JobStatus.RUNNING),
+                name='jobs_job_running_locked_idx',
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.name} ({self.get_status_display()})'
@@ -0,0 +1,27 @@
+"""
+Background job permission classes.
+"""
+from rest_framework.permissions import BasePermission
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+from apps.users.models import UserRole
+
+from .models import Job
+
+
+class CanViewJob(BasePermission):
+    """Permission for viewing job status (operator or job creator)."""
+
+    message = 'Статус задачи доступен только её автору и операторам.'
+
+    def has_permission(self, request: Request, view: APIView) -> bool:
+        """Check if user is authenticated."""
+        return request.user.is_authenticated
+
+    def has_object_permission(self, request: Request, view: APIView, obj: Job) -> bool:
+        """Check if user is an operator or created the job."""
+        return (
+            request.user.role == UserRole.OPERATOR or
+            obj.created_by_id == request.user.id
+        )
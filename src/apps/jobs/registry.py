@@ -0,0 +1,40 @@
+"""
+Registry of background job handlers.
+"""
+from collections.abc import Callable
+
+_handlers: dict[str, Callable] = {}
+
+
+def register_job(name: str) -> Callable[[Callable], Callable]:
+    """
+    Register a function as a job handler.
+
+    The handler is called with the job payload as keyword arguments and
+    must return a JSON-serializable result or None.
+
+    Args:
+        name: Unique handler name used when enqueuing jobs
+
+    Returns:
+        Decorator registering the function
+    """
+    def decorator(func: Callable) -> Callable:
+        if name in _handlers:
+            raise ValueError(f'Job handler {name!r} is already registered')
+        _handlers[name] = func
+        return func
+    return decorator
+
+
+def get_job_handler(name: str) -> Callable | None:
+    """
+    Get a registered job handler.
+
+    Args:
+        name: Handler name
+
+    Returns:
+        Handler function or None if not registered
+    """
+    return _handlers.get(name)
@@ -0,0 +1,29 @@
+"""
+Background job database query selectors.
+"""
+from uuid import UUID
+
+from .models import Job, JobStatus
+
+
+def get_job_by_id(job_id: UUID) -> Job | None:
+    """
+    Get job by ID.
+
+    Args:
+        job_id: Job's UUID
+
+    Returns:
+        Job instance or None if not found
+    """
+    return Job.objects.filter(id=job_id).first()
+
+
+def get_queued_jobs_count() -> int:
+    """
+    Get the number of jobs waiting to run.
+
+    Returns:
+        Number of queued jobs, including ones scheduled for later
+    """
+    return Job.objects.filter(status=JobStatus.QUEUED).count()
@@ -0,0 +1,29 @@
+"""
+Background job serializers.
+"""
+from rest_framework import serializers
+
+from .models import Job
+
+
+class JobSerializer(serializers.ModelSerializer):
+    """Serializer for job status."""
+
+    status_display = serializers.CharField(source='get_status_display', read_only=True)
+
+    class Meta:
+        model = Job
+        fields = [
+            'id',
+            'name',
+            'status',
+            'status_display',
+            'attempts',
+            'max_attempts',
+            'run_at',
+            'result',
+            'last_error',
+            'created_at',
+            'updated_at',
+            'finished_at',
+        ]
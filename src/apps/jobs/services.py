@@ -0,0 +1,228 @@
+"""
+Background job business logic services.
+"""
+import json
+import random
+import traceback
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.exceptions import ValidationError
+
+from .models import Job, JobStatus
+from .registry import get_job_handler
+
+User = get_user_model()
+
+
+def enqueue_job(
+    *,
+    name: str,
+    payload: dict | None = None,
+    created_by: User | None = None,
+    run_at: datetime | None = None,
+    max_attempts: int | None = None,
+) -> Job:
+    """
+    Add a job to the queue.
+
+    When called inside a transaction, the job becomes visible to workers
+    only after the transaction commits.
+
+    Args:
+        name: Registered handler name
+        payload: Keyword arguments for the handler
+        created_by: User who requested the job
+        run_at: Earliest time to run the job (now by default)
+        max_attempts: Number of attempts before the job is marked as failed
+
+    Returns:
+        Created job instance
+
+    Raises:
+        ValidationError: If no handler is registered under the name
+    """
+    if get_job_handler(name) is None:
+        raise ValidationError(f'Неизвестный обработчик задачи: {name}.')
+
+    return Job.objects.create(
+        name=name,
+        payload=payload or {},
+        created_by=created_by,
+        run_at=run_at or timezone.now(),
+        max_attempts=max_attempts or settings.JOBS_MAX_ATTEMPTS,
+    )
+
+
+def claim_jobs(*, worker_id: str, limit: int) -> list[Job]:
+    """
+    Lock due jobs and mark them as running.
+
+    Rows are selected with FOR UPDATE SKIP LOCKED, so concurrent workers
+    never block on each other or claim the same job.
+
+    Args:
+        worker_id: Identifier of the claiming worker
+        limit: Maximum number of jobs to claim
+
+    Returns:
+        Claimed jobs
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        jobs = list(
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(status=JobStatus.QUEUED, run_at__lte=now)
+            .order_by('run_at')[:limit]
+        )
+        if not jobs:
+            return []
+
+        Job.objects.filter(id__in=[job.id for job in jobs]).update(
+            status=JobStatus.RUNNING,
+            attempts=F('attempts') + 1,
+            locked_at=now,
+            locked_by=worker_id,
+            updated_at=now,
+        )
+
+    for job in jobs:
+        job.status = JobStatus.RUNNING
+        job.attempts += 1
+        job.locked_at = now
+        job.locked_by = worker_id
+    return jobs
+
+
+def run_job(job: Job) -> Job:
+    """
+    Execute a claimed job and record the outcome.
+
+    Failed jobs are requeued with exponential backoff until they run out
+    of attempts; a result that can't be stored as JSON fails the job for
+    good. The outcome is discarded if the job was requeued as stale and
+    claimed again while this run was still going.
+
+    Args:
+        job: Job claimed by claim_jobs()
+
+    Returns:
+        Updated job instance
+    """
+    handler = get_job_handler(job.name)
+    try:
+        if handler is None:
+            raise LookupError(f'Job handler {job.name!r} is not registered')
+        result = handler(**job.payload)
+    except Exception:
+        return _fail_job(job, traceback.format_exc())
+
+    try:
+        json.dumps(result, cls=DjangoJSONEncoder)
+    except (TypeError, ValueError) as exc:
+        return _fail_job(job, f'Результат задачи не сериализуется в JSON: {exc}', retry=False)
+
+    job.status = JobStatus.SUCCEEDED
+    job.result = result
+    job.last_error = ''
+    job.finished_at = timezone.now()
+    return _finish_job(job, ['status', 'result', 'last_error', 'finished_at'])
+
+
+def _fail_job(job: Job, error: str, *, retry: bool = True) -> Job:
+    """Requeue a failed job with backoff or mark it as failed."""
+    now = timezone.now()
+    job.last_error = error
+    if not retry or job.attempts >= job.max_attempts:
+        job.status = JobStatus.FAILED
+        job.finished_at = now
+    else:
+        delay = min(
+            settings.JOBS_RETRY_BACKOFF * 2 ** (job.attempts - 1),
+            settings.JOBS_RETRY_BACKOFF_MAX,
+        )
+        job.status = JobStatus.QUEUED
+        job.run_at = now + timedelta(seconds=delay * random.uniform(0.8, 1.2))
+    return _finish_job(job, ['status', 'last_error', 'run_at', 'finished_at'])
+
+
+def _finish_job(job: Job, fields: list[str]) -> Job:
+    """
+    Save the outcome of a run if the job is still held by that run's claim.
+
+    Every claim increments attempts, so the worker and the attempt number
+    identify the claim; locked_at changes on every heartbeat.
+
+    Returns:
+        The job as saved, or as currently stored if the claim was lost
+    """
+    updated = Job.objects.filter(
+        id=job.id,
+        status=JobStatus.RUNNING,
+        locked_by=job.locked_by,
+        attempts=job.attempts,
+    ).update(updated_at=timezone.now(), **{field: getattr(job, field) for field in fields})
+    if not updated:
+        job.refresh_from_db()
+    return job
+
+
+def extend_job_locks(*, worker_id: str, job_ids: list) -> int:
+    """
+    Renew the locks of jobs that a worker is still running.
+
+    Workers call this every JOBS_HEARTBEAT_INTERVAL seconds, so only jobs
+    of workers that stopped renewing them are treated as abandoned.
+
+    Args:
+        worker_id: Identifier the jobs were claimed with
+        job_ids: IDs of the jobs the worker is running
+
+    Returns:
+        Number of renewed locks
+    """
+    if not job_ids:
+        return 0
+    return Job.objects.filter(
+        id__in=job_ids,
+        status=JobStatus.RUNNING,
+        locked_by=worker_id,
+    ).update(locked_at=timezone.now())
+
+
+def requeue_stale_jobs() -> int:
+    """
+    Return jobs abandoned by crashed workers to the queue.
+
+    A running job is considered abandoned when its lock hasn't been
+    renewed for JOBS_LOCK_TIMEOUT seconds.
+
+    Jobs that have no attempts left are marked as failed instead.
+
+    Returns:
+        Number of requeued jobs
+    """
+    now = timezone.now()
+    error = 'Воркер не завершил задачу до истечения блокировки.'
+    stale = Job.objects.filter(
+        status=JobStatus.RUNNING,
+        locked_at__lt=now - timedelta(seconds=settings.JOBS_LOCK_TIMEOUT),
+    )
+    stale.filter(attempts__gte=F('max_attempts')).update(
+        status=JobStatus.FAILED,
+        last_error=error,
+        finished_at=now,
+        updated_at=now,
+    )
+    return stale.filter(attempts__lt=F('max_attempts')).update(
+        status=JobStatus.QUEUED,
+        run_at=now,
+        last_error=error,
+        updated_at=now,
+    )
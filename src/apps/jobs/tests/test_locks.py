@@ -0,0 +1,67 @@
+"""
+Tests of job lock renewal and stale job recovery.
+"""
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.jobs.models import Job, JobStatus
+from apps.jobs.registry import register_job
+from apps.jobs.services import (
+    claim_jobs,
+    enqueue_job,
+    extend_job_locks,
+    requeue_stale_jobs,
+    run_job,
+)
+
+
+@register_job('tests.echo')
+def echo(**payload) -> dict:
+    return payload
+
+
+@override_settings(JOBS_LOCK_TIMEOUT=600)
+class JobLockTests(TestCase):
+    """extend_job_locks() keeps long jobs from being requeued."""
+
+    def claim_stale_job(self) -> Job:
+        enqueue_job(name='tests.echo', payload={'value': 1})
+        [job] = claim_jobs(worker_id='worker-1', limit=1)
+        Job.objects.filter(id=job.id).update(locked_at=timezone.now() - timedelta(seconds=601))
+        return job
+
+    def test_renewed_job_is_not_requeued(self) -> None:
+        job = self.claim_stale_job()
+
+        self.assertEqual(extend_job_locks(worker_id='worker-1', job_ids=[job.id]), 1)
+        self.assertEqual(requeue_stale_jobs(), 0)
+        self.assertEqual(Job.objects.get(id=job.id).status, JobStatus.RUNNING)
+
+    def test_outcome_is_saved_after_renewal(self) -> None:
+        job = self.claim_stale_job()
+        extend_job_locks(worker_id='worker-1', job_ids=[job.id])
+
+        job = run_job(job)
+
+        stored = Job.objects.get(id=job.id)
+        self.assertEqual(stored.status, JobStatus.SUCCEEDED)
+        self.assertEqual(stored.result, {'value': 1})
+
+    def test_other_worker_does_not_renew_the_lock(self) -> None:
+        job = self.claim_stale_job()
+
+        self.assertEqual(extend_job_locks(worker_id='worker-2', job_ids=[job.id]), 0)
+        self.assertEqual(requeue_stale_jobs(), 1)
+
+    def test_outcome_of_requeued_run_is_discarded(self) -> None:
+        job = self.claim_stale_job()
+        requeue_stale_jobs()
+        Job.objects.filter(id=job.id).update(run_at=timezone.now())
+        [reclaimed] = claim_jobs(worker_id='worker-1', limit=1)
+
+        stale_outcome = run_job(job)
+
+        self.assertEqual(stale_outcome.status, JobStatus.RUNNING)
+        self.assertEqual(stale_outcome.attempts, reclaimed.attempts)
@@ -0,0 +1,12 @@
+"""
+Background job URL routes.
+"""
+from django.urls import path
+
+from .views import JobDetailView
+
+app_name = 'jobs'
+
+urlpatterns = [
+    path('<uuid:job_id>/', JobDetailView.as_view(), name='job-detail'),
+]
@@ -0,0 +1,42 @@
+"""
+Background job API views.
+"""
+from drf_spectacular.utils import extend_schema
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.exceptions import NotFoundError
+
+from .permissions import CanViewJob
+from .selectors import get_job_by_id
+from .serializers import JobSerializer
+
+
+class JobDetailView(APIView):
+    """API view for background job status."""
+
+    permission_classes = [CanViewJob]
+
+    @extend_schema(
+        responses={200: JobSerializer},
+        summary='Статус фоновой задачи',
+        description='Получение статуса фоновой задачи (автор задачи или оператор)',
+    )
+    def get(self, request: Request, job_id: str) -> Response:
+        """
+        Get job status.
+
+        Args:
+            request: HTTP request
+            job_id: Job's UUID
+
+        Returns:
+            Response with job status
+        """
+        job = get_job_by_id(job_id)
+        if not job:
+            raise NotFoundError('Задача не найдена.')
+        self.check_object_permissions(request, job)
+
+        return Response(JobSerializer(job).data)
@@ -3,7 +3,9 @@ Ticket admin configuration.
 """
 from django.contrib import admin
 
-from .models import Ticket
+from core.pagination import EstimatedCountPaginator
+
+from .models import Ticket, TicketEscalation
 
 
 @admin.register(Ticket)
@@ -20,7 +22,25 @@ class TicketAdmin(admin.ModelAdmin):
         'created_at',
     ]
     list_filter = ['status', 'priority', 'created_at']
-    search_fields = ['title', 'description', 'created_by__email']
+    list_select_related = ['created_by', 'assigned_to']
+    # Prefix title and exact author email, both backed by UPPER() indexes
+    search_fields = ['^title', '=created_by__email']
+    search_help_text = 'Начало заголовка или точный email автора'
     readonly_fields = ['id', 'created_at', 'updated_at', 'completed_at']
-    raw_id_fields = ['created_by', 'assigned_to', 'assigned_by']
+    raw_id_fields = ['created_by', 'assigned_to', 'assigned_by', 'possible_duplicates']
+    ordering = ['-created_at']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+@admin.register(TicketEscalation)
+class TicketEscalationAdmin(admin.ModelAdmin):
+    """Admin configuration for TicketEscalation model."""
+
+    list_display = ['ticket', 'status', 'from_priority', 'to_priority', 'created_at']
+    list_filter = ['status', 'to_priority', 'created_at']
+    list_select_related = ['ticket']
+    raw_id_fields = ['ticket']
     ordering = ['-created_at']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
@@ -5,3 +5,8 @@ class TicketsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.tickets'
     verbose_name = 'Заявки'
+
+    def ready(self) -> None:
+        # Register metrics before the first /metrics scrape and keep user
+        # snapshots on tickets in sync with user changes
+        from . import metrics, signals  # noqa: F401
@@ -0,0 +1,136 @@
+"""
+Bulk loading of tickets with PostgreSQL COPY.
+
+Rows are streamed with COPY FROM STDIN into an unlogged staging table
+shaped like tickets_ticket and merged into it with a single
+INSERT ... SELECT per batch, skipping tickets that already exist. Nothing
+goes through the ORM, signals or services: no webhook events, metrics or
+duplicate links are produced for imported tickets.
+"""
+import io
+import json
+
+from django.db import connection, transaction
+
+from .models import Ticket
+
+STAGING_TABLE = 'tickets_ticket_import'
+
+COLUMNS = [
+    'id',
+    'title',
+    'description',
+    'status',
+    'priority',
+    'priority_rank',
+    'created_by_id',
+    'assigned_to_id',
+    'assigned_by_id',
+    'created_by_snapshot',
+    'assigned_to_snapshot',
+    'created_at',
+    'updated_at',
+    'completed_at',
+]
+
+# Escapes of COPY text format
+COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+class TicketCopyLoader:
+    """Loads batches of ticket rows through a staging table."""
+
+    def __init__(self) -> None:
+        self.table = Ticket._meta.db_table
+
+    def prepare(self) -> None:
+        """Create the staging table if needed and empty it."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE UNLOGGED TABLE IF NOT EXISTS {STAGING_TABLE} '
+                f'(LIKE {self.table} INCLUDING DEFAULTS)'
+            )
+            cursor.execute(f'TRUNCATE {STAGING_TABLE}')
+
+    def load(self, rows: list[dict]) -> int:
+        """
+        Copy a batch of rows into the staging table and merge it.
+
+        Args:
+            rows: Rows keyed by COLUMNS
+
+        Returns:
+            Number of tickets inserted (existing IDs are skipped)
+        """
+        if not rows:
+            return 0
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write('\t'.join(_copy_value(row.get(column)) for column in COLUMNS))
+            buffer.write('\n')
+        buffer.seek(0)
+
+        columns = ', '.join(COLUMNS)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.copy_expert(
+                f'COPY {STAGING_TABLE} ({columns}) FROM STDIN',
+                buffer,
+            )
+            cursor.execute(
+                f'INSERT INTO {self.table} ({columns}) '
+                f'SELECT {columns} FROM {STAGING_TABLE} '
+                f'ON CONFLICT (id) DO NOTHING'
+            )
+            inserted = cursor.rowcount
+            cursor.execute(f'TRUNCATE {STAGING_TABLE}')
+        return inserted
+
+    def drop_staging(self) -> None:
+        """Drop the staging table."""
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {STAGING_TABLE}')
+
+    def secondary_indexes(self) -> list[tuple[str, str]]:
+        """Return (name, definition) of the non-unique ticket indexes not backing constraints."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT i.indexname, i.indexdef
+                FROM pg_indexes i
+                WHERE i.schemaname = current_schema() AND i.tablename = %s
+                  AND i.indexdef NOT LIKE 'CREATE UNIQUE INDEX%%'
+                  AND NOT EXISTS (
+                      SELECT 1 FROM pg_constraint c
+                      WHERE c.conindid = (quote_ident(i.schemaname) || '.' || quote_ident(i.indexname))::regclass
+                  )
+                ORDER BY i.indexname
+                """,
+                [self.table],
+            )
+            return cursor.fetchall()
+
+    def drop_indexes(self, indexes: list[tuple[str, str]]) -> None:
+        """Drop indexes before loading."""
+        with connection.cursor() as cursor:
+            for name, _ in indexes:
+                cursor.execute(f'DROP INDEX IF EXISTS {connection.ops.quote_name(name)}')
+
+    def create_indexes(self, indexes: list[tuple[str, str]], on_progress=None) -> None:
+        """Recreate dropped indexes and refresh planner statistics."""
+        with connection.cursor() as cursor:
+            for name, definition in indexes:
+                cursor.execute(definition.replace('CREATE INDEX ', 'CREATE INDEX IF NOT EXISTS ', 1))
+                if on_progress:
+                    on_progress(name)
+            cursor.execute(f'ANALYZE {self.table}')
+
+
+def _copy_value(value) -> str:
+    """Format a value for COPY in text format."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, dict):
+        value = json.dumps(value, ensure_ascii=False)
+    elif hasattr(value, 'isoformat'):
+        value = value.isoformat()
+    return str(value).translate(COPY_ESCAPES)
@@ -0,0 +1,27 @@
+"""
+Ticket detail cache location and invalidation.
+
+Kept apart from detail_cache, which renders details with the serializers,
+so services of other apps can drop entries without importing them.
+
+Every cached detail is tagged with the ticket's current cache version.
+Invalidation deletes the version, so a detail rendered before a change
+and stored after it never matches the version readers see next.
+"""
+from uuid import UUID
+
+from django.core.cache import caches
+
+TICKET_DETAIL_CACHE = 'shared'
+TICKET_DETAIL_CACHE_KEY = 'tickets:detail:{}'
+TICKET_DETAIL_VERSION_KEY = 'tickets:detail-version:{}'
+
+
+def invalidate_ticket_detail(ticket_id: UUID) -> None:
+    """Drop the cached detail of a changed ticket."""
+    caches[TICKET_DETAIL_CACHE].delete(TICKET_DETAIL_VERSION_KEY.format(ticket_id))
+
+
+def invalidate_ticket_details(ticket_ids: list[UUID]) -> None:
+    """Drop the cached details of tickets changed in bulk."""
+    caches[TICKET_DETAIL_CACHE].delete_many([TICKET_DETAIL_VERSION_KEY.format(ticket_id) for ticket_id in ticket_ids])
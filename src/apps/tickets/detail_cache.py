@@ -0,0 +1,117 @@
+"""
+Cache of rendered ticket details.
+
+Each entry holds the JSON bytes of TicketDetailSerializer, an ETag hashed
+from those bytes and the users its visibility depends on, so a repeat
+open costs one cache round trip and no serialization. Entries live in the
+shared Redis cache, so transition services drop an entry for every worker
+once their transaction commits. Name changes of the ticket's users don't
+touch the ticket and show up after TICKETS_DETAIL_CACHE_TTL seconds.
+"""
+import hashlib
+from dataclasses import dataclass
+from uuid import UUID, uuid4
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.utils.http import parse_etags
+from rest_framework.renderers import JSONRenderer
+
+from apps.users.models import UserRole
+
+from .cache import (
+    TICKET_DETAIL_CACHE,
+    TICKET_DETAIL_CACHE_KEY,
+    TICKET_DETAIL_VERSION_KEY,
+)
+from .models import Ticket
+from .selectors import get_ticket_by_id
+from .serializers import TicketDetailSerializer
+
+User = get_user_model()
+
+
+@dataclass(frozen=True)
+class CachedTicketDetail:
+    """Rendered ticket detail with its ETag, owners and cache version."""
+
+    body: bytes
+    etag: str
+    created_by_id: int
+    assigned_to_id: int | None
+    version: str | None
+
+    @classmethod
+    def build(cls, ticket: Ticket, version: str | None) -> 'CachedTicketDetail':
+        """Render a ticket loaded with its users."""
+        body = JSONRenderer().render(TicketDetailSerializer(ticket).data)
+        return cls(
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            created_by_id=ticket.created_by_id,
+            assigned_to_id=ticket.assigned_to_id,
+            version=version,
+        )
+
+    def is_visible_to(self, user: User) -> bool:
+        """Check visibility by the same rules as get_visible_tickets()."""
+        if user.role == UserRole.OPERATOR:
+            return True
+        if user.role == UserRole.EXECUTOR:
+            return self.assigned_to_id == user.id
+        return self.created_by_id == user.id
+
+    def is_matched_by(self, if_none_match: str) -> bool:
+        """
+        Check an If-None-Match header against the ETag.
+
+        The header is a comma-separated list of entity tags or "*", compared
+        weakly as RFC 9110 requires for If-None-Match.
+        """
+        etags = parse_etags(if_none_match)
+        if '*' in etags:
+            return True
+        return _opaque_tag(self.etag) in {_opaque_tag(etag) for etag in etags}
+
+
+def _opaque_tag(etag: str) -> str:
+    """Strip the weakness indicator from an entity tag."""
+    return etag.removeprefix('W/')
+
+
+def get_ticket_detail(ticket_id: UUID) -> CachedTicketDetail | None:
+    """
+    Get the rendered detail of a ticket, rendering and caching it on a miss.
+
+    The version is read before the ticket is loaded, so a render that
+    races with an invalidation is stored under the dropped version and
+    never served.
+
+    Args:
+        ticket_id: Ticket's UUID
+
+    Returns:
+        Cached detail or None if the ticket doesn't exist
+    """
+    cache = caches[TICKET_DETAIL_CACHE]
+    key = TICKET_DETAIL_CACHE_KEY.format(ticket_id)
+    version_key = TICKET_DETAIL_VERSION_KEY.format(ticket_id)
+    cached = cache.get_many([version_key, key])
+    version = cached.get(version_key)
+    detail = cached.get(key)
+    if version is not None and detail is not None and detail.version == version:
+        return detail
+
+    if version is None:
+        cache.add(version_key, uuid4().hex, settings.TICKETS_DETAIL_CACHE_TTL)
+        version = cache.get(version_key)
+    ticket = get_ticket_by_id(ticket_id)
+    if ticket is None:
+        return None
+    detail = CachedTicketDetail.build(ticket, version)
+    # Not stored if invalidated again before the version was read back
+    if version is not None:
+        cache.set(key, detail, settings.TICKETS_DETAIL_CACHE_TTL)
+    return detail
+
@@ -0,0 +1,144 @@
+"""
+Set-based escalation of stale tickets (PostgreSQL).
+
+A batch is one statement: a CTE picks up to batch_size stale tickets of a
+status with a range scan over the (status, created_at) or
+(status, updated_at) index and locks them with FOR UPDATE SKIP LOCKED,
+an UPDATE raises their priority one step and stamps escalated_at, and an
+INSERT ... SELECT over its RETURNING rows writes one TicketEscalation per
+ticket. Runners on several nodes skip each other's locked rows, and a row
+escalated by a concurrent runner no longer matches once re-checked, so
+every ticket is escalated once per SLA period. Tickets already at high
+priority are left alone.
+
+Successive batches continue after the last (timestamp, id) of the previous
+one, so rows that stay in the index range (escalated new tickets, high
+priority ones, rows locked by other runners) are scanned once per run.
+"""
+from datetime import datetime
+from uuid import UUID
+
+from django.db import connection
+
+from .models import (
+    PRIORITY_RANK,
+    Ticket,
+    TicketEscalation,
+    TicketPriority,
+    TicketStatus,
+)
+
+# Priority after one escalation step; high priority tickets aren't escalated
+ESCALATED_PRIORITY = {
+    TicketPriority.LOW: TicketPriority.MEDIUM,
+    TicketPriority.MEDIUM: TicketPriority.HIGH,
+}
+
+# Timestamp a ticket's staleness is measured from, per status
+STALE_SINCE = {
+    TicketStatus.NEW: 'created_at',
+    TicketStatus.IN_PROGRESS: 'updated_at',
+}
+
+# Ticket columns returned for each escalated ticket
+RETURNED_COLUMNS = [
+    'id',
+    'title',
+    'status',
+    'priority',
+    'created_by_id',
+    'assigned_to_id',
+    'assigned_by_id',
+    'updated_at',
+    'completed_at',
+]
+
+
+def escalate_batch(
+    *,
+    status: str,
+    cutoff: datetime,
+    now: datetime,
+    batch_size: int,
+    after: tuple[datetime, UUID] | None = None,
+) -> list[dict]:
+    """
+    Escalate up to batch_size tickets stuck in a status since before the cutoff.
+
+    Tickets escalated after the cutoff are skipped, so a ticket is escalated
+    again only if it stays stale for another SLA period. Must be called
+    inside a transaction; the rows stay locked until it ends.
+
+    Args:
+        status: Ticket status, a key of STALE_SINCE
+        cutoff: Tickets stale since before this moment are escalated
+        now: Escalation time
+        batch_size: Maximum number of tickets to escalate
+        after: Cursor of the previous batch; only tickets after it are scanned
+
+    Returns:
+        Escalated tickets as dicts of RETURNED_COLUMNS plus from_priority and
+        stale_since, the timestamp the batch was ordered by
+    """
+    table = Ticket._meta.db_table
+    stale_since = STALE_SINCE[status]
+    priority_case = ' '.join(
+        f"WHEN '{current}' THEN '{escalated}'" for current, escalated in ESCALATED_PRIORITY.items()
+    )
+    rank_case = ' '.join(
+        f"WHEN '{current}' THEN {PRIORITY_RANK[escalated]}" for current, escalated in ESCALATED_PRIORITY.items()
+    )
+    returned = ', '.join(f't.{column}' for column in RETURNED_COLUMNS)
+    params = {
+        'status': status,
+        'priorities': list(ESCALATED_PRIORITY),
+        'cutoff': cutoff,
+        'now': now,
+        'batch_size': batch_size,
+    }
+    after_cursor = ''
+    if after is not None:
+        # The plain bound keeps the index range scan; the row comparison
+        # breaks ties on the ID
+        after_cursor = (
+            f'AND {stale_since} >= %(after_since)s '
+            f'AND ({stale_since}, id) > (%(after_since)s, %(after_id)s)'
+        )
+        params['after_since'], params['after_id'] = after
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            WITH stale AS (
+                SELECT id, priority AS from_priority, {stale_since} AS stale_since
+                FROM {table}
+                WHERE status = %(status)s
+                  AND {stale_since} < %(cutoff)s
+                  {after_cursor}
+                  AND priority = ANY(%(priorities)s)
+                  AND (escalated_at IS NULL OR escalated_at < %(cutoff)s)
+                ORDER BY {stale_since}, id
+                LIMIT %(batch_size)s
+                FOR UPDATE SKIP LOCKED
+            ),
+            escalated AS (
+                UPDATE {table} t
+                SET priority = CASE t.priority {priority_case} END,
+                    priority_rank = CASE t.priority {rank_case} END,
+                    escalated_at = %(now)s,
+                    updated_at = %(now)s
+                FROM stale
+                WHERE t.id = stale.id
+                RETURNING {returned}, stale.from_priority, stale.stale_since
+            ),
+            recorded AS (
+                INSERT INTO {TicketEscalation._meta.db_table}
+                    (ticket_id, status, from_priority, to_priority, created_at)
+                SELECT id, status, from_priority, priority, %(now)s FROM escalated
+            )
+            SELECT * FROM escalated
+            """,
+            params,
+        )
+        columns = [column.name for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
@@ -2,16 +2,45 @@
 Ticket filters for API.
 """
 import django_filters
+from django.db.models import QuerySet
 
-from .models import Ticket, TicketPriority, TicketStatus
+from .models import PRIORITY_RANK, Ticket, TicketPriority, TicketStatus
+
+# Allowed list orderings; each is an index scan (forwards or backwards)
+# over one of the (…, priority_rank, created_at) or (…, created_at) indexes,
+# except the priority orderings of the list of all tickets
+TICKET_ORDERINGS = {
+    '-created_at': ['-created_at'],
+    'created_at': ['created_at'],
+    'priority': ['priority_rank', 'created_at'],
+    '-priority': ['-priority_rank', '-created_at'],
+}
 
 
 class TicketFilter(django_filters.FilterSet):
     """Filter for tickets."""
 
     status = django_filters.ChoiceFilter(choices=TicketStatus.choices)
-    priority = django_filters.ChoiceFilter(choices=TicketPriority.choices)
+    priority = django_filters.ChoiceFilter(choices=TicketPriority.choices, method='filter_priority')
+    ordering = django_filters.ChoiceFilter(
+        choices=[
+            ('-created_at', 'Сначала новые'),
+            ('created_at', 'Сначала старые'),
+            ('priority', 'Сначала срочные, затем старые'),
+            ('-priority', 'Сначала несрочные, затем новые'),
+        ],
+        method='filter_ordering',
+        label='Сортировка',
+    )
 
     class Meta:
         model = Ticket
         fields = ['status', 'priority']
+
+    def filter_priority(self, queryset: QuerySet[Ticket], name: str, value: str) -> QuerySet[Ticket]:
+        """Filter by the rank column, which leads the ordering indexes."""
+        return queryset.filter(priority_rank=PRIORITY_RANK[value])
+
+    def filter_ordering(self, queryset: QuerySet[Ticket], name: str, value: str) -> QuerySet[Ticket]:
+        """Apply one of the whitelisted orderings."""
+        return queryset.order_by(*TICKET_ORDERINGS[value])
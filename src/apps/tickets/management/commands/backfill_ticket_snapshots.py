@@ -0,0 +1,39 @@
+"""
+Management command to fill user snapshots of existing tickets.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.tickets.services import backfill_ticket_snapshots
+
+
+class Command(BaseCommand):
+    """Copy creator and assignee display fields to tickets in batches."""
+
+    help = (
+        'Fills created_by_snapshot and assigned_to_snapshot of all tickets in '
+        'batches. Run before enabling TICKETS_USER_SNAPSHOTS'
+    )
+
+    def add_arguments(self, parser) -> None:
+        """Register command arguments."""
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--after', help='Resume after this ticket ID')
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=0.0,
+            help='Seconds to sleep between batches to reduce load',
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Execute the command."""
+        started = time.monotonic()
+        total = 0
+        for last_id, count in backfill_ticket_snapshots(batch_size=options['batch_size'], after=options['after']):
+            total += count
+            self.stdout.write(f'{total} tickets, last {last_id} ({time.monotonic() - started:.1f}s)')
+            if options['pause']:
+                time.sleep(options['pause'])
+        self.stdout.write(self.style.SUCCESS(f'Filled snapshots of {total} tickets'))
@@ -0,0 +1,159 @@
+"""
+Management command to benchmark admin changelists on seeded data.
+"""
+import random
+import statistics
+import time
+import uuid
+from datetime import timedelta
+
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.core.paginator import Paginator
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.tickets.admin import TicketAdmin
+from apps.tickets.models import Ticket, TicketPriority, TicketStatus
+from apps.users.admin import UserAdmin
+from apps.users.models import UserRole
+
+User = get_user_model()
+
+
+class LegacyTicketAdmin(TicketAdmin):
+    """Ticket changelist as configured before the admin tuning."""
+
+    list_select_related = False
+    search_fields = ['title', 'description', 'created_by__email']
+    paginator = Paginator
+    show_full_result_count = True
+
+
+class LegacyUserAdmin(UserAdmin):
+    """User changelist as configured before the admin tuning."""
+
+    search_fields = ['email', 'first_name', 'last_name']
+    paginator = Paginator
+    show_full_result_count = True
+
+
+class Command(BaseCommand):
+    """Seed tickets and users and time the admin changelists."""
+
+    help = (
+        'Seeds tickets and users on PostgreSQL and compares changelist '
+        'response time and queries of the legacy and tuned admin'
+    )
+
+    def add_arguments(self, parser) -> None:
+        """Register command arguments."""
+        parser.add_argument('--tickets', type=int, default=1_000_000)
+        parser.add_argument('--users', type=int, default=10_000)
+        parser.add_argument('--batch-size', type=int, default=10_000)
+        parser.add_argument('--repeat', type=int, default=3, help='Requests per scenario')
+        parser.add_argument('--keep', action='store_true', help='Do not delete benchmark data')
+
+    def handle(self, *args, **options) -> None:
+        """Execute the command."""
+        if connection.vendor != 'postgresql':
+            raise CommandError('The benchmark requires PostgreSQL')
+
+        run_id = uuid.uuid4().hex[:8]
+        superuser = User.objects.create_superuser(f'bench-{run_id}-admin@bench.local', password=None)
+        try:
+            users = self._seed_users(run_id, options)
+            self._seed_tickets(run_id, users, options)
+            with connection.cursor() as cursor:
+                cursor.execute(f'ANALYZE {Ticket._meta.db_table}')
+                cursor.execute(f'ANALYZE {User._meta.db_table}')
+
+            sample_email = users[0].email
+            today = timezone.localdate()
+            scenarios = [
+                ('tickets', {}),
+                ('tickets', {'status__exact': TicketStatus.NEW}),
+                ('tickets', {
+                    'created_at__gte': str(today - timedelta(days=30)),
+                    'created_at__lt': str(today + timedelta(days=1)),
+                }),
+                ('tickets', {'q': f'bench {run_id} #42'}),
+                ('tickets', {'q': sample_email}),
+                ('tickets', {'p': '500'}),
+                ('users', {}),
+                ('users', {'q': f'bench-{run_id}-user-1'}),
+            ]
+            admins = {
+                'tickets': (Ticket, LegacyTicketAdmin, TicketAdmin),
+                'users': (User, LegacyUserAdmin, UserAdmin),
+            }
+
+            self.stdout.write(f'{"changelist":<45} {"legacy":>20} {"tuned":>20}')
+            for name, params in scenarios:
+                model, legacy_class, tuned_class = admins[name]
+                legacy = self._measure(legacy_class(model, admin.site), params, superuser, options['repeat'])
+                tuned = self._measure(tuned_class(model, admin.site), params, superuser, options['repeat'])
+                label = f'{name} ' + '&'.join(f'{key}={value}' for key, value in params.items())
+                self.stdout.write(f'{label[:45]:<45} {legacy:>20} {tuned:>20}')
+        finally:
+            if not options['keep']:
+                Ticket.objects.filter(title__startswith=f'bench {run_id} ').delete()
+                User.objects.filter(email__startswith=f'bench-{run_id}-').delete()
+
+    def _seed_users(self, run_id: str, options: dict) -> list:
+        """Create benchmark users of every role."""
+        roles = list(UserRole.values)
+        users = []
+        for start in range(0, options['users'], options['batch_size']):
+            stop = min(start + options['batch_size'], options['users'])
+            users += User.objects.bulk_create([
+                User(email=f'bench-{run_id}-user-{n}@bench.local', role=roles[n % len(roles)], password='!')
+                for n in range(start, stop)
+            ])
+        return users
+
+    def _seed_tickets(self, run_id: str, users: list, options: dict) -> None:
+        """Create benchmark tickets spread over the last years."""
+        rng = random.Random(run_id)
+        statuses = list(TicketStatus.values)
+        priorities = list(TicketPriority.values)
+        started = time.monotonic()
+
+        for start in range(0, options['tickets'], options['batch_size']):
+            stop = min(start + options['batch_size'], options['tickets'])
+            Ticket.objects.bulk_create([
+                Ticket(
+                    title=f'bench {run_id} #{n}',
+                    description='benchmark',
+                    status=rng.choice(statuses),
+                    priority=rng.choice(priorities),
+                    created_by=rng.choice(users),
+                )
+                for n in range(start, stop)
+            ])
+            self.stdout.write(f'Seeded {stop} tickets', ending='\r')
+
+        # created_at is auto_now_add, so spread the dates after the insert
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {Ticket._meta.db_table} "
+                f"SET created_at = now() - random() * interval '5 years' "
+                f"WHERE title LIKE %s",
+                [f'bench {run_id} #%'],
+            )
+        self.stdout.write(f'Seeded {options["tickets"]} tickets in {time.monotonic() - started:.1f}s')
+
+    def _measure(self, model_admin: admin.ModelAdmin, params: dict, user, repeat: int) -> str:
+        """Render a changelist several times and summarize time and queries."""
+        timings = []
+        for _ in range(repeat):
+            request = RequestFactory().get('/admin/', params)
+            request.user = user
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                model_admin.changelist_view(request).render()
+                timings.append(time.perf_counter() - started)
+        return f'{statistics.median(timings) * 1000:.0f}ms/{len(queries)}q'
@@ -0,0 +1,133 @@
+"""
+Management command to benchmark ticket lists with and without user joins.
+"""
+import random
+import statistics
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.tickets.models import Ticket, TicketPriority, TicketStatus
+from apps.tickets.selectors import get_all_tickets
+from apps.tickets.views import AssignedTicketsView, MyTicketsView, TicketListCreateView
+from apps.users.models import UserRole
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """Seed tickets and compare joined and snapshot-based list endpoints."""
+
+    help = (
+        'Compares response time, queries and (on PostgreSQL) query plans of '
+        'ticket lists rendered with user joins and from ticket snapshots'
+    )
+
+    def add_arguments(self, parser) -> None:
+        """Register command arguments."""
+        parser.add_argument('--tickets', type=int, default=100_000)
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--batch-size', type=int, default=10_000)
+        parser.add_argument('--page-size', type=int, default=100)
+        parser.add_argument('--repeat', type=int, default=20, help='Requests per scenario')
+        parser.add_argument('--keep', action='store_true', help='Do not delete benchmark data')
+
+    def handle(self, *args, **options) -> None:
+        """Execute the command."""
+        run_id = uuid.uuid4().hex[:8]
+        try:
+            users = self._seed(run_id, options)
+            operator = next(user for user in users if user.role == UserRole.OPERATOR)
+            executor = next(user for user in users if user.role == UserRole.EXECUTOR)
+            applicant = next(user for user in users if user.role == UserRole.APPLICANT)
+            scenarios = [
+                ('all tickets', TicketListCreateView, operator, {}),
+                ('all tickets, status=new', TicketListCreateView, operator, {'status': TicketStatus.NEW}),
+                ('my tickets', MyTicketsView, applicant, {}),
+                ('assigned tickets', AssignedTicketsView, executor, {}),
+            ]
+
+            self.stdout.write(f'{"list":<30} {"joined":>16} {"snapshots":>16}')
+            for label, view, user, params in scenarios:
+                params = {'page_size': options['page_size'], **params}
+                results = []
+                for snapshots in (False, True):
+                    with override_settings(TICKETS_USER_SNAPSHOTS=snapshots):
+                        results.append(self._measure(view, user, params, options['repeat']))
+                self.stdout.write(f'{label:<30} {results[0]:>16} {results[1]:>16}')
+
+            if connection.vendor == 'postgresql':
+                for snapshots in (False, True):
+                    with override_settings(TICKETS_USER_SNAPSHOTS=snapshots):
+                        queryset = get_all_tickets().order_by('-created_at')[:options['page_size']]
+                        self.stdout.write(f'\n{"snapshots" if snapshots else "joined"}:')
+                        self.stdout.write(queryset.explain(analyze=True, buffers=True))
+        finally:
+            if not options['keep']:
+                Ticket.objects.filter(title__startswith=f'bench {run_id} ').delete()
+                User.objects.filter(email__startswith=f'bench-{run_id}-').delete()
+
+    def _seed(self, run_id: str, options: dict) -> list:
+        """Create benchmark users and tickets with filled snapshots."""
+        roles = list(UserRole.values)
+        users = User.objects.bulk_create([
+            User(
+                email=f'bench-{run_id}-user-{n}@bench.local',
+                first_name='Bench',
+                last_name=f'User {n}',
+                role=roles[n % len(roles)],
+                password='!',
+            )
+            for n in range(max(options['users'], len(roles)))
+        ])
+        executors = [user for user in users if user.role == UserRole.EXECUTOR]
+        rng = random.Random(run_id)
+        statuses = list(TicketStatus.values)
+        priorities = list(TicketPriority.values)
+        started = time.monotonic()
+
+        for start in range(0, options['tickets'], options['batch_size']):
+            stop = min(start + options['batch_size'], options['tickets'])
+            tickets = []
+            for n in range(start, stop):
+                creator = rng.choice(users)
+                executor = rng.choice(executors) if rng.random() < 0.7 else None
+                tickets.append(Ticket(
+                    title=f'bench {run_id} #{n}',
+                    description='benchmark',
+                    status=rng.choice(statuses),
+                    priority=rng.choice(priorities),
+                    created_by=creator,
+                    created_by_snapshot=creator.snapshot,
+                    assigned_to=executor,
+                    assigned_to_snapshot=executor.snapshot if executor else None,
+                ))
+            Ticket.objects.bulk_create(tickets)
+            self.stdout.write(f'Seeded {stop} tickets', ending='\r')
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(f'ANALYZE {Ticket._meta.db_table}')
+                cursor.execute(f'ANALYZE {User._meta.db_table}')
+        self.stdout.write(f'Seeded {options["tickets"]} tickets in {time.monotonic() - started:.1f}s')
+        return users
+
+    def _measure(self, view, user, params: dict, repeat: int) -> str:
+        """Request a list several times and summarize time and queries."""
+        factory = APIRequestFactory()
+        timings = []
+        for _ in range(repeat):
+            request = factory.get('/api/tickets/', params)
+            force_authenticate(request, user=user)
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = view.as_view(throttle_classes=[])(request)
+                response.render()
+                timings.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                raise RuntimeError(f'{view.__name__} returned {response.status_code}')
+        return f'{statistics.median(timings) * 1000:.1f}ms/{len(queries)}q'
@@ -0,0 +1,222 @@
+"""
+Management command to benchmark concurrent ticket transitions.
+"""
+import multiprocessing
+import random
+import statistics
+import time
+import uuid
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection, connections
+
+from apps.tickets.models import Ticket, TicketStatus
+from apps.tickets.services import assign_ticket, complete_ticket, reject_ticket
+from apps.users.models import UserRole
+from core.exceptions import ApplicationError
+
+User = get_user_model()
+
+DEADLOCK_DETECTED = '40P01'
+ALLOWED_SEQUENCES = {
+    ('assign',),
+    ('assign', 'complete'),
+    ('assign', 'reject'),
+}
+
+
+def _run_actor(role: str, actor_id: int, ticket_ids: list, executor_ids: list, deadline: float) -> dict:
+    """
+    Call transition services on random tickets until the deadline.
+
+    Returns stats and the log of successful transitions of one operator or
+    executor. Runs in a thread or in a forked process.
+    """
+    rng = random.Random(actor_id)
+    actor = User.objects.get(id=actor_id)
+    lock_waits = []
+    stats = Counter()
+    log = []
+
+    def measure_lock_waits(execute, sql, params, many, context):
+        if 'FOR UPDATE' not in sql:
+            return execute(sql, params, many, context)
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            lock_waits.append(time.perf_counter() - started)
+
+    try:
+        with connection.execute_wrapper(measure_lock_waits):
+            while time.monotonic() < deadline:
+                ticket_id = rng.choice(ticket_ids)
+                if role == UserRole.OPERATOR:
+                    action, executor_id = 'assign', rng.choice(executor_ids)
+                else:
+                    action, executor_id = rng.choice(['complete', 'reject']), actor_id
+
+                try:
+                    if action == 'assign':
+                        assign_ticket(ticket_id=ticket_id, executor_id=executor_id, assigned_by=actor)
+                    elif action == 'complete':
+                        complete_ticket(ticket_id=ticket_id, executor=actor)
+                    else:
+                        reject_ticket(ticket_id=ticket_id, executor=actor)
+                except ApplicationError:
+                    stats['rejected_by_rules'] += 1
+                    continue
+                except OperationalError as exc:
+                    if getattr(exc.__cause__, 'pgcode', None) == DEADLOCK_DETECTED:
+                        stats['deadlocks'] += 1
+                    else:
+                        stats['db_errors'] += 1
+                    continue
+
+                stats[action] += 1
+                log.append((time.monotonic(), str(ticket_id), action, executor_id))
+    finally:
+        connection.close()
+
+    return {'stats': stats, 'log': log, 'lock_waits': lock_waits}
+
+
+def _run_actor_star(args: tuple) -> dict:
+    """Unpack arguments for multiprocessing.Pool.map()."""
+    return _run_actor(*args)
+
+
+class Command(BaseCommand):
+    """Run concurrent operators and executors against a shared ticket pool."""
+
+    help = (
+        'Benchmarks assign/complete/reject under contention on PostgreSQL and '
+        'checks that no ticket was assigned twice or went through illegal statuses'
+    )
+
+    def add_arguments(self, parser) -> None:
+        """Register command arguments."""
+        parser.add_argument('--tickets', type=int, default=200)
+        parser.add_argument('--operators', type=int, default=4)
+        parser.add_argument('--executors', type=int, default=8)
+        parser.add_argument('--duration', type=float, default=10.0, help='Seconds to run')
+        parser.add_argument('--mode', choices=['threads', 'processes'], default='threads')
+        parser.add_argument('--keep', action='store_true', help='Do not delete benchmark data')
+
+    def handle(self, *args, **options) -> None:
+        """Execute the command."""
+        if connection.vendor != 'postgresql':
+            raise CommandError('The benchmark requires PostgreSQL')
+
+        run_id = uuid.uuid4().hex[:8]
+        applicant, operators, executors, ticket_ids = self._seed(run_id, options)
+        deadlocks_before = self._server_deadlocks()
+
+        deadline = time.monotonic() + options['duration']
+        actors = (
+            [(UserRole.OPERATOR, user.id, ticket_ids, [e.id for e in executors], deadline) for user in operators] +
+            [(UserRole.EXECUTOR, user.id, ticket_ids, [], deadline) for user in executors]
+        )
+        self.stdout.write(
+            f'Run {run_id}: {len(operators)} operators, {len(executors)} executors, '
+            f'{len(ticket_ids)} tickets, {options["mode"]}'
+        )
+
+        started = time.monotonic()
+        if options['mode'] == 'processes':
+            connections.close_all()
+            with multiprocessing.get_context('fork').Pool(len(actors)) as pool:
+                results = pool.map(_run_actor_star, actors)
+        else:
+            with ThreadPoolExecutor(max_workers=len(actors)) as pool:
+                results = list(pool.map(_run_actor_star, actors))
+        elapsed = time.monotonic() - started
+
+        try:
+            self._report(results, elapsed, self._server_deadlocks() - deadlocks_before)
+            violations = self._check_invariants(results, ticket_ids)
+        finally:
+            if not options['keep']:
+                Ticket.objects.filter(id__in=ticket_ids).delete()
+                User.objects.filter(id__in=[applicant.id] + [u.id for u in operators + executors]).delete()
+
+        if violations:
+            for violation in violations[:20]:
+                self.stderr.write(self.style.ERROR(violation))
+            raise CommandError(f'{len(violations)} invariant violations')
+        self.stdout.write(self.style.SUCCESS('Invariants hold'))
+
+    def _seed(self, run_id: str, options: dict) -> tuple:
+        """Create benchmark users and a pool of new tickets."""
+        def make_users(role: str, count: int) -> list:
+            return User.objects.bulk_create([
+                User(email=f'bench-{run_id}-{role}-{n}@bench.local', role=role, password='!')
+                for n in range(count)
+            ])
+
+        applicant = make_users(UserRole.APPLICANT, 1)[0]
+        operators = make_users(UserRole.OPERATOR, options['operators'])
+        executors = make_users(UserRole.EXECUTOR, options['executors'])
+        tickets = Ticket.objects.bulk_create([
+            Ticket(title=f'bench {run_id} #{n}', description='benchmark', created_by=applicant)
+            for n in range(options['tickets'])
+        ])
+        return applicant, operators, executors, [ticket.id for ticket in tickets]
+
+    def _server_deadlocks(self) -> int:
+        """Return the deadlock counter of the current database."""
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT deadlocks FROM pg_stat_database WHERE datname = current_database()')
+            return cursor.fetchone()[0]
+
+    def _report(self, results: list[dict], elapsed: float, server_deadlocks: int) -> None:
+        """Print throughput, lock wait and error statistics."""
+        stats = sum((result['stats'] for result in results), Counter())
+        lock_waits = sorted(wait for result in results for wait in result['lock_waits'])
+        transitions = stats['assign'] + stats['complete'] + stats['reject']
+
+        self.stdout.write(f'Transitions: {transitions} in {elapsed:.1f}s ({transitions / elapsed:.1f}/s)')
+        self.stdout.write(
+            f'  assign={stats["assign"]} complete={stats["complete"]} reject={stats["reject"]} '
+            f'rejected_by_rules={stats["rejected_by_rules"]} db_errors={stats["db_errors"]}'
+        )
+        if lock_waits:
+            self.stdout.write(
+                f'Row lock acquisition: mean={statistics.fmean(lock_waits) * 1000:.2f}ms '
+                f'p95={lock_waits[int(len(lock_waits) * 0.95)] * 1000:.2f}ms '
+                f'max={lock_waits[-1] * 1000:.2f}ms over {len(lock_waits)} locks'
+            )
+        self.stdout.write(f'Deadlocks: {stats["deadlocks"]} caught, {server_deadlocks} reported by server')
+
+    def _check_invariants(self, results: list[dict], ticket_ids: list) -> list[str]:
+        """Compare the transition log with the rules and the final ticket state."""
+        sequences = defaultdict(list)
+        for _, ticket_id, action, executor_id in sorted(entry for r in results for entry in r['log']):
+            sequences[ticket_id].append((action, executor_id))
+
+        violations = []
+        tickets = {str(ticket.id): ticket for ticket in Ticket.objects.filter(id__in=ticket_ids)}
+        for ticket_id, ticket in tickets.items():
+            sequence = sequences.get(ticket_id, [])
+            actions = tuple(action for action, _ in sequence)
+            if actions.count('assign') > 1:
+                violations.append(f'{ticket_id}: assigned {actions.count("assign")} times')
+            elif actions and actions not in ALLOWED_SEQUENCES:
+                violations.append(f'{ticket_id}: illegal sequence {" -> ".join(actions)}')
+            elif len(actions) == 2 and sequence[1][1] != sequence[0][1]:
+                violations.append(f'{ticket_id}: closed by executor that was not assigned')
+
+            expected = {
+                (): TicketStatus.NEW,
+                ('assign',): TicketStatus.IN_PROGRESS,
+                ('assign', 'complete'): TicketStatus.COMPLETED,
+                ('assign', 'reject'): TicketStatus.REJECTED,
+            }.get(actions)
+            if expected and ticket.status != expected:
+                violations.append(f'{ticket_id}: status {ticket.status}, log implies {expected}')
+            if actions and ticket.assigned_to_id != sequence[0][1]:
+                violations.append(f'{ticket_id}: assigned_to does not match the successful assignment')
+        return violations
@@ -0,0 +1,37 @@
+"""
+Management command to escalate tickets stuck past their SLA.
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.tickets.services import escalate_stale_tickets
+
+
+class Command(BaseCommand):
+    """Raise the priority of stale new and in-progress tickets in batches."""
+
+    help = (
+        'Escalates tickets that stay new or in progress past their SLA; run periodically, '
+        'e.g. from cron, on any number of nodes. Requires PostgreSQL'
+    )
+
+    def add_arguments(self, parser) -> None:
+        """Register command arguments."""
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            help='Tickets per transaction (default: TICKETS_ESCALATION_BATCH_SIZE)',
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Execute the command."""
+        if connection.vendor != 'postgresql':
+            raise CommandError('Escalation requires PostgreSQL')
+
+        escalated = escalate_stale_tickets(
+            batch_size=options['batch_size'],
+            on_progress=lambda status, done: self.stdout.write(f'{status}: {done} escalated'),
+        )
+        self.stdout.write(self.style.SUCCESS(
+            'Escalation completed: ' + ', '.join(f'{count} {status}' for status, count in escalated.items())
+        ))
@@ -0,0 +1,275 @@
+"""
+Management command to bulk import historical tickets from CSV or JSONL.
+"""
+import csv
+import itertools
+import json
+import time
+import uuid
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.tickets.bulk_import import TicketCopyLoader
+from apps.tickets.models import PRIORITY_RANK, Ticket, TicketPriority, TicketStatus
+from core.ids import uuid7_at
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """Stream tickets into PostgreSQL with COPY through a staging table."""
+
+    help = (
+        'Imports tickets from a CSV or JSONL file with COPY FROM STDIN. Progress is '
+        'saved in a checkpoint file, so an interrupted import resumes where it stopped. '
+        'Requires PostgreSQL'
+    )
+
+    def add_arguments(self, parser) -> None:
+        """Register command arguments."""
+        parser.add_argument('path', help='Path to a .csv or .jsonl file')
+        parser.add_argument(
+            '--format',
+            choices=['csv', 'jsonl'],
+            help='Input format (detected from the file extension by default)',
+        )
+        parser.add_argument('--batch-size', type=int, default=50_000)
+        parser.add_argument(
+            '--checkpoint',
+            help='Checkpoint file (default: <path>.checkpoint)',
+        )
+        parser.add_argument(
+            '--defer-indexes',
+            action='store_true',
+            help='Drop secondary ticket indexes during the load and recreate them at the end',
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Execute the command."""
+        if connection.vendor != 'postgresql':
+            raise CommandError('The import requires PostgreSQL')
+
+        path = Path(options['path'])
+        if not path.exists():
+            raise CommandError(f'File {path} does not exist')
+        input_format = options['format'] or path.suffix.lstrip('.').lower()
+        if input_format not in ('csv', 'jsonl'):
+            raise CommandError('Cannot detect input format, use --format')
+
+        checkpoint_path = Path(options['checkpoint'] or f'{path}.checkpoint')
+        checkpoint = self._read_checkpoint(checkpoint_path, path)
+        self._write_checkpoint(checkpoint_path, checkpoint)
+        if checkpoint['rows']:
+            self.stdout.write(f'Resuming after row {checkpoint["rows"]}')
+
+        users = self._load_users()
+        self.stdout.write(f'Loaded {len(users)} users')
+
+        loader = TicketCopyLoader()
+        loader.prepare()
+        if options['defer_indexes'] and checkpoint['indexes'] is None:
+            checkpoint['indexes'] = loader.secondary_indexes()
+            self._write_checkpoint(checkpoint_path, checkpoint)
+            loader.drop_indexes(checkpoint['indexes'])
+            self.stdout.write(f'Dropped {len(checkpoint["indexes"])} indexes')
+
+        started = time.monotonic()
+        read = 0
+        rows = itertools.islice(self._read_rows(path, input_format), checkpoint['rows'], None)
+        tickets = self._convert_rows(
+            rows,
+            users,
+            path.name,
+            checkpoint['rows'] + 1,
+            datetime.fromisoformat(checkpoint['default_created_at']),
+        )
+        for batch, last_row, rejected in self._batches(tickets, options['batch_size']):
+            checkpoint['imported'] += loader.load(batch)
+            checkpoint['skipped'] += rejected
+            read += last_row - checkpoint['rows']
+            checkpoint['rows'] = last_row
+            self._write_checkpoint(checkpoint_path, checkpoint)
+            elapsed = time.monotonic() - started
+            self.stdout.write(
+                f'Row {checkpoint["rows"]}: {checkpoint["imported"]} imported, '
+                f'{checkpoint["skipped"]} skipped ({read / elapsed:.0f} rows/s)'
+            )
+
+        if checkpoint['indexes']:
+            index_started = time.monotonic()
+            loader.create_indexes(
+                checkpoint['indexes'],
+                on_progress=lambda name: self.stdout.write(
+                    f'Created index {name} ({time.monotonic() - index_started:.1f}s)'
+                ),
+            )
+        loader.drop_staging()
+        checkpoint_path.unlink(missing_ok=True)
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Tickets import completed: {checkpoint["imported"]} imported, '
+            f'{checkpoint["skipped"]} skipped in {elapsed:.1f}s'
+        ))
+
+    def _read_checkpoint(self, checkpoint_path: Path, path: Path) -> dict:
+        """
+        Load the saved progress of this file or start from scratch.
+
+        Rows without created_at get the file's modification time, kept in
+        the checkpoint, so their IDs are the same when the import resumes.
+        """
+        if checkpoint_path.exists():
+            checkpoint = json.loads(checkpoint_path.read_text())
+            if checkpoint.get('source') != str(path.resolve()):
+                raise CommandError(f'Checkpoint {checkpoint_path} belongs to {checkpoint.get("source")}')
+        else:
+            checkpoint = {'source': str(path.resolve()), 'rows': 0, 'imported': 0, 'skipped': 0, 'indexes': None}
+        checkpoint.setdefault(
+            'default_created_at',
+            datetime.fromtimestamp(path.stat().st_mtime, tz=UTC).isoformat(),
+        )
+        return checkpoint
+
+    def _write_checkpoint(self, checkpoint_path: Path, checkpoint: dict) -> None:
+        """Atomically save the progress."""
+        temporary = checkpoint_path.with_suffix('.tmp')
+        temporary.write_text(json.dumps(checkpoint))
+        temporary.replace(checkpoint_path)
+
+    def _load_users(self) -> dict[str, dict]:
+        """Map lowercase emails to user IDs and display snapshots."""
+        users = {}
+        for user in User.objects.only('id', 'email', 'first_name', 'last_name').iterator(chunk_size=10_000):
+            users[user.email.lower()] = user.snapshot
+        return users
+
+    def _read_rows(self, path: Path, input_format: str) -> Iterator[dict]:
+        """Yield raw rows from the input file."""
+        with path.open(encoding='utf-8', newline='') as input_file:
+            if input_format == 'csv':
+                yield from csv.DictReader(input_file)
+                return
+
+            for line_number, line in enumerate(input_file, start=1):
+                if not line.strip():
+                    yield {}
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as exc:
+                    raise CommandError(f'Line {line_number}: invalid JSON ({exc})') from exc
+
+    def _convert_rows(
+        self,
+        rows: Iterator[dict],
+        users: dict[str, dict],
+        source: str,
+        first_number: int,
+        default_created_at: datetime,
+    ) -> Iterator[tuple[dict | None, int, bool]]:
+        """Yield (ticket row or None, row number, whether the row was rejected) per input row."""
+        warnings = 0
+        for number, row in enumerate(rows, start=first_number):
+            if not row:
+                yield None, number, False
+                continue
+            try:
+                ticket = self._convert_row(row, users, source, number, default_created_at)
+            except ValueError as exc:
+                if warnings < 100:
+                    self.stdout.write(self.style.WARNING(f'Row {number}: {exc}, skipping'))
+                    warnings += 1
+                yield None, number, True
+            else:
+                yield ticket, number, False
+
+    def _convert_row(
+        self,
+        row: dict,
+        users: dict[str, dict],
+        source: str,
+        number: int,
+        default_created_at: datetime,
+    ) -> dict:
+        """Validate a row and resolve its users."""
+        title = (row.get('title') or '').strip()
+        if not title:
+            raise ValueError('empty title')
+
+        creator = users.get((row.get('created_by') or '').strip().lower())
+        if creator is None:
+            raise ValueError(f'unknown creator {row.get("created_by")!r}')
+        assignee = self._optional_user(row, 'assigned_to', users)
+        assigner = self._optional_user(row, 'assigned_by', users)
+
+        status = row.get('status') or TicketStatus.NEW
+        if status not in TicketStatus.values:
+            raise ValueError(f'unknown status {status!r}')
+        priority = row.get('priority') or TicketPriority.MEDIUM
+        if priority not in TicketPriority.values:
+            raise ValueError(f'unknown priority {priority!r}')
+
+        created_at = self._datetime(row, 'created_at') or default_created_at
+        ticket_id = row.get('id') or uuid7_at(created_at, f'{source}:{number}')
+        return {
+            'id': uuid.UUID(str(ticket_id)),
+            'title': title[:Ticket._meta.get_field('title').max_length],
+            'description': row.get('description') or '',
+            'status': status,
+            'priority': priority,
+            'priority_rank': PRIORITY_RANK[priority],
+            'created_by_id': creator['id'],
+            'assigned_to_id': assignee and assignee['id'],
+            'assigned_by_id': assigner and assigner['id'],
+            'created_by_snapshot': creator,
+            'assigned_to_snapshot': assignee,
+            'created_at': created_at,
+            'updated_at': self._datetime(row, 'updated_at') or created_at,
+            'completed_at': self._datetime(row, 'completed_at'),
+        }
+
+    def _optional_user(self, row: dict, field: str, users: dict[str, dict]) -> dict | None:
+        """Resolve an optional user email."""
+        email = (row.get(field) or '').strip().lower()
+        if not email:
+            return None
+        if email not in users:
+            raise ValueError(f'unknown {field} {email!r}')
+        return users[email]
+
+    def _datetime(self, row: dict, field: str):
+        """Parse an optional ISO 8601 timestamp, assuming the current timezone if naive."""
+        value = row.get(field)
+        if not value:
+            return None
+        parsed = parse_datetime(value)
+        if parsed is None:
+            raise ValueError(f'invalid {field} {value!r}')
+        return timezone.make_aware(parsed) if timezone.is_naive(parsed) else parsed
+
+    def _batches(
+        self,
+        tickets: Iterator[tuple[dict | None, int, bool]],
+        batch_size: int,
+    ) -> Iterator[tuple[list[dict], int, int]]:
+        """Group converted rows into (tickets, number of the last input row, rejected rows)."""
+        batch = []
+        rejected = 0
+        last_row = None
+        for ticket, last_row, is_rejected in tickets:
+            if ticket is not None:
+                batch.append(ticket)
+            rejected += is_rejected
+            if len(batch) >= batch_size:
+                yield batch, last_row, rejected
+                batch, rejected, last_row = [], 0, None
+        if last_row is not None:
+            yield batch, last_row, rejected
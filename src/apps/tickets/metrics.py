@@ -0,0 +1,16 @@
+"""
+Ticket metrics.
+"""
+from core.metrics import Counter
+
+TICKET_TRANSITIONS = Counter(
+    'helpdesk_ticket_transitions_total',
+    'Committed ticket status transitions',
+    labelnames=['from_status', 'to_status', 'priority'],
+)
+
+TICKET_ESCALATIONS = Counter(
+    'helpdesk_ticket_escalations_total',
+    'Committed escalations of stale tickets',
+    labelnames=['status', 'priority'],
+)
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-19 18:37
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['created_at'], name='tickets_tic_created_5dd600_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['status', 'created_at'], name='tickets_tic_status_8acd21_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('title', models.TextField())), name='text_pattern_ops'), name='tickets_title_upper_like_idx'),
+        ),
+    ]
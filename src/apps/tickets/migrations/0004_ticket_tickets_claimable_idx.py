@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-19 18:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0003_ticket_tickets_tic_created_5dd600_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(condition=models.Q(('status', 'new')), fields=['priority', 'created_at'], name='tickets_claimable_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-19 18:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0004_ticket_tickets_claimable_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='assigned_to_snapshot',
+            field=models.JSONField(blank=True, editable=False, null=True, verbose_name='Снимок исполнителя'),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='created_by_snapshot',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Снимок автора'),
+        ),
+    ]
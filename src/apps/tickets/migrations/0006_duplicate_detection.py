@@ -0,0 +1,40 @@
+# Generated by Django 4.2.30 on 2026-10-19 18:56
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0005_ticket_assigned_to_snapshot_and_more'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='ticket',
+            name='description_bands',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, editable=False, null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='description_minhash',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, editable=False, null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='possible_duplicates',
+            field=models.ManyToManyField(blank=True, related_name='duplicated_by', to='tickets.ticket', verbose_name='Возможные дубликаты'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='tickets_title_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['description_bands'], name='tickets_description_bands_idx'),
+        ),
+    ]
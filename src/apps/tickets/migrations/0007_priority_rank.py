@@ -0,0 +1,60 @@
+# Generated by Django 4.2.30 on 2026-10-19 18:59
+
+import apps.tickets.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0006_duplicate_detection'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='ticket',
+            name='tickets_claimable_idx',
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='priority_rank',
+            field=apps.tickets.models.PriorityRankField(default=1, editable=False, verbose_name='Ранг приоритета'),
+        ),
+        # Backfill before the indexes are built
+        migrations.RunSQL(
+            sql="""
+                UPDATE tickets_ticket
+                SET priority_rank = CASE priority WHEN 'high' THEN 0 WHEN 'medium' THEN 1 ELSE 2 END
+                WHERE priority <> 'medium'
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['priority_rank', 'created_at'], name='tickets_tic_priorit_1fa9bc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['status', 'priority_rank', 'created_at'], name='tickets_tic_status_8387e9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['created_by', 'created_at'], name='tickets_tic_created_2ba4e0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['created_by', 'priority_rank', 'created_at'], name='tickets_tic_created_6239b2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['assigned_to', 'created_at'], name='tickets_tic_assigne_d4efda_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['assigned_to', 'priority_rank', 'created_at'], name='tickets_tic_assigne_abe63e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(condition=models.Q(('status', 'new')), fields=['priority_rank', 'created_at'], name='tickets_claimable_rank_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-19 19:02
+
+import core.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0007_priority_rank'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='ticket',
+            name='id',
+            field=models.UUIDField(default=core.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.30 on 2026-10-19 19:13
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0008_ticket_id_uuid7'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketEscalation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('new', 'Новая'), ('in_progress', 'В работе'), ('completed', 'Выполнена'), ('rejected', 'Отклонена')], max_length=20, verbose_name='Статус заявки')),
+                ('from_priority', models.CharField(choices=[('low', 'Низкий'), ('medium', 'Средний'), ('high', 'Высокий')], max_length=20, verbose_name='Прежний приоритет')),
+                ('to_priority', models.CharField(choices=[('low', 'Низкий'), ('medium', 'Средний'), ('high', 'Высокий')], max_length=20, verbose_name='Новый приоритет')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Дата эскалации')),
+            ],
+            options={
+                'verbose_name': 'Эскалация заявки',
+                'verbose_name_plural': 'Эскалации заявок',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='escalated_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Дата эскалации'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['status', 'updated_at'], name='tickets_tic_status_72bae8_idx'),
+        ),
+        migrations.AddField(
+            model_name='ticketescalation',
+            name='ticket',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='escalations', to='tickets.ticket', verbose_name='Заявка'),
+        ),
+        migrations.AddIndex(
+            model_name='ticketescalation',
+            index=models.Index(fields=['created_at'], name='tickets_tic_created_a262d4_idx'),
+        ),
+    ]
@@ -0,0 +1,83 @@
+"""
+MinHash signatures of ticket descriptions for near-duplicate lookup.
+
+A description is reduced to its set of word trigrams; the signature keeps,
+for each of SIGNATURE_SIZE hash functions, the minimum hash over the set,
+so the share of equal positions in two signatures estimates the Jaccard
+similarity of the sets. The signature is split into bands (locality
+sensitive hashing): descriptions sharing any band hash are candidates,
+which a GIN index on the band array finds without scanning the table.
+"""
+import hashlib
+import random
+import re
+
+SIGNATURE_SIZE = 64
+BANDS = 16
+ROWS_PER_BAND = SIGNATURE_SIZE // BANDS
+SHINGLE_SIZE = 3
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_rng = random.Random(0x7E57)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(SIGNATURE_SIZE)
+]
+WORD_RE = re.compile(r'\w+')
+
+
+def _shingles(text: str) -> set[int]:
+    """Hash the word trigrams of a text to 32-bit integers."""
+    words = WORD_RE.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        words = words and [' '.join(words)]
+        size = 1
+    else:
+        size = SHINGLE_SIZE
+    return {
+        int.from_bytes(hashlib.blake2b(' '.join(words[i:i + size]).encode(), digest_size=4).digest(), 'little')
+        for i in range(len(words) - size + 1)
+    }
+
+
+def minhash_signature(text: str) -> list[int] | None:
+    """
+    Compute the MinHash signature of a text.
+
+    Args:
+        text: Text to sign
+
+    Returns:
+        List of SIGNATURE_SIZE integers, or None if the text has no words
+    """
+    shingles = _shingles(text)
+    if not shingles:
+        return None
+    return [
+        min((a * shingle + b) % _MERSENNE_PRIME for shingle in shingles) & _MAX_HASH
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def lsh_bands(signature: list[int]) -> list[int]:
+    """
+    Hash each band of a signature to a signed 64-bit integer.
+
+    Args:
+        signature: MinHash signature
+
+    Returns:
+        List of BANDS band hashes, tagged with the band number
+    """
+    bands = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]
+        digest = hashlib.blake2b(repr((band, rows)).encode(), digest_size=8).digest()
+        bands.append(int.from_bytes(digest, 'little', signed=True))
+    return bands
+
+
+def estimate_similarity(first: list[int], second: list[int]) -> float:
+    """Estimate the Jaccard similarity of two signed texts."""
+    return sum(a == b for a, b in zip(first, second)) / SIGNATURE_SIZE
@@ -1,10 +1,14 @@
 """
 Ticket models.
 """
-import uuid
-
 from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Cast, Upper
+from django.utils import timezone
+
+from core.ids import uuid7
 
 
 class TicketStatus(models.TextChoices):
@@ -22,35 +26,63 @@ class TicketPriority(models.TextChoices):
     HIGH = 'high', 'Высокий'
 
 
+# Sort key of priorities: more urgent first
+PRIORITY_RANK = {
+    TicketPriority.HIGH: 0,
+    TicketPriority.MEDIUM: 1,
+    TicketPriority.LOW: 2,
+}
+
+
+class PriorityRankField(models.PositiveSmallIntegerField):
+    """Rank of the ticket's priority, computed from it whenever the row is written."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        kwargs.setdefault('editable', False)
+        kwargs.setdefault('default', PRIORITY_RANK[TicketPriority.MEDIUM])
+        super().__init__(*args, **kwargs)
+
+    def pre_save(self, model_instance: models.Model, add: bool) -> int:
+        """Derive the rank from the priority, also for bulk_create()."""
+        value = PRIORITY_RANK[model_instance.priority]
+        setattr(model_instance, self.attname, value)
+        return value
+
+
 class Ticket(models.Model):
     """Helpdesk ticket model."""
 
+    # Time-ordered, so inserts append to the primary key index
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
     )
     title = models.CharField('Заголовок', max_length=255)
     description = models.TextField('Описание')
+    # status leads composite indexes (see Meta) and priority is filtered
+    # and sorted by priority_rank, so neither gets a single-column index
     status = models.CharField(
         'Статус',
         max_length=20,
         choices=TicketStatus.choices,
         default=TicketStatus.NEW,
-        db_index=True,
     )
     priority = models.CharField(
         'Приоритет',
         max_length=20,
         choices=TicketPriority.choices,
         default=TicketPriority.MEDIUM,
-        db_index=True,
     )
+    priority_rank = PriorityRankField('Ранг приоритета')
+    # created_by and assigned_to lead composite indexes (see Meta), so they
+    # don't get single-column ones
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
         related_name='created_tickets',
         verbose_name='Создал',
+        db_index=False,
     )
     assigned_to = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -59,6 +91,7 @@ class Ticket(models.Model):
         verbose_name='Исполнитель',
         null=True,
         blank=True,
+        db_index=False,
     )
     assigned_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -68,19 +101,90 @@ class Ticket(models.Model):
         null=True,
         blank=True,
     )
+    # Display copies of created_by and assigned_to (id, email, full_name)
+    # so lists can be rendered without joining users
+    created_by_snapshot = models.JSONField('Снимок автора', default=dict, blank=True, editable=False)
+    assigned_to_snapshot = models.JSONField('Снимок исполнителя', null=True, blank=True, editable=False)
+    possible_duplicates = models.ManyToManyField(
+        'self',
+        symmetrical=False,
+        related_name='duplicated_by',
+        verbose_name='Возможные дубликаты',
+        blank=True,
+    )
+    # MinHash signature of the description and its LSH band hashes
+    # (apps.tickets.minhash), filled when TICKETS_DUPLICATE_MINHASH is on
+    description_minhash = ArrayField(models.BigIntegerField(), null=True, blank=True, editable=False)
+    description_bands = ArrayField(models.BigIntegerField(), null=True, blank=True, editable=False)
     created_at = models.DateTimeField('Дата создания', auto_now_add=True)
     updated_at = models.DateTimeField('Дата обновления', auto_now=True)
     completed_at = models.DateTimeField('Дата завершения', null=True, blank=True)
+    escalated_at = models.DateTimeField('Дата эскалации', null=True, blank=True, editable=False)
 
     class Meta:
         verbose_name = 'Заявка'
         verbose_name_plural = 'Заявки'
         ordering = ['-created_at']
+        # Every index is written on each insert and on each update that
+        # changes an indexed column (updated_at always does), so only
+        # indexes some query scans are kept.
         indexes = [
-            models.Index(fields=['status', 'priority']),
-            models.Index(fields=['created_by', 'status']),
+            # Backs the open ticket counts of get_executors_with_workload()
             models.Index(fields=['assigned_to', 'status']),
+            models.Index(fields=['created_at']),
+            models.Index(fields=['status', 'created_at']),
+            # Backs escalation of tickets stuck in progress
+            models.Index(fields=['status', 'updated_at']),
+            # Back list orderings (TICKET_ORDERINGS) with an index scan, read
+            # forwards or backwards, for each list's filter; the unfiltered
+            # priority ordering sorts, new tickets use the claim index
+            models.Index(fields=['status', 'priority_rank', 'created_at']),
+            models.Index(fields=['created_by', 'created_at']),
+            models.Index(fields=['created_by', 'priority_rank', 'created_at']),
+            models.Index(fields=['assigned_to', 'created_at']),
+            models.Index(fields=['assigned_to', 'priority_rank', 'created_at']),
+            # Backs claim_ticket(): most urgent, oldest new ticket
+            models.Index(
+                fields=['priority_rank', 'created_at'],
+                condition=models.Q(status=TicketStatus.NEW),
+                name='tickets_claimable_rank_idx',
+            ),
+            # Backs case-insensitive prefix title search in the admin
+            models.Index(
+                OpClass(Upper(Cast('title', models.TextField())), name='text_pattern_ops'),
+                name='tickets_title_upper_like_idx',
+            ),
+            # Back duplicate lookup: title similarity (pg_trgm `%`) and
+            # shared description bands (`&&`)
+            GinIndex(fields=['title'], opclasses=['gin_trgm_ops'], name='tickets_title_trgm_idx'),
+            GinIndex(fields=['description_bands'], name='tickets_description_bands_idx'),
         ]
 
     def __str__(self) -> str:
         return f'{self.title} ({self.get_status_display()})'
+
+
+class TicketEscalation(models.Model):
+    """Record of a stale ticket escalated by apps.tickets.escalation."""
+
+    ticket = models.ForeignKey(
+        Ticket,
+        on_delete=models.CASCADE,
+        related_name='escalations',
+        verbose_name='Заявка',
+    )
+    status = models.CharField('Статус заявки', max_length=20, choices=TicketStatus.choices)
+    from_priority = models.CharField('Прежний приоритет', max_length=20, choices=TicketPriority.choices)
+    to_priority = models.CharField('Новый приоритет', max_length=20, choices=TicketPriority.choices)
+    created_at = models.DateTimeField('Дата эскалации', default=timezone.now)
+
+    class Meta:
+        verbose_name = 'Эскалация заявки'
+        verbose_name_plural = 'Эскалации заявок'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at']),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.ticket_id}: {self.from_priority} → {self.to_priority}'
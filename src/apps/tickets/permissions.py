@@ -62,6 +62,19 @@ class CanViewAssignedTickets(BasePermission):
         )
 
 
+class CanClaimTicket(BasePermission):
+    """Permission for claiming new tickets (executor only)."""
+
+    message = 'Только исполнители могут брать заявки в работу.'
+
+    def has_permission(self, request: Request, view: APIView) -> bool:
+        """Check if user can claim tickets."""
+        return (
+            request.user.is_authenticated and
+            request.user.role == UserRole.EXECUTOR
+        )
+
+
 class CanCompleteOrRejectTicket(BasePermission):
     """Permission for completing or rejecting tickets (executor only)."""
 
@@ -76,7 +89,7 @@ class CanCompleteOrRejectTicket(BasePermission):
 
     def has_object_permission(self, request: Request, view: APIView, obj: Ticket) -> bool:
         """Check if user is assigned to this ticket."""
-        return obj.assigned_to == request.user
+        return obj.assigned_to_id == request.user.id
 
 
 class CanViewOwnTickets(BasePermission):
@@ -1,28 +1,56 @@
 """
 Ticket database query selectors.
 """
+from datetime import timedelta
 from uuid import UUID
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import QuerySet
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connection
+from django.db.models import Q, QuerySet
+from django.utils import timezone
 
-from .models import Ticket
+from apps.users.models import UserRole
+from core.identity_map import get_identity_map
+
+from .minhash import estimate_similarity
+from .models import PRIORITY_RANK, Ticket, TicketStatus
 
 User = get_user_model()
 
 
-def get_all_tickets() -> QuerySet[Ticket]:
+LIST_FIELDS = [
+    'id', 'title', 'status', 'priority', 'priority_rank', 'created_at',
+    'created_by_snapshot', 'assigned_to_snapshot',
+]
+
+
+def _list_queryset() -> QuerySet[Ticket]:
     """
-    Get all tickets with related users.
+    Get the base queryset of ticket lists.
 
-    Returns:
-        QuerySet of all tickets with optimized queries
+    With TICKETS_USER_SNAPSHOTS enabled, users are rendered from the
+    snapshots stored on tickets and only the list columns are read from
+    the tickets table, without joining users.
     """
+    if settings.TICKETS_USER_SNAPSHOTS:
+        return Ticket.objects.only(*LIST_FIELDS)
     return Ticket.objects.select_related(
         'created_by',
         'assigned_to',
         'assigned_by',
-    ).all()
+    )
+
+
+def get_all_tickets() -> QuerySet[Ticket]:
+    """
+    Get all tickets with related users.
+
+    Returns:
+        QuerySet of all tickets with optimized queries
+    """
+    return _list_queryset()
 
 
 def get_tickets_by_creator(user: User) -> QuerySet[Ticket]:
@@ -35,11 +63,7 @@ def get_tickets_by_creator(user: User) -> QuerySet[Ticket]:
     Returns:
         QuerySet of tickets created by the user
     """
-    return Ticket.objects.select_related(
-        'created_by',
-        'assigned_to',
-        'assigned_by',
-    ).filter(created_by=user)
+    return _list_queryset().filter(created_by=user)
 
 
 def get_tickets_assigned_to(user: User) -> QuerySet[Ticket]:
@@ -52,25 +76,190 @@ def get_tickets_assigned_to(user: User) -> QuerySet[Ticket]:
     Returns:
         QuerySet of tickets assigned to the user
     """
-    return Ticket.objects.select_related(
-        'created_by',
-        'assigned_to',
-        'assigned_by',
-    ).filter(assigned_to=user)
+    return _list_queryset().filter(assigned_to=user)
+
+
+def _filter_visible(tickets: QuerySet[Ticket], user: User) -> QuerySet[Ticket]:
+    """Restrict a ticket queryset to the tickets the user is allowed to see."""
+    if user.role == UserRole.OPERATOR:
+        return tickets
+    if user.role == UserRole.EXECUTOR:
+        return tickets.filter(assigned_to=user)
+    return tickets.filter(created_by=user)
+
+
+def get_visible_tickets(user: User) -> QuerySet[Ticket]:
+    """
+    Get tickets the user is allowed to see.
+
+    Operators see all tickets, executors the tickets assigned to them and
+    applicants the tickets they created.
+
+    Args:
+        user: Current user
+
+    Returns:
+        QuerySet of visible tickets
+    """
+    return _filter_visible(Ticket.objects.all(), user)
+
+
+def get_visible_tickets_by_ids(user: User, ticket_ids: list[UUID]) -> list[Ticket]:
+    """
+    Get the visible tickets among the given IDs, in the order of the IDs.
+
+    The tickets are loaded with one primary key lookup (id IN (...)) with
+    the visibility rules of get_visible_tickets() applied in the same
+    query, and with the columns of ticket lists.
+
+    Args:
+        user: Current user
+        ticket_ids: Ticket UUIDs; repeated IDs are returned once
+
+    Returns:
+        Found tickets; missing and invisible IDs are skipped
+    """
+    tickets = _filter_visible(_list_queryset(), user).filter(id__in=ticket_ids).order_by()
+    by_id = {ticket.id: ticket for ticket in tickets}
+    return [by_id[ticket_id] for ticket_id in dict.fromkeys(ticket_ids) if ticket_id in by_id]
 
 
 def get_ticket_by_id(ticket_id: UUID) -> Ticket | None:
     """
     Get ticket by ID with related users.
 
+    The ticket and its users are resolved through the request's identity
+    map, so users already loaded during the request are not fetched again
+    and the rest are loaded in a single query.
+
     Args:
         ticket_id: Ticket's UUID
 
     Returns:
         Ticket instance or None if not found
     """
-    return Ticket.objects.select_related(
-        'created_by',
-        'assigned_to',
-        'assigned_by',
-    ).filter(id=ticket_id).first()
+    ticket = get_identity_map().get(Ticket, ticket_id)
+    if ticket is not None:
+        _attach_users(ticket)
+    return ticket
+
+
+def get_ticket_for_update(ticket_id: UUID) -> Ticket | None:
+    """
+    Get ticket by ID and lock its row until the end of the transaction.
+
+    Concurrent transitions of the same ticket are serialized on this lock,
+    so their status checks always see the latest committed state.
+
+    Args:
+        ticket_id: Ticket's UUID
+
+    Returns:
+        Ticket instance or None if not found
+    """
+    ticket = Ticket.objects.select_for_update().filter(id=ticket_id).first()
+    if ticket is not None:
+        get_identity_map().prime(ticket)
+        _attach_users(ticket)
+    return ticket
+
+
+def get_next_claimable_ticket(priority: str | None = None) -> Ticket | None:
+    """
+    Get the next new ticket to claim and lock its row.
+
+    The most urgent ticket is taken, oldest first. Rows locked by concurrent
+    claims are skipped (FOR UPDATE SKIP LOCKED), so claims never wait for
+    each other; the lookup is a single index scan over the partial index of
+    new tickets by (priority_rank, created_at). Must be called inside a
+    transaction.
+
+    Args:
+        priority: Only consider tickets of this priority
+
+    Returns:
+        Locked ticket instance or None if there is nothing to claim
+    """
+    tickets = Ticket.objects.select_for_update(skip_locked=True).filter(status=TicketStatus.NEW)
+    if priority:
+        tickets = tickets.filter(priority_rank=PRIORITY_RANK[priority])
+    ticket = tickets.order_by('priority_rank', 'created_at').first()
+    if ticket is not None:
+        get_identity_map().prime(ticket)
+        _attach_users(ticket)
+    return ticket
+
+
+def get_possible_duplicates(
+    *,
+    title: str,
+    created_by: User,
+    description_minhash: list[int] | None = None,
+    description_bands: list[int] | None = None,
+) -> list[Ticket]:
+    """
+    Find open tickets that are likely duplicates of a new one.
+
+    Candidates are open tickets of the same creator, or of anyone within
+    TICKETS_DUPLICATE_WINDOW, whose title is similar by trigrams (the
+    pg_trgm `%` operator over a GIN index) or, if a MinHash signature is
+    given, whose description shares an LSH band (`&&` over a GIN index) and
+    has an estimated similarity above the threshold. Must be called inside
+    a transaction. Returns nothing on databases other than PostgreSQL.
+
+    Args:
+        title: Title of the new ticket
+        created_by: Creator of the new ticket
+        description_minhash: MinHash signature of the new ticket's description
+        description_bands: LSH band hashes of that signature
+
+    Returns:
+        Up to TICKETS_DUPLICATE_LIMIT tickets, most similar first
+    """
+    if connection.vendor != 'postgresql':
+        return []
+
+    limit = settings.TICKETS_DUPLICATE_LIMIT
+    since = timezone.now() - timedelta(seconds=settings.TICKETS_DUPLICATE_WINDOW)
+    candidates = Ticket.objects.filter(
+        Q(created_by=created_by) | Q(created_at__gte=since),
+        status__in=[TicketStatus.NEW, TicketStatus.IN_PROGRESS],
+    ).only('id', 'title', 'status', 'created_at', 'description_minhash')
+
+    with connection.cursor() as cursor:
+        # Threshold of the `%` operator for the rest of the transaction
+        cursor.execute(
+            "SELECT set_config('pg_trgm.similarity_threshold', %s, true)",
+            [str(settings.TICKETS_DUPLICATE_TITLE_SIMILARITY)],
+        )
+    by_title = list(
+        candidates.filter(title__trigram_similar=title)
+        .annotate(similarity=TrigramSimilarity('title', title))
+        .order_by('-similarity')[:limit]
+    )
+
+    by_description = []
+    if description_bands:
+        threshold = settings.TICKETS_DUPLICATE_DESCRIPTION_SIMILARITY
+        for ticket in candidates.filter(description_bands__overlap=description_bands)[:limit * 10]:
+            similarity = estimate_similarity(description_minhash, ticket.description_minhash)
+            if similarity >= threshold:
+                ticket.similarity = similarity
+                by_description.append(ticket)
+
+    duplicates = {}
+    for ticket in sorted(by_title + by_description, key=lambda ticket: -ticket.similarity):
+        duplicates.setdefault(ticket.id, ticket)
+    return list(duplicates.values())[:limit]
+
+
+def _attach_users(ticket: Ticket) -> None:
+    """Resolve ticket's related users through the identity map in one query."""
+    users = get_identity_map().get_many(
+        User,
+        [ticket.created_by_id, ticket.assigned_to_id, ticket.assigned_by_id],
+    )
+    for field in ('created_by', 'assigned_to', 'assigned_by'):
+        user_id = getattr(ticket, f'{field}_id')
+        if user_id is not None:
+            setattr(ticket, field, users[user_id])
@@ -1,9 +1,11 @@
 """
 Ticket serializers.
 """
+from django.conf import settings
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
-from apps.users.selectors import get_executors
+from apps.users.selectors import get_active_executor
 from apps.users.serializers import UserShortSerializer
 
 from .models import Ticket, TicketPriority
@@ -48,6 +50,28 @@ class TicketListSerializer(serializers.ModelSerializer):
         ]
 
 
+@extend_schema_field(UserShortSerializer)
+class UserSnapshotField(serializers.JSONField):
+    """User stored on the ticket as a snapshot, shaped like UserShortSerializer."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(read_only=True, **kwargs)
+
+
+class TicketSnapshotListSerializer(TicketListSerializer):
+    """Serializer for ticket list rendering users from ticket snapshots."""
+
+    created_by = UserSnapshotField(source='created_by_snapshot')
+    assigned_to = UserSnapshotField(source='assigned_to_snapshot')
+
+
+def get_list_serializer_class() -> type[TicketListSerializer]:
+    """Return the ticket list serializer matching TICKETS_USER_SNAPSHOTS."""
+    if settings.TICKETS_USER_SNAPSHOTS:
+        return TicketSnapshotListSerializer
+    return TicketListSerializer
+
+
 class TicketDetailSerializer(serializers.ModelSerializer):
     """Serializer for ticket detail."""
 
@@ -76,6 +100,25 @@ class TicketDetailSerializer(serializers.ModelSerializer):
         ]
 
 
+class TicketDuplicateSerializer(serializers.ModelSerializer):
+    """Serializer for a possible duplicate of a ticket."""
+
+    similarity = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = Ticket
+        fields = ['id', 'title', 'status', 'created_at', 'similarity']
+
+
+class TicketCreatedSerializer(TicketDetailSerializer):
+    """Serializer for a created ticket with its possible duplicates."""
+
+    possible_duplicates = TicketDuplicateSerializer(source='duplicate_candidates', many=True, read_only=True)
+
+    class Meta(TicketDetailSerializer.Meta):
+        fields = TicketDetailSerializer.Meta.fields + ['possible_duplicates']
+
+
 class TicketAssignSerializer(serializers.Serializer):
     """Serializer for ticket assignment."""
 
@@ -83,9 +126,31 @@ class TicketAssignSerializer(serializers.Serializer):
 
     def validate_assigned_to(self, value: int) -> int:
         """Validate that assigned_to is an active executor."""
-        executor = get_executors().filter(id=value).first()
-        if not executor:
+        if not get_active_executor(value):
             raise serializers.ValidationError(
                 'Указанный пользователь не является активным исполнителем.'
             )
         return value
+
+
+class TicketBatchGetSerializer(serializers.Serializer):
+    """Serializer for fetching tickets by a list of IDs."""
+
+    ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=settings.TICKETS_BATCH_GET_MAX_IDS,
+    )
+
+
+class TicketBatchResultSerializer(serializers.Serializer):
+    """Serializer for tickets fetched by ID, with IDs that were not found."""
+
+    results = TicketListSerializer(many=True, read_only=True)
+    not_found = serializers.ListField(child=serializers.UUIDField(), read_only=True)
+
+
+class TicketClaimSerializer(serializers.Serializer):
+    """Serializer for claiming the next new ticket."""
+
+    priority = serializers.ChoiceField(choices=TicketPriority.choices, required=False)
@@ -1,12 +1,18 @@
 """
 Ticket business logic services.
 """
+from collections.abc import Callable
+from datetime import timedelta
 from uuid import UUID
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.utils import timezone
 
 from apps.users.selectors import get_user_by_id
+from apps.users.services import invalidate_executors_workload
+from apps.webhooks.services import record_event, record_events
 from core.exceptions import (
     NotFoundError,
     TicketAlreadyAssignedError,
@@ -15,12 +21,80 @@ from core.exceptions import (
     TicketWrongStatusError,
 )
 
+from .cache import invalidate_ticket_detail, invalidate_ticket_details
+from .escalation import RETURNED_COLUMNS, STALE_SINCE, escalate_batch
+from .metrics import TICKET_ESCALATIONS, TICKET_TRANSITIONS
+from .minhash import lsh_bands, minhash_signature
 from .models import Ticket, TicketStatus
-from .selectors import get_ticket_by_id
+from .selectors import (
+    get_next_claimable_ticket,
+    get_possible_duplicates,
+    get_ticket_for_update,
+)
 
 User = get_user_model()
 
 
+def _ticket_event_payload(ticket: Ticket) -> dict:
+    """Build the webhook payload of a ticket."""
+    return {
+        'id': ticket.id,
+        'title': ticket.title,
+        'status': ticket.status,
+        'priority': ticket.priority,
+        'created_by': ticket.created_by_id,
+        'assigned_to': ticket.assigned_to_id,
+        'assigned_by': ticket.assigned_by_id,
+        'updated_at': ticket.updated_at,
+        'completed_at': ticket.completed_at,
+    }
+
+
+def _record_ticket_event(event_type: str, ticket: Ticket) -> None:
+    """Write a ticket change to the webhook outbox."""
+    record_event(
+        event_type=event_type,
+        ticket_id=ticket.id,
+        payload=_ticket_event_payload(ticket),
+    )
+
+
+def _count_transition(from_status: str, ticket: Ticket) -> None:
+    """Count a ticket status transition once the transaction commits."""
+    transaction.on_commit(
+        lambda: TICKET_TRANSITIONS.inc(from_status, ticket.status, ticket.priority)
+    )
+
+
+def _assign(ticket: Ticket, *, executor: User, assigned_by: User) -> None:
+    """
+    Apply the assignment transition to a locked ticket.
+
+    Must be called inside the transaction holding the ticket's row lock.
+
+    Raises:
+        TicketWrongStatusError: If ticket status is not 'new'
+        TicketAlreadyAssignedError: If ticket is already assigned
+    """
+    if ticket.status != TicketStatus.NEW:
+        raise TicketWrongStatusError(
+            'Назначить исполнителя можно только для новых заявок.'
+        )
+
+    if ticket.assigned_to_id is not None:
+        raise TicketAlreadyAssignedError()
+
+    ticket.assigned_to = executor
+    ticket.assigned_to_snapshot = executor.snapshot
+    ticket.assigned_by = assigned_by
+    ticket.status = TicketStatus.IN_PROGRESS
+    ticket.save(update_fields=['assigned_to', 'assigned_to_snapshot', 'assigned_by', 'status', 'updated_at'])
+    _record_ticket_event('ticket.assigned', ticket)
+    _count_transition(TicketStatus.NEW, ticket)
+    transaction.on_commit(lambda: invalidate_ticket_detail(ticket.id))
+    transaction.on_commit(invalidate_executors_workload)
+
+
 def create_ticket(
     *,
     title: str,
@@ -31,6 +105,10 @@ def create_ticket(
     """
     Create a new ticket.
 
+    Likely duplicates among open tickets are looked up and linked to the new
+    ticket as possible_duplicates; they are also available on the returned
+    instance as duplicate_candidates.
+
     Args:
         title: Ticket title
         description: Ticket description
@@ -40,12 +118,35 @@ def create_ticket(
     Returns:
         Created ticket instance
     """
-    return Ticket.objects.create(
-        title=title,
-        description=description,
-        priority=priority,
-        created_by=created_by,
-    )
+    signature = minhash_signature(description) if settings.TICKETS_DUPLICATE_MINHASH else None
+    bands = lsh_bands(signature) if signature else None
+
+    with transaction.atomic():
+        duplicates = []
+        if settings.TICKETS_DUPLICATE_DETECTION:
+            duplicates = get_possible_duplicates(
+                title=title,
+                created_by=created_by,
+                description_minhash=signature,
+                description_bands=bands,
+            )
+
+        ticket = Ticket.objects.create(
+            title=title,
+            description=description,
+            priority=priority,
+            created_by=created_by,
+            created_by_snapshot=created_by.snapshot,
+            description_minhash=signature,
+            description_bands=bands,
+        )
+        if duplicates:
+            ticket.possible_duplicates.set(duplicates)
+        ticket.duplicate_candidates = duplicates
+        _record_ticket_event('ticket.created', ticket)
+        _count_transition('none', ticket)
+
+    return ticket
 
 
 def assign_ticket(
@@ -70,26 +171,48 @@ def assign_ticket(
         TicketAlreadyAssignedError: If ticket is already assigned
         TicketWrongStatusError: If ticket status is not 'new'
     """
-    ticket = get_ticket_by_id(ticket_id)
-    if not ticket:
-        raise NotFoundError('Заявка не найдена.')
+    with transaction.atomic():
+        ticket = get_ticket_for_update(ticket_id)
+        if not ticket:
+            raise NotFoundError('Заявка не найдена.')
 
-    if ticket.status != TicketStatus.NEW:
-        raise TicketWrongStatusError(
-            'Назначить исполнителя можно только для новых заявок.'
-        )
+        executor = get_user_by_id(executor_id)
+        if not executor:
+            raise NotFoundError('Исполнитель не найден.')
 
-    if ticket.assigned_to:
-        raise TicketAlreadyAssignedError()
+        _assign(ticket, executor=executor, assigned_by=assigned_by)
 
-    executor = get_user_by_id(executor_id)
-    if not executor:
-        raise NotFoundError('Исполнитель не найден.')
+    return ticket
 
-    ticket.assigned_to = executor
-    ticket.assigned_by = assigned_by
-    ticket.status = TicketStatus.IN_PROGRESS
-    ticket.save(update_fields=['assigned_to', 'assigned_by', 'status', 'updated_at'])
+
+def claim_ticket(
+    *,
+    executor: User,
+    priority: str | None = None,
+) -> Ticket:
+    """
+    Assign the next new ticket to the executor taking it.
+
+    The highest-priority, oldest new ticket not locked by a concurrent
+    claim is taken, so any number of executors can claim at once without
+    waiting for each other or taking the same ticket.
+
+    Args:
+        executor: Executor claiming a ticket
+        priority: Only claim tickets of this priority
+
+    Returns:
+        Claimed ticket instance
+
+    Raises:
+        NotFoundError: If there is no ticket to claim
+    """
+    with transaction.atomic():
+        ticket = get_next_claimable_ticket(priority)
+        if not ticket:
+            raise NotFoundError('Нет новых заявок для назначения.')
+
+        _assign(ticket, executor=executor, assigned_by=executor)
 
     return ticket
 
@@ -115,24 +238,29 @@ def complete_ticket(
         TicketNotYoursError: If ticket is not assigned to the executor
         TicketWrongStatusError: If ticket status is not 'in_progress'
     """
-    ticket = get_ticket_by_id(ticket_id)
-    if not ticket:
-        raise NotFoundError('Заявка не найдена.')
-
-    if not ticket.assigned_to:
-        raise TicketNotAssignedError()
-
-    if ticket.assigned_to != executor:
-        raise TicketNotYoursError()
-
-    if ticket.status != TicketStatus.IN_PROGRESS:
-        raise TicketWrongStatusError(
-            'Завершить можно только заявки в статусе "В работе".'
-        )
-
-    ticket.status = TicketStatus.COMPLETED
-    ticket.completed_at = timezone.now()
-    ticket.save(update_fields=['status', 'completed_at', 'updated_at'])
+    with transaction.atomic():
+        ticket = get_ticket_for_update(ticket_id)
+        if not ticket:
+            raise NotFoundError('Заявка не найдена.')
+
+        if ticket.assigned_to_id is None:
+            raise TicketNotAssignedError()
+
+        if ticket.assigned_to_id != executor.id:
+            raise TicketNotYoursError()
+
+        if ticket.status != TicketStatus.IN_PROGRESS:
+            raise TicketWrongStatusError(
+                'Завершить можно только заявки в статусе "В работе".'
+            )
+
+        ticket.status = TicketStatus.COMPLETED
+        ticket.completed_at = timezone.now()
+        ticket.save(update_fields=['status', 'completed_at', 'updated_at'])
+        _record_ticket_event('ticket.completed', ticket)
+        _count_transition(TicketStatus.IN_PROGRESS, ticket)
+        transaction.on_commit(lambda: invalidate_ticket_detail(ticket.id))
+        transaction.on_commit(invalidate_executors_workload)
 
     return ticket
 
@@ -158,23 +286,164 @@ def reject_ticket(
         TicketNotYoursError: If ticket is not assigned to the executor
         TicketWrongStatusError: If ticket status is not 'in_progress'
     """
-    ticket = get_ticket_by_id(ticket_id)
-    if not ticket:
-        raise NotFoundError('Заявка не найдена.')
+    with transaction.atomic():
+        ticket = get_ticket_for_update(ticket_id)
+        if not ticket:
+            raise NotFoundError('Заявка не найдена.')
+
+        if ticket.assigned_to_id is None:
+            raise TicketNotAssignedError()
+
+        if ticket.assigned_to_id != executor.id:
+            raise TicketNotYoursError()
+
+        if ticket.status != TicketStatus.IN_PROGRESS:
+            raise TicketWrongStatusError(
+                'Отклонить можно только заявки в статусе "В работе".'
+            )
+
+        ticket.status = TicketStatus.REJECTED
+        ticket.completed_at = timezone.now()
+        ticket.save(update_fields=['status', 'completed_at', 'updated_at'])
+        _record_ticket_event('ticket.rejected', ticket)
+        _count_transition(TicketStatus.IN_PROGRESS, ticket)
+        transaction.on_commit(lambda: invalidate_ticket_detail(ticket.id))
+        transaction.on_commit(invalidate_executors_workload)
 
-    if not ticket.assigned_to:
-        raise TicketNotAssignedError()
+    return ticket
 
-    if ticket.assigned_to != executor:
-        raise TicketNotYoursError()
 
-    if ticket.status != TicketStatus.IN_PROGRESS:
-        raise TicketWrongStatusError(
-            'Отклонить можно только заявки в статусе "В работе".'
-        )
+def escalate_stale_tickets(
+    *,
+    batch_size: int | None = None,
+    on_progress: Callable[[str, int], None] | None = None,
+) -> dict[str, int]:
+    """
+    Raise the priority of tickets stuck in new or in progress past their SLA.
 
-    ticket.status = TicketStatus.REJECTED
-    ticket.completed_at = timezone.now()
-    ticket.save(update_fields=['status', 'completed_at', 'updated_at'])
+    Tickets are escalated in set-based batches, one short transaction each
+    (see apps.tickets.escalation), which also write a TicketEscalation per
+    ticket and a 'ticket.escalated' webhook event alerting operators. Safe
+    to run on several nodes at once. Requires PostgreSQL.
 
-    return ticket
+    Args:
+        batch_size: Number of tickets escalated per transaction
+        on_progress: Called with the status and the number of its tickets
+            escalated so far after each batch
+
+    Returns:
+        Number of escalated tickets per status
+    """
+    batch_size = batch_size or settings.TICKETS_ESCALATION_BATCH_SIZE
+    sla = {
+        TicketStatus.NEW: settings.TICKETS_ESCALATION_NEW_SLA,
+        TicketStatus.IN_PROGRESS: settings.TICKETS_ESCALATION_IN_PROGRESS_SLA,
+    }
+    started = timezone.now()
+    escalated = {}
+    for status in STALE_SINCE:
+        cutoff = started - timedelta(seconds=sla[status])
+        escalated[status] = 0
+        after = None
+        while True:
+            with transaction.atomic():
+                rows = escalate_batch(
+                    status=status,
+                    cutoff=cutoff,
+                    now=timezone.now(),
+                    batch_size=batch_size,
+                    after=after,
+                )
+                record_events([
+                    (
+                        'ticket.escalated',
+                        row['id'],
+                        {
+                            **_ticket_event_payload(Ticket(**{column: row[column] for column in RETURNED_COLUMNS})),
+                            'from_priority': row['from_priority'],
+                        },
+                    )
+                    for row in rows
+                ])
+                transaction.on_commit(lambda status=status, rows=rows: _after_escalation(status, rows))
+            escalated[status] += len(rows)
+            if on_progress:
+                on_progress(status, escalated[status])
+            if len(rows) < batch_size:
+                break
+            after = max((row['stale_since'], row['id']) for row in rows)
+    return escalated
+
+
+def _after_escalation(status: str, rows: list[dict]) -> None:
+    """Count committed escalations and drop the escalated tickets' cached details."""
+    for row in rows:
+        TICKET_ESCALATIONS.inc(status, row['priority'])
+    invalidate_ticket_details([row['id'] for row in rows])
+
+
+def refresh_user_snapshots(*, user_id: int, batch_size: int | None = None) -> dict[str, int]:
+    """
+    Copy a user's current display fields to the tickets referencing them.
+
+    Tickets are updated in batches of short transactions and only rows with
+    a stale snapshot are touched, so the refresh can be interrupted and
+    run again.
+
+    Args:
+        user_id: User's ID
+        batch_size: Number of tickets updated per transaction
+
+    Returns:
+        Number of updated tickets per snapshot column
+
+    Raises:
+        NotFoundError: If user not found
+    """
+    user = get_user_by_id(user_id)
+    if not user:
+        raise NotFoundError('Пользователь не найден.')
+
+    batch_size = batch_size or settings.TICKETS_SNAPSHOT_BATCH_SIZE
+    snapshot = user.snapshot
+    updated = {}
+    for field in ('created_by', 'assigned_to'):
+        stale = Ticket.objects.filter(**{f'{field}_id': user_id}).exclude(**{f'{field}_snapshot': snapshot})
+        updated[field] = 0
+        while True:
+            with transaction.atomic():
+                ids = list(stale.values_list('id', flat=True)[:batch_size])
+                if not ids:
+                    break
+                updated[field] += Ticket.objects.filter(id__in=ids).update(**{f'{field}_snapshot': snapshot})
+    return updated
+
+
+def backfill_ticket_snapshots(*, batch_size: int | None = None, after: UUID | None = None):
+    """
+    Fill user snapshots of tickets in batches.
+
+    Tickets are walked in primary key order; each yielded value is the last
+    processed ID, which can be passed as ``after`` to resume.
+
+    Args:
+        batch_size: Number of tickets updated per transaction
+        after: Continue after this ticket ID
+
+    Yields:
+        Tuple of (last processed ticket ID, number of tickets in the batch)
+    """
+    batch_size = batch_size or settings.TICKETS_SNAPSHOT_BATCH_SIZE
+    tickets = Ticket.objects.select_related('created_by', 'assigned_to').order_by('id')
+    while True:
+        batch = tickets.filter(id__gt=after) if after else tickets
+        with transaction.atomic():
+            rows = list(batch[:batch_size])
+            if not rows:
+                return
+            for ticket in rows:
+                ticket.created_by_snapshot = ticket.created_by.snapshot
+                ticket.assigned_to_snapshot = ticket.assigned_to.snapshot if ticket.assigned_to else None
+            Ticket.objects.bulk_update(rows, ['created_by_snapshot', 'assigned_to_snapshot'])
+        after = rows[-1].id
+        yield after, len(rows)
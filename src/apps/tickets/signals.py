@@ -0,0 +1,27 @@
+"""
+Ticket signal handlers.
+"""
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.jobs.services import enqueue_job
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User, dispatch_uid='tickets.refresh_user_snapshots')
+def refresh_user_snapshots_on_change(sender, instance: User, created: bool, **kwargs) -> None:
+    """Queue a snapshot refresh when a user's display fields change."""
+    if created or kwargs.get('raw'):
+        return
+    # Partial saves such as update_last_login() can't change the snapshot
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and not User.SNAPSHOT_FIELDS & update_fields:
+        return
+    loaded = getattr(instance, '_loaded_snapshot', None)
+    snapshot = instance.snapshot
+    if loaded == snapshot:
+        return
+    instance._loaded_snapshot = snapshot
+    enqueue_job(name='tickets.refresh_user_snapshots', payload={'user_id': instance.id})
@@ -0,0 +1,18 @@
+"""
+Ticket background jobs.
+"""
+from apps.jobs.registry import register_job
+
+from .services import escalate_stale_tickets, refresh_user_snapshots
+
+
+@register_job('tickets.refresh_user_snapshots')
+def refresh_snapshots(*, user_id: int) -> dict[str, int]:
+    """Copy a user's changed display fields to their tickets."""
+    return refresh_user_snapshots(user_id=user_id)
+
+
+@register_job('tickets.escalate_stale_tickets')
+def escalate_tickets() -> dict[str, int]:
+    """Escalate tickets stuck past their SLA."""
+    return escalate_stale_tickets()
@@ -0,0 +1,71 @@
+"""
+Tests of the shared ticket detail cache.
+"""
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.test import TestCase
+
+from apps.tickets.cache import (
+    TICKET_DETAIL_CACHE,
+    TICKET_DETAIL_CACHE_KEY,
+    TICKET_DETAIL_VERSION_KEY,
+    invalidate_ticket_detail,
+)
+from apps.tickets.detail_cache import get_ticket_detail
+from apps.tickets.models import Ticket, TicketPriority
+from apps.users.models import UserRole
+
+User = get_user_model()
+
+
+class TicketDetailCacheTests(TestCase):
+    """get_ticket_detail() against the shared cache."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.applicant = User.objects.create_user(
+            email='applicant@example.com', password='pass', role=UserRole.APPLICANT,
+        )
+
+    def setUp(self) -> None:
+        self.cache = caches[TICKET_DETAIL_CACHE]
+        self.ticket = Ticket.objects.create(
+            title='Не работает принтер',
+            description='Принтер на третьем этаже не печатает',
+            priority=TicketPriority.MEDIUM,
+            created_by=self.applicant,
+            created_by_snapshot=self.applicant.snapshot,
+        )
+        self.addCleanup(
+            self.cache.delete_many,
+            [TICKET_DETAIL_CACHE_KEY.format(self.ticket.id), TICKET_DETAIL_VERSION_KEY.format(self.ticket.id)],
+        )
+
+    def test_repeat_read_is_served_from_cache(self) -> None:
+        first = get_ticket_detail(self.ticket.id)
+
+        with self.assertNumQueries(0):
+            second = get_ticket_detail(self.ticket.id)
+        self.assertEqual(second, first)
+
+    def test_etag_follows_body_of_bulk_updates(self) -> None:
+        before = get_ticket_detail(self.ticket.id)
+        # Bulk updates leave updated_at as is
+        Ticket.objects.filter(id=self.ticket.id).update(title='Не работает сканер')
+        invalidate_ticket_detail(self.ticket.id)
+
+        after = get_ticket_detail(self.ticket.id)
+
+        self.assertIn('Не работает сканер'.encode(), after.body)
+        self.assertNotEqual(after.etag, before.etag)
+
+    def test_render_stored_after_invalidation_is_not_served(self) -> None:
+        stale = get_ticket_detail(self.ticket.id)
+        Ticket.objects.filter(id=self.ticket.id).update(title='Не работает сканер')
+        invalidate_ticket_detail(self.ticket.id)
+        # A miss that loaded the ticket before the change writes back late
+        self.cache.set(TICKET_DETAIL_CACHE_KEY.format(self.ticket.id), stale)
+
+        detail = get_ticket_detail(self.ticket.id)
+
+        self.assertIn('Не работает сканер'.encode(), detail.body)
@@ -0,0 +1,65 @@
+"""
+Tests of stale ticket escalation.
+"""
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.tickets.models import Ticket, TicketEscalation, TicketPriority, TicketStatus
+from apps.tickets.services import escalate_stale_tickets
+from apps.users.models import UserRole
+
+User = get_user_model()
+
+
+@override_settings(TICKETS_ESCALATION_NEW_SLA=3600, TICKETS_ESCALATION_IN_PROGRESS_SLA=3600)
+class EscalateStaleTicketsTests(TestCase):
+    """escalate_stale_tickets() over several batches."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.applicant = User.objects.create_user(
+            email='applicant@example.com', password='pass', role=UserRole.APPLICANT,
+        )
+
+    def create_tickets(self, count: int, priority: str, age: timedelta) -> list[Ticket]:
+        tickets = [
+            Ticket.objects.create(
+                title='Не работает принтер',
+                description='Принтер на третьем этаже не печатает',
+                priority=priority,
+                created_by=self.applicant,
+                created_by_snapshot=self.applicant.snapshot,
+            )
+            for _ in range(count)
+        ]
+        Ticket.objects.filter(id__in=[ticket.id for ticket in tickets]).update(
+            created_at=timezone.now() - age,
+        )
+        return tickets
+
+    def test_escalates_each_stale_ticket_once_across_batches(self) -> None:
+        low = self.create_tickets(5, TicketPriority.LOW, timedelta(hours=2))
+        high = self.create_tickets(2, TicketPriority.HIGH, timedelta(hours=2))
+        fresh = self.create_tickets(1, TicketPriority.LOW, timedelta(minutes=5))
+
+        escalated = escalate_stale_tickets(batch_size=2)
+
+        self.assertEqual(escalated[TicketStatus.NEW], len(low))
+        self.assertEqual(
+            set(Ticket.objects.filter(id__in=[ticket.id for ticket in low]).values_list('priority', flat=True)),
+            {TicketPriority.MEDIUM},
+        )
+        self.assertEqual(TicketEscalation.objects.count(), len(low))
+        skipped = Ticket.objects.filter(id__in=[ticket.id for ticket in high + fresh])
+        self.assertFalse(skipped.filter(escalated_at__isnull=False).exists())
+
+    def test_high_priority_tickets_are_not_escalated(self) -> None:
+        [ticket] = self.create_tickets(1, TicketPriority.HIGH, timedelta(hours=2))
+        updated_at = Ticket.objects.get(id=ticket.id).updated_at
+
+        self.assertEqual(escalate_stale_tickets()[TicketStatus.NEW], 0)
+        self.assertEqual(Ticket.objects.get(id=ticket.id).updated_at, updated_at)
+        self.assertFalse(TicketEscalation.objects.exists())
@@ -0,0 +1,105 @@
+"""
+Query budgets of the ticket endpoints.
+
+Each request authenticates with a real JWT, so the counts include loading
+the user (once, shared through the identity map) and are independent of
+the number of tickets involved.
+"""
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.tickets.models import Ticket, TicketPriority, TicketStatus
+from apps.users.models import UserRole
+
+User = get_user_model()
+
+
+@override_settings(TICKETS_KEYSET_PAGINATION=False)
+class TicketQueryCountTests(TestCase):
+    """Number of queries per ticket endpoint."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.applicant = User.objects.create_user(
+            email='applicant@example.com', password='pass', role=UserRole.APPLICANT,
+        )
+        cls.operator = User.objects.create_user(
+            email='operator@example.com', password='pass', role=UserRole.OPERATOR,
+        )
+        cls.executor = User.objects.create_user(
+            email='executor@example.com', password='pass', role=UserRole.EXECUTOR,
+        )
+
+    def client_for(self, user) -> APIClient:
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+        return client
+
+    def create_ticket(self, **fields) -> Ticket:
+        return Ticket.objects.create(
+            title='Не работает принтер',
+            description='Принтер на третьем этаже не печатает',
+            priority=TicketPriority.MEDIUM,
+            created_by=self.applicant,
+            created_by_snapshot=self.applicant.snapshot,
+            **fields,
+        )
+
+    def test_list_does_not_grow_with_page(self) -> None:
+        for _ in range(2):
+            self.create_ticket(assigned_to=self.executor, status=TicketStatus.IN_PROGRESS)
+        client = self.client_for(self.operator)
+        # Reads the table size the paginator caches per process
+        client.get(reverse('tickets:ticket-list-create'))
+
+        # user, count, page
+        with self.assertNumQueries(3):
+            response = client.get(reverse('tickets:ticket-list-create'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 2)
+
+        for _ in range(10):
+            self.create_ticket(assigned_to=self.executor, status=TicketStatus.IN_PROGRESS)
+        with self.assertNumQueries(3):
+            response = client.get(reverse('tickets:ticket-list-create'))
+        self.assertEqual(len(response.data['results']), 12)
+
+    def test_assign(self) -> None:
+        ticket = self.create_ticket()
+        client = self.client_for(self.operator)
+
+        # user, executor, savepoint, locked ticket, its author for the response,
+        # update, savepoint release
+        with self.assertNumQueries(7):
+            response = client.patch(
+                reverse('tickets:ticket-assign', args=[ticket.id]),
+                {'assigned_to': self.executor.id},
+                format='json',
+            )
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data['status'], TicketStatus.IN_PROGRESS)
+
+    def test_complete(self) -> None:
+        ticket = self.create_ticket(assigned_to=self.executor, status=TicketStatus.IN_PROGRESS)
+        client = self.client_for(self.executor)
+
+        # user, savepoint, locked ticket, its author for the response, update,
+        # savepoint release
+        with self.assertNumQueries(6):
+            response = client.patch(reverse('tickets:ticket-complete', args=[ticket.id]))
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data['status'], TicketStatus.COMPLETED)
+
+    def test_reject(self) -> None:
+        ticket = self.create_ticket(assigned_to=self.executor, status=TicketStatus.IN_PROGRESS)
+        client = self.client_for(self.executor)
+
+        # user, savepoint, locked ticket, its author for the response, update,
+        # savepoint release
+        with self.assertNumQueries(6):
+            response = client.patch(reverse('tickets:ticket-reject', args=[ticket.id]))
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data['status'], TicketStatus.REJECTED)
@@ -7,7 +7,10 @@ from .views import (
     AssignedTicketsView,
     MyTicketsView,
     TicketAssignView,
+    TicketBatchGetView,
+    TicketClaimView,
     TicketCompleteView,
+    TicketDetailView,
     TicketListCreateView,
     TicketRejectView,
 )
@@ -18,6 +21,9 @@ urlpatterns = [
     path('my/', MyTicketsView.as_view(), name='my-tickets'),
     path('', TicketListCreateView.as_view(), name='ticket-list-create'),
     path('assigned/', AssignedTicketsView.as_view(), name='assigned-tickets'),
+    path('claim/', TicketClaimView.as_view(), name='ticket-claim'),
+    path('batch-get/', TicketBatchGetView.as_view(), name='ticket-batch-get'),
+    path('<uuid:ticket_id>/', TicketDetailView.as_view(), name='ticket-detail'),
     path('<uuid:ticket_id>/assign/', TicketAssignView.as_view(), name='ticket-assign'),
     path('<uuid:ticket_id>/complete/', TicketCompleteView.as_view(), name='ticket-complete'),
     path('<uuid:ticket_id>/reject/', TicketRejectView.as_view(), name='ticket-reject'),
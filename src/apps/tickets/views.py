@@ -1,38 +1,72 @@
 """
 Ticket API views.
 """
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_spectacular.utils import extend_schema, extend_schema_view
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
 from rest_framework import status
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.exceptions import NotFoundError
+from core.idempotency import IDEMPOTENCY_KEY_PARAMETER, idempotent
+from core.pagination import EstimatedCountPagination, KeysetPagination
+
+from .detail_cache import get_ticket_detail
 from .filters import TicketFilter
 from .permissions import (
     CanAssignTicket,
+    CanClaimTicket,
     CanCompleteOrRejectTicket,
     CanCreateTicket,
     CanViewAllTickets,
     CanViewAssignedTickets,
     CanViewOwnTickets,
 )
-from .selectors import get_all_tickets, get_tickets_assigned_to, get_tickets_by_creator
+from .selectors import (
+    get_all_tickets,
+    get_tickets_assigned_to,
+    get_tickets_by_creator,
+    get_visible_tickets_by_ids,
+)
 from .serializers import (
     TicketAssignSerializer,
+    TicketBatchGetSerializer,
+    TicketBatchResultSerializer,
+    TicketClaimSerializer,
+    TicketCreatedSerializer,
     TicketCreateSerializer,
     TicketDetailSerializer,
     TicketListSerializer,
+    get_list_serializer_class,
 )
-from .services import assign_ticket, complete_ticket, create_ticket, reject_ticket
+from .services import (
+    assign_ticket,
+    claim_ticket,
+    complete_ticket,
+    create_ticket,
+    reject_ticket,
+)
+
+
+def get_list_pagination_class() -> type[EstimatedCountPagination | KeysetPagination]:
+    """Return the ticket list pagination matching TICKETS_KEYSET_PAGINATION."""
+    if settings.TICKETS_KEYSET_PAGINATION:
+        return KeysetPagination
+    return EstimatedCountPagination
 
 
 class MyTicketsView(APIView):
     """API view for applicant's own tickets."""
 
     permission_classes = [CanViewOwnTickets]
+    throttle_scope = 'tickets_read'
     filter_backends = [DjangoFilterBackend]
     filterset_class = TicketFilter
+    # Documents the pagination; requests call get_list_pagination_class()
+    pagination_class = get_list_pagination_class()
 
     @extend_schema(
         responses={200: TicketListSerializer(many=True)},
@@ -47,7 +81,7 @@ class MyTicketsView(APIView):
             request: HTTP request
 
         Returns:
-            Response with list of user's tickets
+            Paginated response with list of user's tickets
         """
         tickets = get_tickets_by_creator(request.user)
 
@@ -56,8 +90,10 @@ class MyTicketsView(APIView):
         if filterset.is_valid():
             tickets = filterset.qs
 
-        serializer = TicketListSerializer(tickets, many=True)
-        return Response(serializer.data)
+        paginator = get_list_pagination_class()()
+        page = paginator.paginate_queryset(tickets, request, view=self)
+        serializer = get_list_serializer_class()(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
 
 @extend_schema_view(
@@ -68,9 +104,13 @@ class MyTicketsView(APIView):
     ),
     post=extend_schema(
         request=TicketCreateSerializer,
-        responses={201: TicketDetailSerializer},
+        responses={201: TicketCreatedSerializer},
+        parameters=[IDEMPOTENCY_KEY_PARAMETER],
         summary='Создать заявку',
-        description='Создание новой заявки (только для заявителя)',
+        description=(
+            'Создание новой заявки (только для заявителя). В possible_duplicates возвращаются '
+            'похожие открытые заявки, которые связываются с новой'
+        ),
     ),
 )
 class TicketListCreateView(APIView):
@@ -78,6 +118,8 @@ class TicketListCreateView(APIView):
 
     filter_backends = [DjangoFilterBackend]
     filterset_class = TicketFilter
+    # Documents the pagination; requests call get_list_pagination_class()
+    pagination_class = get_list_pagination_class()
 
     def get_permissions(self):
         """Return permissions based on HTTP method."""
@@ -85,6 +127,13 @@ class TicketListCreateView(APIView):
             return [CanCreateTicket()]
         return [CanViewAllTickets()]
 
+    @property
+    def throttle_scope(self) -> str:
+        """Return throttle scope based on HTTP method."""
+        if self.request.method == 'POST':
+            return 'tickets_write'
+        return 'tickets_read'
+
     def get(self, request: Request) -> Response:
         """
         Get all tickets (operator only).
@@ -93,7 +142,7 @@ class TicketListCreateView(APIView):
             request: HTTP request
 
         Returns:
-            Response with list of all tickets
+            Paginated response with list of all tickets
         """
         tickets = get_all_tickets()
 
@@ -102,9 +151,12 @@ class TicketListCreateView(APIView):
         if filterset.is_valid():
             tickets = filterset.qs
 
-        serializer = TicketListSerializer(tickets, many=True)
-        return Response(serializer.data)
+        paginator = get_list_pagination_class()()
+        page = paginator.paginate_queryset(tickets, request, view=self)
+        serializer = get_list_serializer_class()(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
+    @idempotent
     def post(self, request: Request) -> Response:
         """
         Create a new ticket (applicant only).
@@ -124,22 +176,106 @@ class TicketListCreateView(APIView):
         )
 
         return Response(
-            TicketDetailSerializer(ticket).data,
+            TicketCreatedSerializer(ticket).data,
             status=status.HTTP_201_CREATED,
         )
 
 
+class TicketBatchGetView(APIView):
+    """API view for fetching tickets by a list of IDs."""
+
+    throttle_scope = 'tickets_read'
+
+    @extend_schema(
+        request=TicketBatchGetSerializer,
+        responses={200: TicketBatchResultSerializer},
+        summary='Заявки по списку ID',
+        description=(
+            f'Получение до {settings.TICKETS_BATCH_GET_MAX_IDS} заявок одним запросом в порядке переданных ID. '
+            'Несуществующие и недоступные пользователю заявки перечисляются в not_found'
+        ),
+    )
+    def post(self, request: Request) -> Response:
+        """
+        Get tickets by IDs.
+
+        Args:
+            request: HTTP request with the list of ticket IDs
+
+        Returns:
+            Response with visible tickets in request order and IDs not found
+        """
+        serializer = TicketBatchGetSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ticket_ids = list(dict.fromkeys(serializer.validated_data['ids']))
+
+        tickets = get_visible_tickets_by_ids(request.user, ticket_ids)
+        found = {ticket.id for ticket in tickets}
+        return Response({
+            'results': get_list_serializer_class()(tickets, many=True).data,
+            'not_found': [ticket_id for ticket_id in ticket_ids if ticket_id not in found],
+        })
+
+
+class TicketDetailView(APIView):
+    """API view for a single ticket, served from the rendered detail cache."""
+
+    throttle_scope = 'tickets_read'
+
+    @extend_schema(
+        responses={200: TicketDetailSerializer, 304: None},
+        parameters=[
+            OpenApiParameter(
+                name='If-None-Match',
+                location=OpenApiParameter.HEADER,
+                required=False,
+                description='ETag из предыдущего ответа: если заявка не менялась, вернётся 304 без тела',
+            ),
+        ],
+        summary='Заявка',
+        description='Получение заявки (автор заявки, исполнитель или оператор)',
+    )
+    def get(self, request: Request, ticket_id: str) -> HttpResponse:
+        """
+        Get a ticket.
+
+        Args:
+            request: HTTP request
+            ticket_id: Ticket's UUID
+
+        Returns:
+            JSON response with ticket data, or 304 if the client's copy is current
+
+        Raises:
+            NotFoundError: If the ticket doesn't exist or isn't visible to the user
+        """
+        detail = get_ticket_detail(ticket_id)
+        if detail is None or not detail.is_visible_to(request.user):
+            raise NotFoundError('Заявка не найдена.')
+
+        if detail.is_matched_by(request.headers.get('If-None-Match', '')):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(detail.body, content_type='application/json')
+        response['ETag'] = detail.etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+
 class TicketAssignView(APIView):
     """API view for assigning ticket to executor."""
 
     permission_classes = [CanAssignTicket]
+    throttle_scope = 'tickets_write'
 
     @extend_schema(
         request=TicketAssignSerializer,
         responses={200: TicketDetailSerializer},
+        parameters=[IDEMPOTENCY_KEY_PARAMETER],
         summary='Назначить исполнителя',
         description='Назначение исполнителя на заявку (только для оператора)',
     )
+    @idempotent
     def patch(self, request: Request, ticket_id: str) -> Response:
         """
         Assign executor to ticket.
@@ -163,12 +299,53 @@ class TicketAssignView(APIView):
         return Response(TicketDetailSerializer(ticket).data)
 
 
+class TicketClaimView(APIView):
+    """API view for claiming the next new ticket."""
+
+    permission_classes = [CanClaimTicket]
+    throttle_scope = 'tickets_write'
+
+    @extend_schema(
+        request=TicketClaimSerializer,
+        responses={200: TicketDetailSerializer},
+        parameters=[IDEMPOTENCY_KEY_PARAMETER],
+        summary='Взять заявку в работу',
+        description=(
+            'Назначение текущему исполнителю самой приоритетной и самой старой новой заявки, '
+            'опционально только заданного приоритета'
+        ),
+    )
+    @idempotent
+    def post(self, request: Request) -> Response:
+        """
+        Claim the next new ticket.
+
+        Args:
+            request: HTTP request with optional priority
+
+        Returns:
+            Response with claimed ticket data
+        """
+        serializer = TicketClaimSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        ticket = claim_ticket(
+            executor=request.user,
+            priority=serializer.validated_data.get('priority'),
+        )
+
+        return Response(TicketDetailSerializer(ticket).data)
+
+
 class AssignedTicketsView(APIView):
     """API view for executor's assigned tickets."""
 
     permission_classes = [CanViewAssignedTickets]
+    throttle_scope = 'tickets_read'
     filter_backends = [DjangoFilterBackend]
     filterset_class = TicketFilter
+    # Documents the pagination; requests call get_list_pagination_class()
+    pagination_class = get_list_pagination_class()
 
     @extend_schema(
         responses={200: TicketListSerializer(many=True)},
@@ -183,7 +360,7 @@ class AssignedTicketsView(APIView):
             request: HTTP request
 
         Returns:
-            Response with list of assigned tickets
+            Paginated response with list of assigned tickets
         """
         tickets = get_tickets_assigned_to(request.user)
 
@@ -192,20 +369,25 @@ class AssignedTicketsView(APIView):
         if filterset.is_valid():
             tickets = filterset.qs
 
-        serializer = TicketListSerializer(tickets, many=True)
-        return Response(serializer.data)
+        paginator = get_list_pagination_class()()
+        page = paginator.paginate_queryset(tickets, request, view=self)
+        serializer = get_list_serializer_class()(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
 
 class TicketCompleteView(APIView):
     """API view for completing a ticket."""
 
     permission_classes = [CanCompleteOrRejectTicket]
+    throttle_scope = 'tickets_write'
 
     @extend_schema(
         responses={200: TicketDetailSerializer},
+        parameters=[IDEMPOTENCY_KEY_PARAMETER],
         summary='Завершить заявку',
         description='Отметить заявку как выполненную (только для исполнителя)',
     )
+    @idempotent
     def patch(self, request: Request, ticket_id: str) -> Response:
         """
         Complete a ticket.
@@ -229,12 +411,15 @@ class TicketRejectView(APIView):
     """API view for rejecting a ticket."""
 
     permission_classes = [CanCompleteOrRejectTicket]
+    throttle_scope = 'tickets_write'
 
     @extend_schema(
         responses={200: TicketDetailSerializer},
+        parameters=[IDEMPOTENCY_KEY_PARAMETER],
         summary='Отклонить заявку',
         description='Отклонить заявку (только для исполнителя)',
     )
+    @idempotent
     def patch(self, request: Request, ticket_id: str) -> Response:
         """
         Reject a ticket.
@@ -1,8 +1,14 @@
 """
 User admin configuration.
 """
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.db import models
+from django.db.models import QuerySet
+from django.http import HttpRequest
+
+from apps.jobs.services import enqueue_job
+from core.pagination import EstimatedCountPaginator
 
 from .models import User
 
@@ -13,8 +19,12 @@ class UserAdmin(BaseUserAdmin):
 
     list_display = ['email', 'first_name', 'last_name', 'role', 'is_active', 'created_at']
     list_filter = ['role', 'is_active', 'is_staff']
-    search_fields = ['email', 'first_name', 'last_name']
+    # Prefix email only, backed by an UPPER() index
+    search_fields = ['^email']
+    search_help_text = 'Начало email'
     ordering = ['-created_at']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
     fieldsets = (
         (None, {'fields': ('email', 'password')}),
@@ -28,3 +38,54 @@ class UserAdmin(BaseUserAdmin):
             'fields': ('email', 'password1', 'password2', 'first_name', 'last_name', 'role'),
         }),
     )
+
+    def get_deleted_objects(self, objs, request: HttpRequest) -> tuple:
+        """
+        Skip collecting every related ticket for the confirmation page.
+
+        Only the users are listed, but the delete permission is checked as
+        Django does: for the users and for every admin-registered model the
+        deletion cascades to.
+        """
+        perms_needed = set()
+        if not all(self.has_delete_permission(request, obj) for obj in objs):
+            perms_needed.add(self.opts.verbose_name)
+        for model in _cascaded_models(self.model):
+            model_admin = self.admin_site._registry.get(model)
+            if model_admin is not None and not model_admin.has_delete_permission(request):
+                perms_needed.add(model._meta.verbose_name)
+        return [str(obj) for obj in objs], {self.opts.verbose_name_plural: len(objs)}, perms_needed, []
+
+    def delete_model(self, request: HttpRequest, obj: User) -> None:
+        """Deactivate the user and delete them in batches in the background."""
+        self._enqueue_deletion(request, [obj])
+
+    def delete_queryset(self, request: HttpRequest, queryset: QuerySet[User]) -> None:
+        """Deactivate the users and delete them in batches in the background."""
+        self._enqueue_deletion(request, list(queryset))
+
+    def _enqueue_deletion(self, request: HttpRequest, users: list[User]) -> None:
+        """Enqueue a batched deletion job per user."""
+        User.objects.filter(id__in=[user.id for user in users]).update(is_active=False)
+        for user in users:
+            enqueue_job(name='users.delete_user', payload={'user_id': user.id}, created_by=request.user)
+        self.message_user(
+            request,
+            'Пользователи деактивированы, заявки и учётные записи удаляются в фоне.',
+            messages.INFO,
+        )
+
+
+def _cascaded_models(model: type[models.Model], seen: set | None = None) -> set[type[models.Model]]:
+    """Return the models whose rows are deleted in cascade with the model's rows."""
+    seen = set() if seen is None else seen
+    for relation in model._meta.get_fields(include_hidden=True):
+        if (
+            relation.auto_created and not relation.concrete
+            and (relation.one_to_many or relation.one_to_one)
+            and relation.on_delete is models.CASCADE
+            and relation.related_model not in seen
+        ):
+            seen.add(relation.related_model)
+            _cascaded_models(relation.related_model, seen)
+    return seen
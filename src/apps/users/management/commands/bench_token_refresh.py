@@ -0,0 +1,114 @@
+"""
+Management command to benchmark token refresh with revocation checks.
+"""
+import statistics
+import time
+import uuid
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.views import TokenRefreshView
+
+from apps.users.models import RevokedToken, UserRole
+from apps.users.revocation import revocation_filter
+from apps.users.serializers import RevocableTokenRefreshSerializer
+from apps.users.views import TokenRefreshAPIView
+
+User = get_user_model()
+
+
+class DatabaseCheckSerializer(RevocableTokenRefreshSerializer):
+    """Revocation check with a database lookup on every refresh."""
+
+    def validate(self, attrs: dict) -> dict:
+        if RevokedToken.objects.filter(jti=RefreshToken(attrs['refresh'])['jti']).exists():
+            raise AssertionError('Benchmark token is revoked')
+        return super().validate(attrs)
+
+
+class Command(BaseCommand):
+    """Compare refresh throughput without revocation, with a DB lookup and with the rotation insert alone."""
+
+    help = (
+        'Seeds revoked tokens and measures TokenRefreshAPIView throughput and '
+        'queries per refresh with and without a revocation lookup before the rotation insert'
+    )
+
+    def add_arguments(self, parser) -> None:
+        """Register command arguments."""
+        parser.add_argument('--revoked', type=int, default=1_000_000, help='Revoked tokens to seed')
+        parser.add_argument('--requests', type=int, default=2000, help='Refreshes per scenario')
+        parser.add_argument('--batch-size', type=int, default=10_000)
+        parser.add_argument('--keep', action='store_true', help='Do not delete benchmark data')
+
+    def handle(self, *args, **options) -> None:
+        """Execute the command."""
+        run_id = uuid.uuid4().hex[:8]
+        user = User.objects.create_user(f'bench-{run_id}@bench.local', password=None, role=UserRole.APPLICANT)
+        try:
+            self._seed(run_id, options)
+            revocation_filter.reset()
+            started = time.perf_counter()
+            revocation_filter.might_contain('')
+            self.stdout.write(f'Filter built in {time.perf_counter() - started:.2f}s')
+
+            scenarios = [
+                ('no revocation', TokenRefreshView.as_view(throttle_classes=[])),
+                ('db lookup', TokenRefreshAPIView.as_view(
+                    throttle_classes=[], serializer_class=DatabaseCheckSerializer,
+                )),
+                ('insert only', TokenRefreshAPIView.as_view(throttle_classes=[])),
+            ]
+            self.stdout.write(f'{"scenario":<16} {"refresh/s":>10} {"p50":>8} {"p99":>8} {"queries":>8}')
+            for label, view in scenarios:
+                self._measure(label, view, user, options['requests'])
+        finally:
+            if not options['keep']:
+                RevokedToken.objects.filter(jti__startswith=f'bench-{run_id}-').delete()
+                user.delete()
+
+    def _seed(self, run_id: str, options: dict) -> None:
+        """Insert revoked tokens that have not expired yet."""
+        expires_at = timezone.now() + timedelta(days=7)
+        for start in range(0, options['revoked'], options['batch_size']):
+            stop = min(start + options['batch_size'], options['revoked'])
+            RevokedToken.objects.bulk_create([
+                RevokedToken(jti=f'bench-{run_id}-{n}', expires_at=expires_at)
+                for n in range(start, stop)
+            ])
+        self.stdout.write(f'Seeded {options["revoked"]} revoked tokens')
+
+    def _measure(self, label: str, view, user, requests: int) -> None:
+        """Refresh a chain of rotated tokens and print throughput and latency."""
+        factory = APIRequestFactory()
+        refresh = str(RefreshToken.for_user(user))
+        timings = []
+        queries = 0
+
+        def count_query(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count_query):
+            for _ in range(requests):
+                request = factory.post('/api/auth/refresh/', {'refresh': refresh}, format='json')
+                started = time.perf_counter()
+                response = view(request)
+                response.render()
+                timings.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    raise RuntimeError(f'{label}: refresh returned {response.status_code} {response.data}')
+                refresh = response.data['refresh']
+
+        timings.sort()
+        self.stdout.write(
+            f'{label:<16} {len(timings) / sum(timings):>10.0f} '
+            f'{statistics.median(timings) * 1000:>6.2f}ms {timings[int(len(timings) * 0.99)] * 1000:>6.2f}ms '
+            f'{queries / requests:>8.1f}'
+        )
@@ -0,0 +1,53 @@
+"""
+Management command to delete a user with a long ticket history.
+"""
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.users.services import delete_user_in_batches
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """Delete a user and their tickets in bounded batches."""
+
+    help = (
+        'Deletes a user, their tickets and references to them in small '
+        'batches. An interrupted run is resumed by running it again'
+    )
+
+    def add_arguments(self, parser) -> None:
+        """Register command arguments."""
+        parser.add_argument('email', help='Email of the user to delete')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=0.0,
+            help='Seconds to sleep between batches to reduce load',
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Execute the command."""
+        user = User.objects.filter(email__iexact=options['email']).first()
+        if not user:
+            raise CommandError(f'User {options["email"]} does not exist')
+
+        started = time.monotonic()
+
+        def report(stage: str, done: int) -> None:
+            self.stdout.write(f'{stage}: {done} ({time.monotonic() - started:.1f}s)')
+            if options['pause']:
+                time.sleep(options['pause'])
+
+        stats = delete_user_in_batches(
+            user_id=user.id,
+            batch_size=options['batch_size'],
+            on_progress=report,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'Deleted {user.email}: ' + ', '.join(f'{stage}={count}' for stage, count in stats.items())
+        ))
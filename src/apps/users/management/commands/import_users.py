@@ -0,0 +1,137 @@
+"""
+Management command to bulk import users from CSV or JSONL.
+"""
+import csv
+import json
+import os
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.core.validators import validate_email
+
+from apps.users.models import UserRole
+from apps.users.selectors import get_existing_emails
+from apps.users.services import bulk_create_users, create_hasher_pool, hash_passwords
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """Bulk import users with parallel password hashing."""
+
+    help = (
+        'Imports users from a CSV or JSONL file. Existing emails are skipped, '
+        'so an interrupted import can be resumed by running it again'
+    )
+
+    def add_arguments(self, parser) -> None:
+        """Register command arguments."""
+        parser.add_argument('path', help='Path to a .csv or .jsonl file')
+        parser.add_argument(
+            '--format',
+            choices=['csv', 'jsonl'],
+            help='Input format (detected from the file extension by default)',
+        )
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Number of password hashing processes',
+        )
+        parser.add_argument(
+            '--default-role',
+            choices=UserRole.values,
+            default=UserRole.APPLICANT,
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Execute the command."""
+        path = Path(options['path'])
+        if not path.exists():
+            raise CommandError(f'File {path} does not exist')
+
+        input_format = options['format'] or path.suffix.lstrip('.').lower()
+        if input_format not in ('csv', 'jsonl'):
+            raise CommandError('Cannot detect input format, use --format')
+
+        users = self._validate_rows(
+            self._read_rows(path, input_format),
+            default_role=options['default_role'],
+        )
+        existing = get_existing_emails([user['email'] for user in users])
+        users = [user for user in users if user['email'] not in existing]
+        self.stdout.write(
+            f'{len(users)} users to import, {len(existing)} already exist'
+        )
+
+        batch_size = options['batch_size']
+        imported = 0
+        processed = 0
+        started = time.monotonic()
+        with create_hasher_pool(options['workers']) as pool:
+            for offset in range(0, len(users), batch_size):
+                batch = users[offset:offset + batch_size]
+                hashes = hash_passwords([user['password'] for user in batch], pool=pool)
+                for user, password_hash in zip(batch, hashes):
+                    user['password'] = password_hash
+
+                imported += bulk_create_users(users=batch, batch_size=batch_size)
+                processed += len(batch)
+                elapsed = time.monotonic() - started
+                self.stdout.write(
+                    f'Processed {processed}/{len(users)} users, {imported} created '
+                    f'({imported / elapsed:.1f} users/s)'
+                )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Users import completed: {imported} created, {processed - imported} skipped as taken'
+        ))
+
+    def _read_rows(self, path: Path, input_format: str) -> Iterator[dict]:
+        """Yield raw rows from the input file."""
+        with path.open(encoding='utf-8', newline='') as input_file:
+            if input_format == 'csv':
+                yield from csv.DictReader(input_file)
+                return
+
+            for line_number, line in enumerate(input_file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as exc:
+                    raise CommandError(f'Line {line_number}: invalid JSON ({exc})') from exc
+
+    def _validate_rows(self, rows: Iterator[dict], *, default_role: str) -> list[dict]:
+        """Normalize rows, skipping invalid entries and duplicate emails."""
+        users = []
+        seen = set()
+        for number, row in enumerate(rows, start=1):
+            email = User.objects.normalize_email((row.get('email') or '').strip())
+            role = row.get('role') or default_role
+            try:
+                validate_email(email)
+            except ValidationError:
+                self.stdout.write(self.style.WARNING(f'Row {number}: invalid email {email!r}, skipping'))
+                continue
+            if role not in UserRole.values:
+                self.stdout.write(self.style.WARNING(f'Row {number}: unknown role {role!r}, skipping'))
+                continue
+            if email in seen:
+                self.stdout.write(self.style.WARNING(f'Row {number}: duplicate email {email}, skipping'))
+                continue
+
+            seen.add(email)
+            users.append({
+                'email': email,
+                'password': row.get('password') or None,
+                'first_name': row.get('first_name') or '',
+                'last_name': row.get('last_name') or '',
+                'role': role,
+            })
+        return users
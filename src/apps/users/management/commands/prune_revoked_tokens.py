@@ -0,0 +1,21 @@
+"""
+Management command to delete revocations of expired refresh tokens.
+"""
+from django.core.management.base import BaseCommand
+
+from apps.users.services import prune_revoked_tokens
+
+
+class Command(BaseCommand):
+    """Delete revoked tokens past their expiry in batches."""
+
+    help = 'Deletes revoked refresh tokens that have expired; run periodically, e.g. from cron'
+
+    def add_arguments(self, parser) -> None:
+        """Register command arguments."""
+        parser.add_argument('--batch-size', type=int, default=10_000)
+
+    def handle(self, *args, **options) -> None:
+        """Execute the command."""
+        deleted = prune_revoked_tokens(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} expired revoked tokens'))
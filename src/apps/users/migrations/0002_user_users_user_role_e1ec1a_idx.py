@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-19 18:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role', 'is_active'], name='users_user_role_e1ec1a_idx'),
+        ),
+    ]
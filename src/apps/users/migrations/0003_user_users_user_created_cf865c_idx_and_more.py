@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-19 18:37
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_user_users_user_role_e1ec1a_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['created_at'], name='users_user_created_cf865c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('email', models.TextField())), name='text_pattern_ops'), name='users_email_upper_like_idx'),
+        ),
+    ]
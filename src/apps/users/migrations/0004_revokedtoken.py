@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-19 18:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_user_users_user_created_cf865c_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevokedToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('jti', models.CharField(max_length=64, unique=True, verbose_name='ID токена')),
+                ('expires_at', models.DateTimeField(verbose_name='Истекает')),
+            ],
+            options={
+                'verbose_name': 'Отозванный токен',
+                'verbose_name_plural': 'Отозванные токены',
+                'indexes': [models.Index(fields=['expires_at'], name='users_revok_expires_1dfdca_idx')],
+            },
+        ),
+    ]
@@ -2,7 +2,9 @@
 User models.
 """
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
+from django.contrib.postgres.indexes import OpClass
 from django.db import models
+from django.db.models.functions import Cast, Upper
 
 
 class UserRole(models.TextChoices):
@@ -95,15 +97,39 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = []
+    # Fields the snapshot stored on tickets is built from
+    SNAPSHOT_FIELDS = frozenset({'email', 'first_name', 'last_name'})
 
     class Meta:
         verbose_name = 'Пользователь'
         verbose_name_plural = 'Пользователи'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['role', 'is_active']),
+            models.Index(fields=['created_at']),
+            # Backs case-insensitive exact and prefix email search in the admin
+            models.Index(
+                OpClass(Upper(Cast('email', models.TextField())), name='text_pattern_ops'),
+                name='users_email_upper_like_idx',
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.email
 
+    @classmethod
+    def from_db(cls, db, field_names, values) -> 'User':
+        """Remember the loaded snapshot to detect changes on save."""
+        instance = super().from_db(db, field_names, values)
+        if cls.SNAPSHOT_FIELDS <= set(field_names):
+            instance._loaded_snapshot = instance.snapshot
+        return instance
+
+    @property
+    def snapshot(self) -> dict:
+        """Return the display fields stored on tickets in place of a join."""
+        return {'id': self.id, 'email': self.email, 'full_name': self.full_name}
+
     @property
     def full_name(self) -> str:
         """Return user's full name."""
@@ -123,3 +149,25 @@ class User(AbstractBaseUser, PermissionsMixin):
     def is_executor(self) -> bool:
         """Check if user is an executor."""
         return self.role == UserRole.EXECUTOR
+
+
+class RevokedToken(models.Model):
+    """
+    Revoked refresh token.
+
+    Rows are only inserted and, once the token has expired, pruned; the
+    increasing primary key lets workers load new revocations incrementally.
+    """
+
+    jti = models.CharField('ID токена', max_length=64, unique=True)
+    expires_at = models.DateTimeField('Истекает')
+
+    class Meta:
+        verbose_name = 'Отозванный токен'
+        verbose_name_plural = 'Отозванные токены'
+        indexes = [
+            models.Index(fields=['expires_at']),
+        ]
+
+    def __str__(self) -> str:
+        return self.jti
@@ -0,0 +1,122 @@
+"""
+In-memory filter of revoked refresh tokens.
+
+Every worker process keeps a Bloom filter of the IDs in the RevokedToken
+table and tops it up with rows added since its last refresh. A token the
+filter has never seen is certainly not revoked, so the common check costs
+no query; only filter hits (revoked tokens and rare false positives) are
+confirmed in the database. The filter is rebuilt from live rows when it
+outgrows its capacity, which also drops pruned, expired tokens.
+
+Revocations committed by other processes become visible after at most
+TOKEN_REVOCATION_REFRESH_INTERVAL seconds (or later, if a lower ID commits
+after a higher one). With ROTATE_REFRESH_TOKENS the refresh path doesn't
+consult the filter at all: the unique jti insert made on every refresh
+rejects reuse of a rotated token by itself.
+"""
+import hashlib
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.db.models import Max
+from django.utils import timezone
+
+from .models import RevokedToken
+
+
+class BloomFilter:
+    """Bloom filter of strings with double hashing over a BLAKE2b digest."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hashes):
+            yield (first + i * second) % self.size
+
+    def add(self, key: str) -> None:
+        """Add a key to the filter."""
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class RevocationFilter:
+    """Per-process Bloom filter of revoked token IDs, refreshed incrementally."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._filter = None
+        self._last_id = 0
+        self._refreshed_at = 0.0
+
+    def reset(self) -> None:
+        """Drop the filter; it is rebuilt on the next check."""
+        with self._lock:
+            self._filter = None
+
+    def _rebuild(self) -> None:
+        """Load all unexpired revocations into a new filter."""
+        last_id = RevokedToken.objects.aggregate(last_id=Max('id'))['last_id'] or 0
+        live = RevokedToken.objects.filter(id__lte=last_id, expires_at__gt=timezone.now())
+        capacity = max(settings.TOKEN_REVOCATION_CAPACITY, live.count() * 2)
+        bloom = BloomFilter(capacity, settings.TOKEN_REVOCATION_ERROR_RATE)
+        for jti in live.values_list('jti', flat=True).iterator(chunk_size=10_000):
+            bloom.add(jti)
+        self._filter = bloom
+        self._last_id = last_id
+
+    def _refresh(self) -> None:
+        """Add revocations inserted since the last refresh."""
+        rows = RevokedToken.objects.filter(id__gt=self._last_id).order_by('id').values_list('id', 'jti')
+        for row_id, jti in rows.iterator(chunk_size=10_000):
+            self._filter.add(jti)
+            self._last_id = row_id
+
+    def _sync(self) -> BloomFilter:
+        """Bring the filter up to date if the refresh interval has passed and return it."""
+        bloom = self._filter
+        now = time.monotonic()
+        if bloom is not None and now - self._refreshed_at < settings.TOKEN_REVOCATION_REFRESH_INTERVAL:
+            return bloom
+        with self._lock:
+            if self._filter is None or self._filter.count > self._filter.capacity:
+                self._rebuild()
+            if now - self._refreshed_at >= settings.TOKEN_REVOCATION_REFRESH_INTERVAL:
+                self._refresh()
+                self._refreshed_at = now
+            return self._filter
+
+    def might_contain(self, jti: str) -> bool:
+        """
+        Check whether a token ID may have been revoked.
+
+        Args:
+            jti: Token ID
+
+        Returns:
+            False if the token is certainly not revoked (as of the last
+            refresh), True if it has to be confirmed in the database
+        """
+        return jti in self._sync()
+
+    def add(self, jti: str) -> None:
+        """Add a token revoked by this process without waiting for a refresh."""
+        bloom = self._sync()
+        with self._lock:
+            bloom.add(jti)
+
+
+revocation_filter = RevocationFilter()
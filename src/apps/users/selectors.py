@@ -1,13 +1,22 @@
 """
 User database query selectors.
 """
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import QuerySet
+from django.core.cache import caches
+from django.db.models import Count, FilteredRelation, Q, QuerySet
 
-from .models import UserRole
+from apps.tickets.models import TicketStatus
+from core.identity_map import get_identity_map
+
+from .models import RevokedToken, UserRole
+from .revocation import revocation_filter
 
 User = get_user_model()
 
+EXECUTORS_WORKLOAD_CACHE = 'shared'
+EXECUTORS_WORKLOAD_CACHE_KEY = 'users:executors-workload'
+
 
 def get_executors() -> QuerySet:
     """
@@ -22,6 +31,53 @@ def get_executors() -> QuerySet:
     )
 
 
+def get_executors_with_workload() -> list[User]:
+    """
+    Get active executors with their current ticket counts.
+
+    Counts come from a single aggregated query joining only open tickets,
+    and the result is cached for EXECUTORS_WORKLOAD_CACHE_TTL seconds in
+    the cache shared by every worker, where ticket transitions drop it.
+
+    Returns:
+        Executors annotated with in_progress_count and new_count,
+        least loaded first
+    """
+    cache = caches[EXECUTORS_WORKLOAD_CACHE]
+    executors = cache.get(EXECUTORS_WORKLOAD_CACHE_KEY)
+    if executors is None:
+        executors = list(
+            get_executors()
+            .only('id', 'email', 'first_name', 'last_name')
+            .alias(
+                open_tickets=FilteredRelation(
+                    'assigned_tickets',
+                    condition=Q(assigned_tickets__status__in=[
+                        TicketStatus.NEW,
+                        TicketStatus.IN_PROGRESS,
+                    ]),
+                ),
+            )
+            .annotate(
+                in_progress_count=Count(
+                    'open_tickets',
+                    filter=Q(open_tickets__status=TicketStatus.IN_PROGRESS),
+                ),
+                new_count=Count(
+                    'open_tickets',
+                    filter=Q(open_tickets__status=TicketStatus.NEW),
+                ),
+            )
+            .order_by('in_progress_count', 'new_count', 'id')
+        )
+        cache.set(
+            EXECUTORS_WORKLOAD_CACHE_KEY,
+            executors,
+            settings.EXECUTORS_WORKLOAD_CACHE_TTL,
+        )
+    return executors
+
+
 def get_user_by_id(user_id: int) -> User | None:
     """
     Get user by ID.
@@ -32,4 +88,53 @@ def get_user_by_id(user_id: int) -> User | None:
     Returns:
         User instance or None if not found
     """
-    return User.objects.filter(id=user_id).first()
+    return get_identity_map().get(User, user_id)
+
+
+def get_active_executor(user_id: int) -> User | None:
+    """
+    Get active executor by ID.
+
+    Args:
+        user_id: User's ID
+
+    Returns:
+        User instance or None if the user is not an active executor
+    """
+    user = get_user_by_id(user_id)
+    if user and user.role == UserRole.EXECUTOR and user.is_active:
+        return user
+    return None
+
+
+def get_existing_emails(emails: list[str]) -> set[str]:
+    """
+    Get emails that are already taken by existing users.
+
+    Args:
+        emails: Normalized email addresses to check
+
+    Returns:
+        Set of emails that already belong to users
+    """
+    return set(
+        User.objects.filter(email__in=emails).values_list('email', flat=True)
+    )
+
+
+def is_token_revoked(jti: str) -> bool:
+    """
+    Check whether a refresh token has been revoked.
+
+    Tokens unknown to the in-memory revocation filter are answered without
+    a query; filter hits are confirmed in the database.
+
+    Args:
+        jti: Token ID
+
+    Returns:
+        True if the token is revoked
+    """
+    if not revocation_filter.might_contain(jti):
+        return False
+    return RevokedToken.objects.filter(jti=jti).exists()
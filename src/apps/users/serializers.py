@@ -1,9 +1,21 @@
 """
 User serializers.
 """
+from datetime import UTC, datetime
+
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
+from drf_spectacular.utils import extend_schema_serializer
 from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.exceptions import TokenRevokedError
+
+from .selectors import is_token_revoked
+from .services import revoke_token
 
 User = get_user_model()
 
@@ -63,3 +75,66 @@ class UserShortSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['id', 'email', 'full_name']
+
+
+class ExecutorWorkloadSerializer(serializers.ModelSerializer):
+    """Serializer for executor directory with current workload."""
+
+    full_name = serializers.CharField(read_only=True)
+    in_progress_count = serializers.IntegerField(read_only=True)
+    new_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = User
+        fields = ['id', 'email', 'full_name', 'in_progress_count', 'new_count']
+
+
+def _parse_refresh_token(raw: str) -> RefreshToken:
+    """Decode and verify a refresh token."""
+    try:
+        return RefreshToken(raw)
+    except TokenError as error:
+        raise InvalidToken(error.args[0]) from error
+
+
+def _revoke(token: RefreshToken) -> bool:
+    """Revoke a refresh token until its expiry."""
+    return revoke_token(
+        jti=token['jti'],
+        expires_at=datetime.fromtimestamp(token['exp'], tz=UTC),
+    )
+
+
+@extend_schema_serializer(component_name='TokenRefresh')
+class RevocableTokenRefreshSerializer(TokenRefreshSerializer):
+    """Token refresh that rejects revoked refresh tokens and revokes rotated ones."""
+
+    def validate(self, attrs: dict) -> dict:
+        """
+        Check the refresh token against revocations and revoke it on rotation.
+
+        With rotation the unique revocation insert alone decides: it fails
+        for tokens revoked before, so no separate lookup is made. Without
+        rotation the token is checked against the revocation filter.
+
+        Raises:
+            TokenRevokedError: If the token is revoked or was already rotated
+                by a concurrent request
+        """
+        token = _parse_refresh_token(attrs['refresh'])
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if not _revoke(token):
+                raise TokenRevokedError()
+        elif is_token_revoked(token['jti']):
+            raise TokenRevokedError()
+        return super().validate(attrs)
+
+
+class LogoutSerializer(serializers.Serializer):
+    """Serializer for refresh token revocation."""
+
+    refresh = serializers.CharField()
+
+    def save(self) -> None:
+        """Revoke the refresh token."""
+        _revoke(_parse_refresh_token(self.validated_data['refresh']))
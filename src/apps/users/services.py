@@ -1,7 +1,27 @@
 """
 User business logic services.
 """
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from uuid import UUID
+
+import django
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.cache import caches
+from django.db import IntegrityError, models, transaction
+from django.utils import timezone
+
+from apps.attachments.models import Attachment
+from apps.attachments.services import delete_unreferenced_blobs
+from apps.tickets.cache import invalidate_ticket_details
+from apps.tickets.models import Ticket
+from core.exceptions import NotFoundError
+
+from .models import RevokedToken
+from .revocation import revocation_filter
+from .selectors import EXECUTORS_WORKLOAD_CACHE, EXECUTORS_WORKLOAD_CACHE_KEY
 
 User = get_user_model()
 
@@ -34,3 +54,227 @@ def create_user(
         last_name=last_name,
         role=role,
     )
+
+
+def _init_hasher_process() -> None:
+    """Configure Django in a hashing worker started with the spawn method."""
+    django.setup()
+
+
+def create_hasher_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Create a process pool for password hashing.
+
+    Args:
+        workers: Number of worker processes
+
+    Returns:
+        Process pool with Django configured in every worker
+    """
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_hasher_process)
+
+
+def hash_passwords(
+    passwords: list[str | None],
+    *,
+    pool: ProcessPoolExecutor | None = None,
+) -> list[str]:
+    """
+    Hash passwords, in parallel when a process pool is given.
+
+    Args:
+        passwords: Raw passwords; None produces an unusable password
+        pool: Process pool created by create_hasher_pool()
+
+    Returns:
+        Password hashes in the same order as the input
+    """
+    if pool is None or len(passwords) < 2:
+        return [make_password(password) for password in passwords]
+
+    return list(pool.map(make_password, passwords))
+
+
+def bulk_create_users(*, users: list[dict], batch_size: int = 1000) -> int:
+    """
+    Insert users with already hashed passwords, skipping taken emails.
+
+    Args:
+        users: User field values; 'password' must hold a password hash
+        batch_size: Number of rows per INSERT statement
+
+    Returns:
+        Number of users actually inserted
+    """
+    existing = User.objects.filter(email__in=[fields['email'] for fields in users])
+    with transaction.atomic():
+        before = existing.count()
+        User.objects.bulk_create(
+            [User(**fields) for fields in users],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+        return existing.count() - before
+
+
+def invalidate_executors_workload() -> None:
+    """Drop the cached executor directory after ticket counts change."""
+    caches[EXECUTORS_WORKLOAD_CACHE].delete(EXECUTORS_WORKLOAD_CACHE_KEY)
+
+
+def delete_user_in_batches(
+    *,
+    user_id: int,
+    batch_size: int = 1000,
+    on_progress: Callable[[str, int], None] | None = None,
+) -> dict[str, int]:
+    """
+    Delete a user and their tickets in small, separately committed batches.
+
+    Unlike User.delete(), which collects every related ticket and deletes
+    them in one transaction, this clears the user's executor and operator
+    references and deletes the created tickets batch by batch with
+    set-based queries and no per-object signals. The user is deactivated
+    first, so no new tickets appear meanwhile; an interrupted run is
+    resumed by calling it again.
+
+    Args:
+        user_id: ID of the user to delete
+        batch_size: Maximum number of tickets per batch
+        on_progress: Called with the stage name and the rows processed so far
+
+    Returns:
+        Number of processed tickets per stage
+
+    Raises:
+        NotFoundError: If the user does not exist
+    """
+    if not User.objects.filter(id=user_id).update(is_active=False):
+        raise NotFoundError('Пользователь не найден.')
+    on_progress = on_progress or (lambda stage, done: None)
+
+    stats = {}
+    clear = {
+        'assigned_to': {'assigned_to': None, 'assigned_to_snapshot': None},
+        'assigned_by': {'assigned_by': None},
+    }
+    for field, values in clear.items():
+        stage = f'{field}_cleared'
+        stats[stage] = _process_in_batches(
+            Ticket.objects.filter(**{f'{field}_id': user_id}),
+            lambda ids, values=values: _update_tickets(ids, values),
+            batch_size=batch_size,
+            on_progress=lambda done, stage=stage: on_progress(stage, done),
+        )
+    stats['tickets_deleted'] = _process_in_batches(
+        Ticket.objects.filter(created_by_id=user_id),
+        _delete_tickets,
+        batch_size=batch_size,
+        on_progress=lambda done: on_progress('tickets_deleted', done),
+    )
+
+    # Only small relations are left, so the regular cascade is cheap
+    User.objects.filter(id=user_id).delete()
+    if stats['assigned_to_cleared']:
+        invalidate_executors_workload()
+    return stats
+
+
+def _process_in_batches(
+    queryset: models.QuerySet,
+    process: Callable[[list], object],
+    *,
+    batch_size: int,
+    on_progress: Callable[[int], None],
+) -> int:
+    """Apply process() to the queryset's IDs batch by batch until none match."""
+    done = 0
+    while True:
+        with transaction.atomic():
+            ids = list(queryset.values_list('id', flat=True)[:batch_size])
+            if not ids:
+                return done
+            process(ids)
+        done += len(ids)
+        on_progress(done)
+
+
+def _update_tickets(ticket_ids: list[UUID], values: dict) -> None:
+    """Update tickets and drop their cached details once the batch commits."""
+    Ticket.objects.filter(id__in=ticket_ids).update(**values)
+    transaction.on_commit(lambda: invalidate_ticket_details(ticket_ids))
+
+
+def _delete_tickets(ticket_ids: list[UUID]) -> None:
+    """
+    Delete tickets and the rows depending on them with set-based queries.
+
+    Attachment content left without attachments is deleted as well, and
+    the tickets' cached details are dropped once the batch commits.
+    """
+    blob_ids = list(
+        Attachment.objects.filter(ticket_id__in=ticket_ids).values_list('blob_id', flat=True).distinct()
+    )
+    for relation in Ticket._meta.get_fields(include_hidden=True):
+        if not (relation.auto_created and not relation.concrete and (relation.one_to_many or relation.one_to_one)):
+            continue
+        related = relation.related_model._base_manager.filter(**{f'{relation.field.name}__in': ticket_ids})
+        if relation.on_delete is models.CASCADE:
+            related._raw_delete(related.db)
+        elif relation.on_delete is models.SET_NULL:
+            related.update(**{relation.field.name: None})
+        elif relation.on_delete is not models.DO_NOTHING:
+            raise ValueError(f'Unsupported on_delete of {relation.related_model.__name__}.{relation.field.name}')
+
+    tickets = Ticket._base_manager.filter(id__in=ticket_ids)
+    tickets._raw_delete(tickets.db)
+    if blob_ids:
+        delete_unreferenced_blobs(blob_ids)
+    transaction.on_commit(lambda: invalidate_ticket_details(ticket_ids))
+
+
+def revoke_token(*, jti: str, expires_at: datetime) -> bool:
+    """
+    Revoke a refresh token.
+
+    The unique token ID makes the insert the point where concurrent uses
+    of the same token are decided: only one of them revokes it.
+
+    Args:
+        jti: Token ID
+        expires_at: Token expiry; the row can be pruned after it
+
+    Returns:
+        True if the token was revoked now, False if it already was
+    """
+    try:
+        with transaction.atomic():
+            RevokedToken.objects.create(jti=jti, expires_at=expires_at)
+    except IntegrityError:
+        return False
+    transaction.on_commit(lambda: revocation_filter.add(jti))
+    return True
+
+
+def prune_revoked_tokens(
+    *,
+    batch_size: int = 10_000,
+    on_progress: Callable[[int], None] | None = None,
+) -> int:
+    """
+    Delete revocations of tokens that have expired anyway.
+
+    Args:
+        batch_size: Number of rows deleted per transaction
+        on_progress: Called with the number of rows deleted so far
+
+    Returns:
+        Number of deleted rows
+    """
+    expired = RevokedToken.objects.filter(expires_at__lte=timezone.now())
+    return _process_in_batches(
+        expired,
+        lambda ids: RevokedToken.objects.filter(id__in=ids).delete(),
+        batch_size=batch_size,
+        on_progress=on_progress or (lambda done: None),
+    )
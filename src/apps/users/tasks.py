@@ -0,0 +1,12 @@
+"""
+User background jobs.
+"""
+from apps.jobs.registry import register_job
+
+from .services import delete_user_in_batches
+
+
+@register_job('users.delete_user')
+def delete_user(*, user_id: int) -> dict[str, int]:
+    """Delete a user and their tickets in batches."""
+    return delete_user_in_batches(user_id=user_id)
@@ -3,7 +3,7 @@ User URL routes.
 """
 from django.urls import path
 
-from .views import LoginView, RegisterView, TokenRefreshAPIView
+from .views import LoginView, LogoutView, RegisterView, TokenRefreshAPIView
 
 app_name = 'users'
 
@@ -11,4 +11,5 @@ urlpatterns = [
     path('register/', RegisterView.as_view(), name='register'),
     path('login/', LoginView.as_view(), name='login'),
     path('refresh/', TokenRefreshAPIView.as_view(), name='token-refresh'),
+    path('logout/', LogoutView.as_view(), name='logout'),
 ]
@@ -9,13 +9,22 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
-from .serializers import UserRegisterSerializer, UserSerializer
+from .permissions import IsOperator
+from .selectors import get_executors_with_workload
+from .serializers import (
+    ExecutorWorkloadSerializer,
+    LogoutSerializer,
+    RevocableTokenRefreshSerializer,
+    UserRegisterSerializer,
+    UserSerializer,
+)
 
 
 class RegisterView(APIView):
     """API view for user registration."""
 
     permission_classes = [AllowAny]
+    throttle_scope = 'auth'
 
     @extend_schema(
         request=UserRegisterSerializer,
@@ -45,6 +54,8 @@ class RegisterView(APIView):
 class LoginView(TokenObtainPairView):
     """API view for JWT token obtaining (login)."""
 
+    throttle_scope = 'auth'
+
     @extend_schema(
         summary='Авторизация',
         description='Получение JWT токенов по email и паролю',
@@ -56,9 +67,69 @@ class LoginView(TokenObtainPairView):
 class TokenRefreshAPIView(TokenRefreshView):
     """API view for JWT token refresh."""
 
+    serializer_class = RevocableTokenRefreshSerializer
+    throttle_scope = 'auth'
+
     @extend_schema(
         summary='Обновление токена',
-        description='Обновление access токена по refresh токену',
+        description='Обновление access токена по refresh токену; использованный refresh токен отзывается',
     )
     def post(self, request: Request, *args, **kwargs) -> Response:
         return super().post(request, *args, **kwargs)
+
+
+class LogoutView(APIView):
+    """API view for refresh token revocation (logout)."""
+
+    permission_classes = [AllowAny]
+    throttle_scope = 'auth'
+
+    @extend_schema(
+        request=LogoutSerializer,
+        responses={204: None},
+        summary='Выход',
+        description='Отзыв refresh токена',
+    )
+    def post(self, request: Request) -> Response:
+        """
+        Revoke a refresh token.
+
+        Args:
+            request: HTTP request with the refresh token
+
+        Returns:
+            Empty response
+        """
+        serializer = LogoutSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ExecutorListView(APIView):
+    """API view for executor directory with workload."""
+
+    permission_classes = [IsOperator]
+    throttle_scope = 'users_read'
+
+    @extend_schema(
+        responses={200: ExecutorWorkloadSerializer(many=True)},
+        summary='Исполнители',
+        description=(
+            'Список активных исполнителей с количеством заявок в работе '
+            'и новых назначенных заявок (только для оператора)'
+        ),
+    )
+    def get(self, request: Request) -> Response:
+        """
+        Get active executors with their workload.
+
+        Args:
+            request: HTTP request
+
+        Returns:
+            Response with list of executors
+        """
+        executors = get_executors_with_workload()
+        serializer = ExecutorWorkloadSerializer(executors, many=True)
+        return Response(serializer.data)
@@ -0,0 +1,26 @@
+"""
+Webhook outbox admin configuration.
+"""
+from django.contrib import admin
+
+from .models import OutboxEvent
+
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    """Admin configuration for OutboxEvent model."""
+
+    list_display = [
+        'id',
+        'event_type',
+        'ticket_id',
+        'endpoint',
+        'status',
+        'attempts',
+        'created_at',
+        'delivered_at',
+    ]
+    list_filter = ['status', 'event_type']
+    search_fields = ['=ticket_id']
+    readonly_fields = ['created_at', 'delivered_at']
+    ordering = ['-id']
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class WebhooksConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.webhooks'
+    verbose_name = 'Вебхуки'
+
+    def ready(self) -> None:
+        # Register gauges before the first /metrics scrape
+        from . import metrics  # noqa: F401
@@ -0,0 +1,138 @@
+"""
+HTTP delivery of webhook events over pooled keep-alive connections.
+"""
+import hashlib
+import hmac
+import http.client
+import json
+import queue
+from urllib.parse import urlsplit
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .models import OutboxEvent
+
+
+class DeliveryError(Exception):
+    """Raised when an endpoint does not accept an event."""
+
+
+class ConnectionPool:
+    """
+    Keep-alive HTTP connections grouped by endpoint host.
+
+    Connections are reused between requests instead of doing a TCP (and
+    TLS) handshake per event. Each host keeps at most ``maxsize`` idle
+    connections.
+    """
+
+    def __init__(self, *, maxsize: int, timeout: float) -> None:
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._idle: dict[tuple, queue.LifoQueue] = {}
+
+    def _queue(self, key: tuple) -> queue.LifoQueue:
+        """Return the idle connection queue for a host."""
+        return self._idle.setdefault(key, queue.LifoQueue(self.maxsize))
+
+    def _connect(self, key: tuple) -> http.client.HTTPConnection:
+        """Open a new connection to a host."""
+        scheme, host, port = key
+        if scheme == 'https':
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def post(self, url: str, body: bytes, headers: dict) -> int:
+        """
+        Send a POST request, reusing an idle connection when possible.
+
+        A reused connection may have been closed by the server, so a request
+        that fails on it is retried once on a fresh connection.
+
+        Args:
+            url: Endpoint URL
+            body: Request body
+            headers: Request headers
+
+        Returns:
+            Response status code
+        """
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port)
+        path = parts.path or '/'
+        if parts.query:
+            path = f'{path}?{parts.query}'
+
+        idle = self._queue(key)
+        try:
+            connection, reused = idle.get_nowait(), True
+        except queue.Empty:
+            connection, reused = self._connect(key), False
+
+        while True:
+            try:
+                connection.request('POST', path, body=body, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                break
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                if not reused:
+                    raise
+                connection, reused = self._connect(key), False
+
+        if response.will_close:
+            connection.close()
+        else:
+            try:
+                idle.put_nowait(connection)
+            except queue.Full:
+                connection.close()
+        return response.status
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        for idle in self._idle.values():
+            while not idle.empty():
+                idle.get_nowait().close()
+
+
+def deliver_event(event: OutboxEvent, *, pool: ConnectionPool, secret: str = '') -> None:
+    """
+    Deliver an outbox event to its endpoint.
+
+    Args:
+        event: Outbox event
+        pool: Connection pool to send the request through
+        secret: Key for the X-Helpdesk-Signature HMAC header (not sent if empty)
+
+    Raises:
+        DeliveryError: If the URL is invalid, the request fails or the endpoint
+            responds with non-2xx
+    """
+    body = json.dumps(
+        {
+            'id': event.id,
+            'event': event.event_type,
+            'ticket_id': event.ticket_id,
+            'data': event.payload,
+        },
+        cls=DjangoJSONEncoder,
+    ).encode()
+    headers = {
+        'Content-Type': 'application/json',
+        'X-Helpdesk-Event': event.event_type,
+        'X-Helpdesk-Delivery': str(event.id),
+    }
+    if secret:
+        digest = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+        headers['X-Helpdesk-Signature'] = f'sha256={digest}'
+
+    try:
+        status_code = pool.post(event.endpoint, body, headers)
+    except (http.client.HTTPException, OSError, ValueError) as exc:
+        # ValueError: malformed endpoint URL, e.g. a bad port
+        raise DeliveryError(f'{type(exc).__name__}: {exc}') from exc
+
+    if not 200 <= status_code < 300:
+        raise DeliveryError(f'Endpoint responded with HTTP {status_code}')
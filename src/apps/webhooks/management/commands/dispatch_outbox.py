@@ -0,0 +1,76 @@
+"""
+Management command to deliver webhook outbox events.
+"""
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.webhooks.delivery import ConnectionPool
+from apps.webhooks.services import dispatch_outbox_batch
+
+
+class Command(BaseCommand):
+    """Drain the webhook outbox in batches."""
+
+    help = 'Delivers pending webhook events from the outbox to the configured endpoints'
+
+    def add_arguments(self, parser) -> None:
+        """Register command arguments."""
+        parser.add_argument('--batch-size', type=int, default=100)
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=8,
+            help='Maximum number of requests in flight',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=1.0,
+            help='Seconds to sleep when the outbox is empty',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit when there are no due events left',
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Execute the command."""
+        stopping = threading.Event()
+
+        def stop(signum, frame) -> None:
+            stopping.set()
+
+        signal.signal(signal.SIGINT, stop)
+        signal.signal(signal.SIGTERM, stop)
+
+        concurrency = options['concurrency']
+        pool = ConnectionPool(maxsize=concurrency, timeout=settings.WEBHOOK_TIMEOUT)
+        total = 0
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while not stopping.is_set():
+                delivered, failed = dispatch_outbox_batch(
+                    pool=pool,
+                    executor=executor,
+                    batch_size=options['batch_size'],
+                )
+                total += delivered
+                if delivered or failed:
+                    rate = total / (time.monotonic() - started)
+                    self.stdout.write(
+                        f'Delivered {delivered}, failed {failed} ({rate:.1f} events/s)'
+                    )
+                    continue
+
+                if options['once']:
+                    break
+                stopping.wait(options['poll_interval'])
+
+        pool.close()
+        self.stdout.write(self.style.SUCCESS(f'Outbox dispatcher stopped, {total} events delivered'))
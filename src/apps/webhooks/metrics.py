@@ -0,0 +1,12 @@
+"""
+Webhook outbox metrics.
+"""
+from core.metrics import Gauge
+
+from .selectors import get_pending_events_count
+
+OUTBOX_PENDING = Gauge(
+    'helpdesk_outbox_pending_events',
+    'Webhook events waiting for delivery',
+    collect=lambda: [((), get_pending_events_count())],
+)
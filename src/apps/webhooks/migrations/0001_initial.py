@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-19 18:30
+
+import django.core.serializers.json
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_type', models.CharField(max_length=50, verbose_name='Тип события')),
+                ('ticket_id', models.UUIDField(verbose_name='Заявка')),
+                ('endpoint', models.CharField(max_length=500, verbose_name='Адрес получателя')),
+                ('payload', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='Данные')),
+                ('status', models.CharField(choices=[('pending', 'Ожидает отправки'), ('delivered', 'Доставлено'), ('failed', 'Не доставлено')], default='pending', max_length=20, verbose_name='Статус')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Попыток')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Следующая попытка')),
+                ('last_error', models.TextField(blank=True, verbose_name='Последняя ошибка')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Дата создания')),
+                ('delivered_at', models.DateTimeField(blank=True, null=True, verbose_name='Дата доставки')),
+            ],
+            options={
+                'verbose_name': 'Событие вебхука',
+                'verbose_name_plural': 'События вебхуков',
+                'ordering': ['id'],
+                'indexes': [models.Index(condition=models.Q(('status', 'pending')), fields=['next_attempt_at'], name='webhooks_outbox_pending_idx'), models.Index(condition=models.Q(('status', 'pending')), fields=['endpoint', 'ticket_id', 'id'], name='webhooks_outbox_ticket_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,58 @@
+"""
+Webhook outbox models.
+"""
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+
+class OutboxStatus(models.TextChoices):
+    """Outbox event delivery status choices."""
+    PENDING = 'pending', 'Ожидает отправки'
+    DELIVERED = 'delivered', 'Доставлено'
+    FAILED = 'failed', 'Не доставлено'
+
+
+class OutboxEvent(models.Model):
+    """
+    Webhook notification written in the same transaction as the change.
+
+    One row is stored per configured endpoint. Events of a ticket are
+    delivered to an endpoint strictly in ID order.
+    """
+
+    event_type = models.CharField('Тип события', max_length=50)
+    ticket_id = models.UUIDField('Заявка')
+    endpoint = models.CharField('Адрес получателя', max_length=500)
+    payload = models.JSONField('Данные', encoder=DjangoJSONEncoder)
+    status = models.CharField(
+        'Статус',
+        max_length=20,
+        choices=OutboxStatus.choices,
+        default=OutboxStatus.PENDING,
+    )
+    attempts = models.PositiveIntegerField('Попыток', default=0)
+    next_attempt_at = models.DateTimeField('Следующая попытка', default=timezone.now)
+    last_error = models.TextField('Последняя ошибка', blank=True)
+    created_at = models.DateTimeField('Дата создания', auto_now_add=True)
+    delivered_at = models.DateTimeField('Дата доставки', null=True, blank=True)
+
+    class Meta:
+        verbose_name = 'Событие вебхука'
+        verbose_name_plural = 'События вебхуков'
+        ordering = ['id']
+        indexes = [
+            models.Index(
+                fields=['next_attempt_at'],
+                condition=models.Q(status=OutboxStatus.PENDING),
+                name='webhooks_outbox_pending_idx',
+            ),
+            models.Index(
+                fields=['endpoint', 'ticket_id', 'id'],
+                condition=models.Q(status=OutboxStatus.PENDING),
+                name='webhooks_outbox_ticket_idx',
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.event_type} {self.ticket_id} ({self.get_status_display()})'
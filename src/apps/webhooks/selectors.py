@@ -0,0 +1,14 @@
+"""
+Webhook outbox database query selectors.
+"""
+from .models import OutboxEvent, OutboxStatus
+
+
+def get_pending_events_count() -> int:
+    """
+    Get the number of outbox events not yet delivered.
+
+    Returns:
+        Number of pending events, including ones waiting for a retry
+    """
+    return OutboxEvent.objects.filter(status=OutboxStatus.PENDING).count()
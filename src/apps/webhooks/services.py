@@ -0,0 +1,137 @@
+"""
+Webhook outbox business logic services.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from uuid import UUID
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from .delivery import ConnectionPool, DeliveryError, deliver_event
+from .models import OutboxEvent, OutboxStatus
+
+
+def record_event(*, event_type: str, ticket_id: UUID, payload: dict) -> None:
+    """
+    Write an event to the outbox for every configured endpoint.
+
+    Must be called inside the transaction that makes the change, so the
+    event is stored if and only if the change is committed.
+
+    Args:
+        event_type: Event name, e.g. 'ticket.created'
+        ticket_id: UUID of the ticket the event belongs to
+        payload: JSON-serializable event data
+    """
+    record_events([(event_type, ticket_id, payload)])
+
+
+def record_events(events: list[tuple[str, UUID, dict]]) -> None:
+    """
+    Write several events to the outbox in one insert.
+
+    Same as record_event() for each of the (event_type, ticket_id, payload)
+    tuples, for changes made to many tickets at once.
+
+    Args:
+        events: Events in the order they happened
+    """
+    endpoints = settings.WEBHOOK_ENDPOINTS
+    if not endpoints or not events:
+        return
+
+    OutboxEvent.objects.bulk_create([
+        OutboxEvent(
+            event_type=event_type,
+            ticket_id=ticket_id,
+            endpoint=endpoint,
+            payload=payload,
+        )
+        for event_type, ticket_id, payload in events
+        for endpoint in endpoints
+    ])
+
+
+def dispatch_outbox_batch(
+    *,
+    pool: ConnectionPool,
+    executor: ThreadPoolExecutor,
+    batch_size: int,
+) -> tuple[int, int]:
+    """
+    Deliver a batch of due outbox events.
+
+    Events are locked with FOR UPDATE SKIP LOCKED for the duration of the
+    delivery, so several dispatchers can run side by side. An event is only
+    picked when no earlier event of the same ticket is pending for its
+    endpoint, which keeps per-ticket ordering even across dispatchers.
+    Events of different tickets are delivered concurrently.
+
+    Args:
+        pool: Keep-alive connection pool
+        executor: Thread pool bounding the delivery concurrency
+        batch_size: Maximum number of events to claim
+
+    Returns:
+        Tuple of (delivered, failed) event counts
+    """
+    earlier_pending = OutboxEvent.objects.filter(
+        endpoint=OuterRef('endpoint'),
+        ticket_id=OuterRef('ticket_id'),
+        status=OutboxStatus.PENDING,
+        id__lt=OuterRef('id'),
+    )
+    with transaction.atomic():
+        events = list(
+            OutboxEvent.objects.select_for_update(skip_locked=True)
+            .filter(status=OutboxStatus.PENDING, next_attempt_at__lte=timezone.now())
+            .exclude(Exists(earlier_pending))
+            .order_by('id')[:batch_size]
+        )
+        if not events:
+            return 0, 0
+
+        errors = executor.map(lambda event: _deliver(event, pool), events)
+        now = timezone.now()
+        delivered = 0
+        for event, error in zip(events, errors):
+            event.attempts += 1
+            event.last_error = error or ''
+            if error is None:
+                event.status = OutboxStatus.DELIVERED
+                event.delivered_at = now
+                delivered += 1
+            elif event.attempts >= settings.WEBHOOK_MAX_ATTEMPTS:
+                event.status = OutboxStatus.FAILED
+            else:
+                delay = min(
+                    settings.WEBHOOK_RETRY_BACKOFF * 2 ** (event.attempts - 1),
+                    settings.WEBHOOK_RETRY_BACKOFF_MAX,
+                )
+                event.next_attempt_at = now + timedelta(seconds=delay)
+
+        OutboxEvent.objects.bulk_update(
+            events,
+            ['status', 'attempts', 'next_attempt_at', 'delivered_at', 'last_error'],
+        )
+
+    return delivered, len(events) - delivered
+
+
+def _deliver(event: OutboxEvent, pool: ConnectionPool) -> str | None:
+    """
+    Deliver an event and return the error message if it failed.
+
+    Any exception is turned into a failed attempt of this event alone, so
+    one broken endpoint can't roll back the outcome of the whole batch.
+    """
+    try:
+        deliver_event(event, pool=pool, secret=settings.WEBHOOK_SECRET)
+    except DeliveryError as exc:
+        return str(exc)
+    except Exception as exc:
+        return f'{type(exc).__name__}: {exc}'
+    return None
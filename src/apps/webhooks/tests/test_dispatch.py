@@ -0,0 +1,141 @@
+"""
+Tests of outbox dispatch against a local stub receiver.
+"""
+import json
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.test import TestCase, override_settings
+
+from apps.webhooks.delivery import ConnectionPool
+from apps.webhooks.models import OutboxEvent, OutboxStatus
+from apps.webhooks.services import dispatch_outbox_batch
+
+
+class StubReceiver(ThreadingHTTPServer):
+    """Keep-alive HTTP server that records the events posted to it."""
+
+    daemon_threads = True
+
+    def __init__(self, *, delay: float = 0.0, status: int = 204) -> None:
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.delay = delay
+        self.status = status
+        self.received: list[dict] = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address
+        return f'http://{host}:{port}/hook'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Record the event and answer with the receiver's status."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        time.sleep(self.server.delay)
+        with self.server.lock:
+            self.server.received.append(body)
+        self.send_response(self.server.status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@override_settings(WEBHOOK_MAX_ATTEMPTS=3, WEBHOOK_RETRY_BACKOFF=0, WEBHOOK_RETRY_BACKOFF_MAX=0)
+class DispatchOutboxBatchTests(TestCase):
+    """dispatch_outbox_batch() with real HTTP deliveries."""
+
+    concurrency = 8
+
+    def setUp(self) -> None:
+        self.pool = ConnectionPool(maxsize=self.concurrency, timeout=5)
+        self.executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        self.addCleanup(self.pool.close)
+        self.addCleanup(self.executor.shutdown)
+
+    def start_receiver(self, **kwargs) -> StubReceiver:
+        receiver = StubReceiver(**kwargs)
+        threading.Thread(target=receiver.serve_forever, daemon=True).start()
+        self.addCleanup(receiver.server_close)
+        self.addCleanup(receiver.shutdown)
+        return receiver
+
+    def create_events(self, endpoint: str, ticket_ids: list[uuid.UUID], per_ticket: int = 1) -> None:
+        OutboxEvent.objects.bulk_create([
+            OutboxEvent(
+                event_type='ticket.updated',
+                ticket_id=ticket_id,
+                endpoint=endpoint,
+                payload={'sequence': sequence},
+            )
+            for sequence in range(per_ticket)
+            for ticket_id in ticket_ids
+        ])
+
+    def dispatch(self, batch_size: int = 100) -> tuple[int, int]:
+        return dispatch_outbox_batch(pool=self.pool, executor=self.executor, batch_size=batch_size)
+
+    def test_delivers_events_of_different_tickets_concurrently(self) -> None:
+        delay = 0.1
+        receiver = self.start_receiver(delay=delay)
+        self.create_events(receiver.url, [uuid.uuid4() for _ in range(self.concurrency * 2)])
+
+        started = time.perf_counter()
+        delivered, failed = self.dispatch()
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual((delivered, failed), (self.concurrency * 2, 0))
+        self.assertEqual(len(receiver.received), self.concurrency * 2)
+        # Two rounds of concurrent requests, not sixteen sequential ones
+        self.assertLess(elapsed, delay * 6)
+        self.assertFalse(OutboxEvent.objects.exclude(status=OutboxStatus.DELIVERED).exists())
+
+    def test_keeps_per_ticket_order(self) -> None:
+        receiver = self.start_receiver()
+        ticket_ids = [uuid.uuid4() for _ in range(4)]
+        self.create_events(receiver.url, ticket_ids, per_ticket=3)
+
+        rounds = 0
+        while OutboxEvent.objects.filter(status=OutboxStatus.PENDING).exists():
+            delivered, failed = self.dispatch()
+            # Only the earliest pending event of each ticket is picked
+            self.assertEqual((delivered, failed), (len(ticket_ids), 0))
+            rounds += 1
+
+        self.assertEqual(rounds, 3)
+        for ticket_id in ticket_ids:
+            received = [event for event in receiver.received if event['ticket_id'] == str(ticket_id)]
+            self.assertEqual([event['data']['sequence'] for event in received], [0, 1, 2])
+            self.assertEqual([event['id'] for event in received], sorted(event['id'] for event in received))
+
+    def test_failed_delivery_blocks_later_events_of_the_ticket(self) -> None:
+        receiver = self.start_receiver(status=500)
+        ticket_id = uuid.uuid4()
+        self.create_events(receiver.url, [ticket_id], per_ticket=2)
+
+        self.assertEqual(self.dispatch(), (0, 1))
+        first, second = OutboxEvent.objects.order_by('id')
+        self.assertEqual((first.status, first.attempts), (OutboxStatus.PENDING, 1))
+        self.assertIn('HTTP 500', first.last_error)
+        self.assertEqual(second.attempts, 0)
+
+    def test_invalid_endpoint_fails_only_its_event(self) -> None:
+        receiver = self.start_receiver()
+        self.create_events('http://127.0.0.1:99999/hook', [uuid.uuid4()])
+        self.create_events(receiver.url, [uuid.uuid4()])
+
+        self.assertEqual(self.dispatch(), (1, 1))
+        broken = OutboxEvent.objects.get(endpoint__contains='99999')
+        self.assertEqual((broken.status, broken.attempts), (OutboxStatus.PENDING, 1))
+        self.assertTrue(broken.last_error)
+        self.assertEqual(len(receiver.received), 1)
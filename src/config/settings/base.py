@@ -2,6 +2,7 @@
 Base Django settings for helpdesk project.
 """
 import os
+import tempfile
 from datetime import timedelta
 from pathlib import Path
 
@@ -16,23 +17,30 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'rest_framework_simplejwt',
     'django_filters',
     'drf_spectacular',
     'apps.users',
     'apps.tickets',
+    'apps.jobs',
+    'apps.webhooks',
+    'apps.attachments',
     'core',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.metrics.MetricsMiddleware',
+    'core.profiling.ProfilingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.identity_map.IdentityMapMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -76,7 +84,7 @@ AUTH_USER_MODEL = 'users.User'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'core.authentication.IdentityMapJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -85,11 +93,139 @@ REST_FRAMEWORK = {
         'django_filters.rest_framework.DjangoFilterBackend',
         'rest_framework.filters.OrderingFilter',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'core.pagination.EstimatedCountPagination',
     'PAGE_SIZE': 20,
+    'DEFAULT_THROTTLE_CLASSES': [
+        'core.throttling.RoleTokenBucketThrottle',
+    ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
 
+# Paginated lists use the planner's row estimate instead of COUNT(*)
+# once the estimate reaches this number of rows
+PAGINATION_ESTIMATE_THRESHOLD = 100_000
+PAGINATION_TABLE_ROWS_CACHE_TTL = 60  # seconds, per process
+
+# Per-process cache by default; 'shared' is one Redis for every worker, so
+# ticket transitions invalidate cached ticket details and executor
+# workloads everywhere.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ.get('REDIS_URL', 'redis://localhost:6379/0'),
+    },
+}
+EXECUTORS_WORKLOAD_CACHE_TTL = 10  # seconds
+TICKETS_DETAIL_CACHE_TTL = 300  # seconds
+TICKETS_BATCH_GET_MAX_IDS = 500
+
+# Serve ticket lists from the user snapshots stored on tickets instead of
+# joining users; run backfill_ticket_snapshots before enabling
+TICKETS_USER_SNAPSHOTS = os.environ.get('TICKETS_USER_SNAPSHOTS', '').lower() in ('1', 'true', 'yes')
+TICKETS_SNAPSHOT_BATCH_SIZE = 1000
+
+# Paginate ticket lists by keyset (?cursor=) with the ticket ID as
+# tiebreaker instead of page numbers with a total count
+TICKETS_KEYSET_PAGINATION = os.environ.get('TICKETS_KEYSET_PAGINATION', '').lower() in ('1', 'true', 'yes')
+
+# Escalation of stale tickets (escalate_tickets command or job): tickets new
+# for longer than TICKETS_ESCALATION_NEW_SLA since creation, or in progress
+# without changes for TICKETS_ESCALATION_IN_PROGRESS_SLA, get their priority
+# raised one step, once per SLA period, until it is high
+TICKETS_ESCALATION_NEW_SLA = 4 * 3600  # seconds
+TICKETS_ESCALATION_IN_PROGRESS_SLA = 24 * 3600  # seconds
+TICKETS_ESCALATION_BATCH_SIZE = 500
+
+# Duplicate lookup on ticket creation (PostgreSQL): open tickets of the same
+# creator or created by anyone within the window, similar by title (pg_trgm)
+# and, with TICKETS_DUPLICATE_MINHASH, by description (MinHash)
+TICKETS_DUPLICATE_DETECTION = True
+TICKETS_DUPLICATE_WINDOW = 24 * 3600  # seconds
+TICKETS_DUPLICATE_TITLE_SIMILARITY = 0.5
+TICKETS_DUPLICATE_MINHASH = os.environ.get('TICKETS_DUPLICATE_MINHASH', '').lower() in ('1', 'true', 'yes')
+TICKETS_DUPLICATE_DESCRIPTION_SIMILARITY = 0.6
+TICKETS_DUPLICATE_LIMIT = 5
+
+# Token bucket limits per endpoint class (view's throttle_scope) and role
+THROTTLE_RATES = {
+    'auth': {
+        'anon': '20/min',
+    },
+    'users_read': {
+        'operator': '300/min',
+    },
+    'tickets_read': {
+        'applicant': '60/min',
+        'operator': '300/min',
+        'executor': '120/min',
+    },
+    'tickets_write': {
+        'applicant': '20/min',
+        'operator': '120/min',
+        'executor': '120/min',
+    },
+    'attachments_read': {
+        'applicant': '60/min',
+        'operator': '300/min',
+        'executor': '120/min',
+    },
+    'attachments_write': {
+        'applicant': '10/min',
+        'operator': '60/min',
+        'executor': '60/min',
+    },
+}
+THROTTLE_STORE_PATH = os.environ.get(
+    'THROTTLE_STORE_PATH',
+    os.path.join(tempfile.gettempdir(), 'helpdesk-throttle.bin'),
+)
+THROTTLE_STORE_SLOTS = 65536
+
+# On-demand request profiling (core.profiling)
+PROFILING_SAMPLE_RATE = float(os.environ.get('PROFILING_SAMPLE_RATE', '0'))
+PROFILING_INTERVAL = 0.005  # seconds between stack samples
+PROFILING_TOKEN_MAX_AGE = 3600  # seconds an X-Profile token stays valid
+PROFILING_DIR = os.environ.get(
+    'PROFILING_DIR',
+    os.path.join(tempfile.gettempdir(), 'helpdesk-profiles'),
+)
+PROFILING_MAX_PROFILES = 200
+
+# Prometheus metrics (core.metrics); every worker process writes its own
+# file in METRICS_DIR, which should be emptied when the service starts
+METRICS_DIR = os.environ.get(
+    'METRICS_DIR',
+    os.path.join(tempfile.gettempdir(), 'helpdesk-metrics'),
+)
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+# Ticket attachments (apps.attachments)
+ATTACHMENTS_ROOT = os.environ.get('ATTACHMENTS_ROOT', str(BASE_DIR.parent / 'attachments'))
+ATTACHMENTS_MAX_SIZE = int(os.environ.get('ATTACHMENTS_MAX_SIZE', 100 * 1024 * 1024))
+# Internal nginx location aliased to ATTACHMENTS_ROOT; empty to send files from Django
+ATTACHMENTS_ACCEL_REDIRECT_PREFIX = os.environ.get('ATTACHMENTS_ACCEL_REDIRECT_PREFIX', '')
+
+# Stored responses of requests with an Idempotency-Key header (core.idempotency)
+IDEMPOTENCY_KEY_TTL = 24 * 3600  # seconds
+
+# Background job queue (apps.jobs)
+JOBS_MAX_ATTEMPTS = 5
+JOBS_RETRY_BACKOFF = 10  # seconds, doubled on every failed attempt
+JOBS_RETRY_BACKOFF_MAX = 3600
+JOBS_LOCK_TIMEOUT = 600  # running jobs whose lock isn't renewed for this long are requeued
+JOBS_HEARTBEAT_INTERVAL = 60  # seconds between lock renewals of running jobs
+
+# Webhook outbox (apps.webhooks)
+WEBHOOK_ENDPOINTS = [url for url in os.environ.get('WEBHOOK_URLS', '').split(',') if url]
+WEBHOOK_SECRET = os.environ.get('WEBHOOK_SECRET', '')
+WEBHOOK_TIMEOUT = 5
+WEBHOOK_MAX_ATTEMPTS = 10
+WEBHOOK_RETRY_BACKOFF = 5  # seconds, doubled on every failed attempt
+WEBHOOK_RETRY_BACKOFF_MAX = 3600
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=1),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
@@ -97,9 +233,17 @@ SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('Bearer',),
 }
 
+# Revoked refresh tokens (apps.users.revocation): per-worker Bloom filter
+TOKEN_REVOCATION_REFRESH_INTERVAL = 1.0  # seconds between incremental reloads
+TOKEN_REVOCATION_CAPACITY = 100_000  # initial filter size, grown on rebuild
+TOKEN_REVOCATION_ERROR_RATE = 0.001  # share of checks confirmed in the DB needlessly
+
 SPECTACULAR_SETTINGS = {
     'TITLE': 'Helpdesk API',
     'DESCRIPTION': 'Internal helpdesk backend service',
     'VERSION': '1.0.0',
     'SERVE_INCLUDE_SCHEMA': False,
 }
+
+# Prebuilt schema served at /api/schema/ (manage.py openapi_schema)
+OPENAPI_SCHEMA_PATH = BASE_DIR / 'openapi' / f'schema-{SPECTACULAR_SETTINGS["VERSION"]}.yaml'
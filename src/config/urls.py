@@ -3,13 +3,21 @@ URL configuration for helpdesk project.
 """
 from django.contrib import admin
 from django.urls import include, path
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+from drf_spectacular.views import SpectacularSwaggerView
+
+from apps.users.views import ExecutorListView
+from core.metrics import MetricsView
+from core.schema import PrebuiltSchemaView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/auth/', include('apps.users.urls')),
+    path('api/users/executors/', ExecutorListView.as_view(), name='executor-list'),
     path('api/tickets/', include('apps.tickets.urls')),
+    path('api/jobs/', include('apps.jobs.urls')),
+    path('api/', include('apps.attachments.urls')),
+    path('metrics', MetricsView.as_view(), name='metrics'),
     # API Documentation
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
+    path('api/schema/', PrebuiltSchemaView.as_view(), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
 ]
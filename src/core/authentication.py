@@ -0,0 +1,17 @@
+"""
+Authentication classes.
+"""
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import Token
+
+from .identity_map import get_identity_map
+
+
+class IdentityMapJWTAuthentication(JWTAuthentication):
+    """JWT authentication that shares the loaded user with the identity map."""
+
+    def get_user(self, validated_token: Token):
+        """Load the token's user and prime the request's identity map with it."""
+        user = super().get_user(validated_token)
+        get_identity_map().prime(user)
+        return user
@@ -55,3 +55,24 @@ class TicketNotYoursError(PermissionDeniedError):
     """Exception when trying to modify someone else's ticket."""
     default_detail = 'Эта заявка не назначена вам.'
     default_code = 'ticket_not_yours'
+
+
+class AttachmentTooLargeError(ApplicationError):
+    """Exception when an uploaded attachment exceeds the size limit."""
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = 'Файл превышает допустимый размер.'
+    default_code = 'attachment_too_large'
+
+
+class TokenRevokedError(ApplicationError):
+    """Exception when a revoked refresh token is used."""
+    status_code = status.HTTP_401_UNAUTHORIZED
+    default_detail = 'Токен отозван.'
+    default_code = 'token_revoked'
+
+
+class IdempotencyKeyReusedError(ApplicationError):
+    """Exception when an idempotency key is reused for a different request."""
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = 'Ключ идемпотентности уже использован для другого запроса.'
+    default_code = 'idempotency_key_reused'
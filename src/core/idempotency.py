@@ -0,0 +1,120 @@
+"""
+Idempotency-Key support for write endpoints.
+
+A request sent with an Idempotency-Key header runs in one transaction with
+the user's key row, locked for its duration, and its successful response
+is stored in the same transaction. Retries with the same key get the
+stored response without running the view again; a concurrent duplicate
+waits on the key's lock and then gets the stored response too. Failed
+requests roll the key back, so they can be retried. Keys expire after
+IDEMPOTENCY_KEY_TTL seconds.
+"""
+import functools
+import hashlib
+import json
+from collections.abc import Callable
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from .exceptions import IdempotencyKeyReusedError, ValidationError
+from .models import IdempotencyKey
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+
+IDEMPOTENCY_KEY_PARAMETER = OpenApiParameter(
+    name=IDEMPOTENCY_HEADER,
+    location=OpenApiParameter.HEADER,
+    required=False,
+    description=(
+        'Уникальный ключ запроса: повторный запрос с тем же ключом возвращает '
+        'сохранённый ответ первого без повторного выполнения'
+    ),
+)
+
+
+def _fingerprint(request: Request) -> str:
+    """Hash the request's method, path and data."""
+    data = json.dumps(request.data, sort_keys=True, cls=DjangoJSONEncoder)
+    return hashlib.sha256(f'{request.method} {request.path}\n{data}'.encode()).hexdigest()
+
+
+def idempotent(handler: Callable) -> Callable:
+    """
+    Make a view handler replay its first successful response per Idempotency-Key.
+
+    Requests without the header are handled as usual.
+
+    Raises:
+        ValidationError: If the header value is empty or too long
+        IdempotencyKeyReusedError: If the key was used for a different request
+    """
+    @functools.wraps(handler)
+    def wrapper(view, request: Request, *args, **kwargs) -> Response:
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if key is None:
+            return handler(view, request, *args, **kwargs)
+        if not key or len(key) > IdempotencyKey._meta.get_field('key').max_length:
+            raise ValidationError(f'Некорректный заголовок {IDEMPOTENCY_HEADER}.')
+
+        fingerprint = _fingerprint(request)
+        now = timezone.now()
+        with transaction.atomic():
+            record, created = IdempotencyKey.objects.select_for_update().get_or_create(
+                user=request.user,
+                key=key,
+                defaults={
+                    'fingerprint': fingerprint,
+                    'expires_at': now + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL),
+                },
+            )
+            if not created and record.expires_at <= now:
+                record.fingerprint = fingerprint
+                record.status_code = None
+                record.response_body = None
+                record.expires_at = now + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL)
+
+            if record.fingerprint != fingerprint:
+                raise IdempotencyKeyReusedError()
+            if record.status_code is not None:
+                response = Response(record.response_body, status=record.status_code)
+                response[REPLAYED_HEADER] = 'true'
+                return response
+
+            response = handler(view, request, *args, **kwargs)
+            if not 200 <= response.status_code < 300:
+                transaction.set_rollback(True)
+                return response
+            record.status_code = response.status_code
+            record.response_body = response.data
+            record.save()
+        return response
+
+    return wrapper
+
+
+def prune_idempotency_keys(*, batch_size: int = 10_000) -> int:
+    """
+    Delete expired idempotency keys in batches.
+
+    Args:
+        batch_size: Number of rows deleted per transaction
+
+    Returns:
+        Number of deleted rows
+    """
+    deleted = 0
+    expired = IdempotencyKey.objects.filter(expires_at__lte=timezone.now())
+    while True:
+        with transaction.atomic():
+            ids = list(expired.values_list('id', flat=True)[:batch_size])
+            if not ids:
+                return deleted
+            deleted += IdempotencyKey.objects.filter(id__in=ids).delete()[0]
@@ -0,0 +1,101 @@
+"""
+Request-scoped identity map for model instances.
+
+Selectors, serializers and services that run within one request share a
+single map, so every row is fetched at most once per request and the same
+primary key always resolves to the same instance. Outside of a request
+(management commands, background jobs) each lookup gets a fresh map and
+nothing is memoized.
+"""
+from collections.abc import Iterable
+from contextvars import ContextVar
+from typing import Any
+
+from django.db import models
+from django.http import HttpRequest, HttpResponse
+
+_current: ContextVar['IdentityMap | None'] = ContextVar('identity_map', default=None)
+
+
+class IdentityMap:
+    """Memoizes model instances by primary key and batches their loading."""
+
+    def __init__(self) -> None:
+        self._objects: dict[tuple[type[models.Model], Any], models.Model | None] = {}
+
+    def _key(self, model: type[models.Model], pk: Any) -> tuple[type[models.Model], Any]:
+        """Return the map key for a model and primary key value."""
+        concrete_model = model._meta.concrete_model
+        return concrete_model, concrete_model._meta.pk.to_python(pk)
+
+    def get(self, model: type[models.Model], pk: Any) -> models.Model | None:
+        """
+        Get an instance by primary key.
+
+        Args:
+            model: Model class
+            pk: Primary key value
+
+        Returns:
+            Model instance or None if no such row exists
+        """
+        return self.get_many(model, [pk]).get(self._key(model, pk)[1])
+
+    def get_many(self, model: type[models.Model], pks: Iterable[Any]) -> dict[Any, models.Model]:
+        """
+        Get instances by primary keys, loading unknown ones in one query.
+
+        Args:
+            model: Model class
+            pks: Primary key values
+
+        Returns:
+            Dict of found instances keyed by primary key
+        """
+        keys = {self._key(model, pk) for pk in pks if pk is not None}
+        missing = [pk for key_model, pk in keys if (key_model, pk) not in self._objects]
+        if missing:
+            loaded = model._default_manager.in_bulk(missing)
+            for pk in missing:
+                self._objects[self._key(model, pk)] = loaded.get(pk)
+
+        return {
+            pk: self._objects[(key_model, pk)]
+            for key_model, pk in keys
+            if self._objects[(key_model, pk)] is not None
+        }
+
+    def prime(self, *instances: models.Model | None) -> None:
+        """
+        Add already loaded instances to the map.
+
+        Args:
+            *instances: Model instances; None values are ignored
+        """
+        for instance in instances:
+            if instance is not None:
+                self._objects[self._key(type(instance), instance.pk)] = instance
+
+
+def get_identity_map() -> IdentityMap:
+    """
+    Get the identity map of the current request.
+
+    Returns:
+        Request's identity map, or a new empty map outside of a request
+    """
+    return _current.get() or IdentityMap()
+
+
+class IdentityMapMiddleware:
+    """Install a fresh identity map for the duration of each request."""
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        token = _current.set(IdentityMap())
+        try:
+            return self.get_response(request)
+        finally:
+            _current.reset(token)
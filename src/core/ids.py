@@ -0,0 +1,64 @@
+"""
+Time-ordered UUIDv7 identifiers (RFC 9562).
+
+A UUIDv7 starts with the 48-bit Unix time in milliseconds, so new keys
+land on the rightmost page of a B-tree index instead of a random one:
+inserts touch few pages, stay in cache and write less WAL than with
+UUIDv4. The 12 bits after the version carry sub-millisecond time
+(RFC 9562, method 3) and are bumped when needed, so IDs generated by one
+process are strictly increasing; the remaining 62 bits are random.
+
+Both versions are ordinary UUIDs, so existing v4 keys stay valid.
+"""
+import hashlib
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+
+_lock = threading.Lock()
+_last_timestamp = 0
+
+
+def _build(timestamp: int, random_bits: int) -> uuid.UUID:
+    """Assemble a UUIDv7 from a 60-bit timestamp (ms << 12 | fraction) and 62 random bits."""
+    value = (timestamp >> 12) << 80
+    value |= 0x7 << 76 | (timestamp & 0xFFF) << 64
+    value |= 0b10 << 62 | random_bits
+    return uuid.UUID(int=value)
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a new UUIDv7.
+
+    Returns:
+        UUID greater than any other generated by this process
+    """
+    global _last_timestamp
+    nanoseconds = time.time_ns()
+    timestamp = (nanoseconds // 1_000_000) << 12 | (nanoseconds % 1_000_000) * 4096 // 1_000_000
+    with _lock:
+        timestamp = max(timestamp, _last_timestamp + 1)
+        _last_timestamp = timestamp
+    return _build(timestamp, int.from_bytes(os.urandom(8), 'big') >> 2)
+
+
+def uuid7_at(moment: datetime, name: str) -> uuid.UUID:
+    """
+    Derive a UUIDv7 for a past moment deterministically from a name.
+
+    Used for imported rows: the same input row always gets the same ID,
+    and IDs follow the rows' creation time.
+
+    Args:
+        moment: Timestamp encoded in the ID
+        name: Unique name the random bits are hashed from
+
+    Returns:
+        UUIDv7 with the millisecond of the moment
+    """
+    milliseconds = int(moment.timestamp() * 1000)
+    digest = int.from_bytes(hashlib.blake2b(name.encode(), digest_size=10).digest(), 'big')
+    return _build(milliseconds << 12 | digest >> 68, digest & ((1 << 62) - 1))
@@ -0,0 +1,109 @@
+"""
+Management command to benchmark inserts with random and time-ordered UUID keys.
+"""
+import io
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from core.ids import uuid7
+
+GENERATORS = {
+    'v4': uuid.uuid4,
+    'v7': uuid7,
+}
+
+
+class Command(BaseCommand):
+    """Insert rows keyed by UUIDv4 and UUIDv7 and compare throughput, index size and WAL."""
+
+    help = (
+        'Loads the same number of rows into two tables with UUIDv4 and UUIDv7 primary keys '
+        'and reports insert throughput, primary key index size and WAL volume. Requires PostgreSQL'
+    )
+
+    def add_arguments(self, parser) -> None:
+        """Register command arguments."""
+        parser.add_argument('--rows', type=int, default=20_000_000)
+        parser.add_argument('--batch-size', type=int, default=100_000)
+        parser.add_argument('--report-every', type=int, default=2_000_000, help='Rows between progress lines')
+        parser.add_argument('--keep', action='store_true', help='Do not drop benchmark tables')
+
+    def handle(self, *args, **options) -> None:
+        """Execute the command."""
+        if connection.vendor != 'postgresql':
+            raise CommandError('The benchmark requires PostgreSQL')
+
+        run_id = uuid.uuid4().hex[:8]
+        tables = {version: f'bench_uuid_{version}_{run_id}' for version in GENERATORS}
+        results = {}
+        try:
+            for version, table in tables.items():
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f'CREATE TABLE {table} ('
+                        f'id uuid PRIMARY KEY, created_at timestamptz NOT NULL DEFAULT now(), payload text)'
+                    )
+                self.stdout.write(f'\n{version}:')
+                self.stdout.write(f'{"rows":>12} {"rows/s":>10} {"index MB":>10} {"WAL MB":>10}')
+                results[version] = self._load(table, GENERATORS[version], options)
+
+            self.stdout.write(f'\n{"":<20} {"v4":>12} {"v7":>12}')
+            for label, key, unit in [
+                ('rows/s', 'rate', 1),
+                ('index size, MB', 'index_size', 2 ** 20),
+                ('table size, MB', 'table_size', 2 ** 20),
+                ('WAL, MB', 'wal', 2 ** 20),
+            ]:
+                self.stdout.write(
+                    f'{label:<20} {results["v4"][key] / unit:>12.0f} {results["v7"][key] / unit:>12.0f}'
+                )
+        finally:
+            if not options['keep']:
+                with connection.cursor() as cursor:
+                    for table in tables.values():
+                        cursor.execute(f'DROP TABLE IF EXISTS {table}')
+
+    def _load(self, table: str, generate, options: dict) -> dict:
+        """COPY rows in batches; only database time is measured, not key generation."""
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_current_wal_lsn()')
+            wal_start = cursor.fetchone()[0]
+
+        elapsed = 0.0
+        interval_rows, interval_elapsed = 0, 0.0
+        loaded = 0
+        while loaded < options['rows']:
+            size = min(options['batch_size'], options['rows'] - loaded)
+            buffer = io.StringIO(''.join(f'{generate()}\tpayload {loaded + n}\n' for n in range(size)))
+            started = time.perf_counter()
+            with connection.cursor() as cursor:
+                cursor.copy_expert(f'COPY {table} (id, payload) FROM STDIN', buffer)
+            batch_elapsed = time.perf_counter() - started
+            elapsed += batch_elapsed
+            interval_elapsed += batch_elapsed
+            interval_rows += size
+            loaded += size
+
+            if interval_rows >= options['report_every'] or loaded == options['rows']:
+                stats = self._stats(table, wal_start)
+                self.stdout.write(
+                    f'{loaded:>12} {interval_rows / interval_elapsed:>10.0f} '
+                    f'{stats["index_size"] / 2 ** 20:>10.0f} {stats["wal"] / 2 ** 20:>10.0f}'
+                )
+                interval_rows, interval_elapsed = 0, 0.0
+
+        return {'rate': loaded / elapsed, **self._stats(table, wal_start)}
+
+    def _stats(self, table: str, wal_start: str) -> dict:
+        """Return primary key index size, table size and WAL written since the start."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT pg_relation_size(%s), pg_relation_size(%s), '
+                'pg_wal_lsn_diff(pg_current_wal_lsn(), %s)',
+                [f'{table}_pkey', table, wal_start],
+            )
+            index_size, table_size, wal = cursor.fetchone()
+        return {'index_size': index_size, 'table_size': table_size, 'wal': int(wal)}
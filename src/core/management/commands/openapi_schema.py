@@ -0,0 +1,38 @@
+"""
+Management command to build or verify the prebuilt OpenAPI schema.
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from core.schema import generate_schema, get_schema_path
+
+
+class Command(BaseCommand):
+    """Write the OpenAPI schema artifact or check that it is up to date."""
+
+    help = 'Generates the OpenAPI schema artifact served at /api/schema/'
+
+    def add_arguments(self, parser) -> None:
+        """Register command arguments."""
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Fail if the artifact does not match the current code',
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Execute the command."""
+        path = get_schema_path()
+        schema = generate_schema()
+
+        if options['check']:
+            if not path.exists() or path.read_bytes() != schema:
+                raise CommandError(
+                    f'OpenAPI schema artifact {path} is outdated, '
+                    f'run "manage.py openapi_schema" to rebuild it'
+                )
+            self.stdout.write(self.style.SUCCESS(f'OpenAPI schema artifact {path} is up to date'))
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(schema)
+        self.stdout.write(self.style.SUCCESS(f'OpenAPI schema written to {path}'))
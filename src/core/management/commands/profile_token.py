@@ -0,0 +1,21 @@
+"""
+Management command to issue a request profiling token.
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.profiling import PROFILE_HEADER, make_profile_token
+
+
+class Command(BaseCommand):
+    """Print a signed token for the X-Profile request header."""
+
+    help = 'Issues a signed token that enables profiling of requests carrying it'
+
+    def handle(self, *args, **options) -> None:
+        """Execute the command."""
+        self.stdout.write(f'{PROFILE_HEADER}: {make_profile_token()}')
+        self.stderr.write(
+            f'Valid for {settings.PROFILING_TOKEN_MAX_AGE}s, '
+            f'profiles are written to {settings.PROFILING_DIR}'
+        )
@@ -0,0 +1,21 @@
+"""
+Management command to delete expired idempotency keys.
+"""
+from django.core.management.base import BaseCommand
+
+from core.idempotency import prune_idempotency_keys
+
+
+class Command(BaseCommand):
+    """Delete idempotency keys past their TTL in batches."""
+
+    help = 'Deletes expired idempotency keys; run periodically, e.g. from cron'
+
+    def add_arguments(self, parser) -> None:
+        """Register command arguments."""
+        parser.add_argument('--batch-size', type=int, default=10_000)
+
+    def handle(self, *args, **options) -> None:
+        """Execute the command."""
+        deleted = prune_idempotency_keys(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} expired idempotency keys'))
@@ -0,0 +1,383 @@
+"""
+Prometheus-style metrics aggregated across worker processes.
+
+Every process writes its counter and histogram samples to its own
+memory-mapped file in METRICS_DIR; the /metrics endpoint sums the samples
+of all files, so the numbers cover every gunicorn worker regardless of
+which one serves the scrape. Recording a sample is a dict lookup and a
+struct write into the mapped file, without system calls.
+
+Gauges are computed at scrape time by a callback, e.g. queue depths read
+from the database. Apps declare their metrics in a metrics.py module,
+which the app imports in AppConfig.ready(), so every metric is registered
+before the first scrape.
+"""
+import bisect
+import hmac
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+
+HEADER = struct.Struct('<Q')
+KEY_LENGTH = struct.Struct('<I')
+VALUE = struct.Struct('<d')
+INITIAL_FILE_SIZE = 1 << 20
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Sample = tuple[str, tuple[str, ...]]
+
+
+class MmapSamples:
+    """
+    Append-only table of named float samples in a memory-mapped file.
+
+    The file starts with the number of used bytes, followed by entries of
+    a key length, a JSON-encoded key and an 8-byte aligned double value.
+    Only the owning process writes to the file; readers see an entry once
+    the used size covers it.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._positions: dict[Sample, int] = {}
+        self._lock = threading.Lock()
+
+        self._file = open(path, 'a+b')
+        if os.fstat(self._file.fileno()).st_size == 0:
+            self._file.truncate(INITIAL_FILE_SIZE)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._used = HEADER.unpack_from(self._map, 0)[0] or HEADER.size
+        HEADER.pack_into(self._map, 0, self._used)
+        for sample, position in _read_entries(self._map, self._used):
+            self._positions[sample] = position
+
+    def inc(self, sample: Sample, amount: float) -> None:
+        """
+        Add an amount to a sample, creating it if needed.
+
+        Args:
+            sample: Tuple of (sample name, label values)
+            amount: Value to add
+        """
+        with self._lock:
+            position = self._positions.get(sample)
+            if position is None:
+                position = self._append(sample)
+            value = VALUE.unpack_from(self._map, position)[0]
+            VALUE.pack_into(self._map, position, value + amount)
+
+    def _append(self, sample: Sample) -> int:
+        """Write a new zero-valued entry and return its value position."""
+        key = json.dumps([sample[0], list(sample[1])]).encode()
+        padding = -(KEY_LENGTH.size + len(key)) % 8
+        size = KEY_LENGTH.size + len(key) + padding + VALUE.size
+        if self._used + size > len(self._map):
+            new_size = max(len(self._map) * 2, self._used + size)
+            self._map.close()
+            self._file.truncate(new_size)
+            self._map = mmap.mmap(self._file.fileno(), 0)
+
+        position = self._used + KEY_LENGTH.size + len(key) + padding
+        KEY_LENGTH.pack_into(self._map, self._used, len(key))
+        self._map[self._used + KEY_LENGTH.size:self._used + KEY_LENGTH.size + len(key)] = key
+        VALUE.pack_into(self._map, position, 0.0)
+        self._used += size
+        HEADER.pack_into(self._map, 0, self._used)
+        self._positions[sample] = position
+        return position
+
+
+def _read_entries(data, used: int) -> Iterable[tuple[Sample, int]]:
+    """Yield (sample, value position) pairs of a samples file."""
+    offset = HEADER.size
+    while offset < used:
+        key_length = KEY_LENGTH.unpack_from(data, offset)[0]
+        name, labels = json.loads(bytes(data[offset + KEY_LENGTH.size:offset + KEY_LENGTH.size + key_length]))
+        padding = -(KEY_LENGTH.size + key_length) % 8
+        position = offset + KEY_LENGTH.size + key_length + padding
+        yield (name, tuple(labels)), position
+        offset = position + VALUE.size
+
+
+def read_samples(directory: Path) -> dict[Sample, float]:
+    """
+    Sum the samples of all worker files in a directory.
+
+    Args:
+        directory: METRICS_DIR
+
+    Returns:
+        Dict of summed values keyed by (sample name, label values)
+    """
+    totals: dict[Sample, float] = defaultdict(float)
+    for path in directory.glob('*.db'):
+        data = path.read_bytes()
+        if len(data) < HEADER.size:
+            continue
+        used = min(HEADER.unpack_from(data, 0)[0], len(data))
+        for sample, position in _read_entries(data, used):
+            totals[sample] += VALUE.unpack_from(data, position)[0]
+    return totals
+
+
+_samples: MmapSamples | None = None
+_samples_pid: int | None = None
+_samples_lock = threading.Lock()
+
+
+def _get_samples() -> MmapSamples:
+    """Get the samples file of the current process, opening it after fork."""
+    global _samples, _samples_pid
+    if _samples_pid != os.getpid():
+        with _samples_lock:
+            if _samples_pid != os.getpid():
+                directory = Path(settings.METRICS_DIR)
+                directory.mkdir(parents=True, exist_ok=True)
+                _samples = MmapSamples(directory / f'worker-{os.getpid()}.db')
+                _samples_pid = os.getpid()
+    return _samples
+
+
+_registry: list['Metric'] = []
+
+
+class Metric:
+    """Base class of a metric family."""
+
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        _registry.append(self)
+
+    def render(self, samples: dict[Sample, float]) -> list[str]:
+        """Return the exposition lines of the family."""
+        raise NotImplementedError
+
+    def _line(self, name: str, labelnames: tuple[str, ...], labelvalues: tuple[str, ...], value: float) -> str:
+        """Format one sample line."""
+        if labelnames:
+            labels = ','.join(
+                f'{label}="{_escape(labelvalue)}"' for label, labelvalue in zip(labelnames, labelvalues)
+            )
+            name = f'{name}{{{labels}}}'
+        return f'{name} {value!r}'
+
+
+class Counter(Metric):
+    """Monotonically increasing counter."""
+
+    kind = 'counter'
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        """
+        Increment the counter.
+
+        Args:
+            *labelvalues: Values of the counter's labels, in order
+            amount: Value to add
+        """
+        _get_samples().inc((self.name, labelvalues), amount)
+
+    def render(self, samples: dict[Sample, float]) -> list[str]:
+        """Return the exposition lines of the counter."""
+        return [
+            self._line(self.name, self.labelnames, labelvalues, value)
+            for (name, labelvalues), value in sorted(samples.items())
+            if name == self.name
+        ]
+
+
+class Histogram(Metric):
+    """Histogram with fixed buckets."""
+
+    kind = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        self._bucket_labels = tuple('+Inf' if b == float('inf') else repr(b) for b in self.buckets)
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """
+        Record an observation.
+
+        Buckets are stored non-cumulatively and summed up when rendered.
+
+        Args:
+            value: Observed value
+            *labelvalues: Values of the histogram's labels, in order
+        """
+        samples = _get_samples()
+        bucket = self._bucket_labels[bisect.bisect_left(self.buckets, value)]
+        samples.inc((f'{self.name}_bucket', labelvalues + (bucket,)), 1.0)
+        samples.inc((f'{self.name}_sum', labelvalues), value)
+        samples.inc((f'{self.name}_count', labelvalues), 1.0)
+
+    def render(self, samples: dict[Sample, float]) -> list[str]:
+        """Return the exposition lines of the histogram."""
+        buckets: dict[tuple[str, ...], dict[str, float]] = defaultdict(dict)
+        for (name, labelvalues), value in samples.items():
+            if name == f'{self.name}_bucket':
+                buckets[labelvalues[:-1]][labelvalues[-1]] = value
+
+        lines = []
+        bucket_labelnames = self.labelnames + ('le',)
+        for labelvalues in sorted(buckets):
+            cumulative = 0.0
+            for bucket in self._bucket_labels:
+                cumulative += buckets[labelvalues].get(bucket, 0.0)
+                lines.append(self._line(
+                    f'{self.name}_bucket', bucket_labelnames, labelvalues + (bucket,), cumulative,
+                ))
+            for suffix in ('_sum', '_count'):
+                value = samples.get((f'{self.name}{suffix}', labelvalues), 0.0)
+                lines.append(self._line(f'{self.name}{suffix}', self.labelnames, labelvalues, value))
+        return lines
+
+
+class Gauge(Metric):
+    """Gauge computed at scrape time."""
+
+    kind = 'gauge'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        collect: Callable[[], Iterable[tuple[tuple[str, ...], float]]],
+        labelnames: Iterable[str] = (),
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.collect = collect
+
+    def render(self, samples: dict[Sample, float]) -> list[str]:
+        """Return the exposition lines of the gauge."""
+        return [
+            self._line(self.name, self.labelnames, labelvalues, float(value))
+            for labelvalues, value in self.collect()
+        ]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return str(value).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+
+
+def render_metrics() -> str:
+    """
+    Render all registered metrics in the Prometheus text format.
+
+    Returns:
+        Exposition text
+    """
+    samples = read_samples(Path(settings.METRICS_DIR))
+    lines = []
+    for metric in _registry:
+        lines.append(f'# HELP {metric.name} {metric.documentation}')
+        lines.append(f'# TYPE {metric.name} {metric.kind}')
+        lines.extend(metric.render(samples))
+    return '\n'.join(lines) + '\n'
+
+
+HTTP_REQUEST_DURATION = Histogram(
+    'helpdesk_http_request_duration_seconds',
+    'Request latency by view',
+    labelnames=['view', 'method', 'status'],
+)
+DB_QUERIES = Counter(
+    'helpdesk_db_queries_total',
+    'SQL queries executed by view',
+    labelnames=['view'],
+)
+DB_QUERY_DURATION = Histogram(
+    'helpdesk_db_query_duration_seconds',
+    'SQL query duration by view',
+    labelnames=['view'],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+
+
+class _QueryTimer:
+    """Database execute wrapper collecting query durations of a request."""
+
+    def __init__(self) -> None:
+        self.durations: list[float] = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.durations.append(time.perf_counter() - started)
+
+
+class MetricsMiddleware:
+    """Record request latency and SQL queries per view."""
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        timer = _QueryTimer()
+        started = time.perf_counter()
+        with connections['default'].execute_wrapper(timer):
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - started
+
+        match = request.resolver_match
+        view = match.view_name if match else 'unmatched'
+        if view == 'metrics':
+            return response
+
+        HTTP_REQUEST_DURATION.observe(elapsed, view, request.method, str(response.status_code))
+        if timer.durations:
+            DB_QUERIES.inc(view, amount=len(timer.durations))
+            for duration in timer.durations:
+                DB_QUERY_DURATION.observe(duration, view)
+        return response
+
+
+class MetricsView(View):
+    """Expose metrics of all worker processes in the Prometheus text format."""
+
+    http_method_names = ['get']
+
+    def get(self, request: HttpRequest) -> HttpResponse:
+        """
+        Return the metrics.
+
+        Args:
+            request: HTTP request, authorized with METRICS_TOKEN if it is set
+
+        Returns:
+            Exposition text, or 401 without a valid token
+        """
+        token = settings.METRICS_TOKEN
+        if token and not hmac.compare_digest(
+            request.headers.get('Authorization', ''), f'Bearer {token}',
+        ):
+            return HttpResponse(status=401)
+
+        return HttpResponse(render_metrics(), content_type=CONTENT_TYPE)
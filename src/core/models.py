@@ -0,0 +1,36 @@
+"""
+Shared models.
+"""
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class IdempotencyKey(models.Model):
+    """First successful response to a request sent with an Idempotency-Key header."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='idempotency_keys',
+        verbose_name='Пользователь',
+    )
+    key = models.CharField('Ключ', max_length=255)
+    fingerprint = models.CharField('Отпечаток запроса', max_length=64)
+    status_code = models.PositiveSmallIntegerField('Код ответа', null=True, blank=True)
+    response_body = models.JSONField('Тело ответа', null=True, blank=True, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField('Дата создания', auto_now_add=True)
+    expires_at = models.DateTimeField('Истекает')
+
+    class Meta:
+        verbose_name = 'Ключ идемпотентности'
+        verbose_name_plural = 'Ключи идемпотентности'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'key'], name='core_idempotency_user_key_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['expires_at']),
+        ]
+
+    def __str__(self) -> str:
+        return self.key
@@ -0,0 +1,272 @@
+"""
+Pagination with planner-estimated counts for large tables, and keyset pagination.
+"""
+import base64
+import binascii
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Model, Q, QuerySet
+from django.utils.functional import cached_property
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from .exceptions import ValidationError
+
+
+def estimate_table_rows(model: type[Model], using: str) -> int | None:
+    """
+    Estimate the number of rows in a model's table.
+
+    Reads pg_class.reltuples, which VACUUM and ANALYZE keep current, and
+    caches it per process for PAGINATION_TABLE_ROWS_CACHE_TTL seconds.
+    Tables that have never been analyzed count as empty.
+
+    Args:
+        model: Model whose table to estimate
+        using: Database alias
+
+    Returns:
+        Estimated number of rows, or None if the database can't estimate
+    """
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return None
+
+    key = f'pagination:table-rows:{using}:{model._meta.db_table}'
+    rows = cache.get(key)
+    if rows is None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)',
+                [connection.ops.quote_name(model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+        rows = max(int(row[0]), 0) if row else 0
+        cache.set(key, rows, settings.PAGINATION_TABLE_ROWS_CACHE_TTL)
+    return rows
+
+
+def estimate_count(queryset: QuerySet) -> int | None:
+    """
+    Estimate the number of rows a queryset returns without counting them.
+
+    Uses the PostgreSQL planner's row estimate from EXPLAIN, which relies
+    on table statistics (reltuples) and the selectivity of the filters.
+
+    Args:
+        queryset: Queryset to estimate
+
+    Returns:
+        Estimated number of rows, or None if the database can't estimate
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+
+    sql, params = queryset.select_related(None).order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that trusts planner estimates for large result sets.
+
+    When the estimate is at least PAGINATION_ESTIMATE_THRESHOLD rows, it is
+    used as the count instead of running COUNT(*); smaller results are
+    counted exactly. The queryset is only EXPLAINed when its whole table
+    is above the threshold, so small tables cost just the COUNT(*). Works
+    for DRF views and as ModelAdmin.paginator.
+    """
+
+    count_is_estimated = False
+
+    @cached_property
+    def count(self) -> int:
+        """Return the estimated or exact total number of objects."""
+        queryset = self.object_list
+        threshold = settings.PAGINATION_ESTIMATE_THRESHOLD
+        if isinstance(queryset, QuerySet):
+            table_rows = estimate_table_rows(queryset.model, queryset.db)
+            if table_rows is not None and table_rows >= threshold:
+                estimate = estimate_count(queryset)
+                if estimate is not None and estimate >= threshold:
+                    self.count_is_estimated = True
+                    return estimate
+        return super().count
+
+
+class EstimatedCountPagination(PageNumberPagination):
+    """Page number pagination reporting whether the count is estimated."""
+
+    django_paginator_class = EstimatedCountPaginator
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def get_paginated_response(self, data: list) -> Response:
+        """Return paginated response with the count_is_estimated flag."""
+        return Response({
+            'count': self.page.paginator.count,
+            'count_is_estimated': self.page.paginator.count_is_estimated,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        """Return OpenAPI schema of the paginated response."""
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['count_is_estimated'] = {
+            'type': 'boolean',
+            'example': False,
+        }
+        return response_schema
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination in the queryset's ordering.
+
+    The primary key is appended to the ordering as a tiebreaker, so the
+    order is total, and the cursor holds the ordering values of the last
+    row of the page. The next page is read with a range condition on them
+    instead of an OFFSET: every page costs the same, however deep, and
+    rows inserted meanwhile don't shift pages. With time-ordered UUIDv7
+    keys the tiebreaker also follows creation order.
+
+    Orderings must consist of plain model fields.
+    """
+
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view=None) -> list:
+        """Return the page after the requested cursor."""
+        self.request = request
+        self.page_size = self._get_page_size(request)
+        self.ordering = self._get_ordering(queryset)
+        self.model = queryset.model
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            queryset = queryset.filter(self._after(self._decode_cursor(cursor)))
+        rows = list(queryset.order_by(*self.ordering)[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data: list) -> Response:
+        """Return the page with the link to the next one."""
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        """Return OpenAPI schema of the paginated response."""
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view) -> list[dict]:
+        """Return OpenAPI query parameters of the pagination."""
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Курсор страницы из ссылки next',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': f'Число результатов на странице, не более {self.max_page_size}',
+                'schema': {'type': 'integer'},
+            },
+        ]
+
+    def get_next_link(self) -> str | None:
+        """Return the URL of the next page, if any."""
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        values = [getattr(last, name.lstrip('-')) for name in self.ordering]
+        # str() keeps the microseconds DjangoJSONEncoder drops
+        cursor = base64.urlsafe_b64encode(json.dumps(values, default=str).encode()).decode()
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, cursor)
+
+    def _get_page_size(self, request: Request) -> int:
+        """Return the requested page size within the limits."""
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return settings.REST_FRAMEWORK['PAGE_SIZE']
+        return min(max(page_size, 1), self.max_page_size)
+
+    def _get_ordering(self, queryset: QuerySet) -> list[str]:
+        """Return the queryset's ordering with the primary key as tiebreaker."""
+        ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+        pk_names = {'pk', queryset.model._meta.pk.name}
+        if not any(name.lstrip('-') in pk_names for name in ordering):
+            ordering.append('-pk' if ordering and ordering[-1].startswith('-') else 'pk')
+        return ordering
+
+    def _decode_cursor(self, cursor: str) -> list:
+        """
+        Decode cursor values into Python values of the ordering fields.
+
+        Raises:
+            ValidationError: If the cursor is malformed
+        """
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError
+            return [
+                self._get_field(name.lstrip('-')).to_python(value)
+                for name, value in zip(self.ordering, values)
+            ]
+        except (ValueError, binascii.Error, DjangoValidationError, FieldDoesNotExist):
+            raise ValidationError('Некорректный курсор.')
+
+    def _get_field(self, name: str):
+        """Resolve an ordering field name, including pk."""
+        if name == 'pk':
+            return self.model._meta.pk
+        return self.model._meta.get_field(name)
+
+    def _after(self, values: list) -> Q:
+        """
+        Build the condition for rows after the cursor values.
+
+        Expands (a, b, c) > (x, y, z) per field direction and adds a plain
+        bound on the first field, which an index range scan can use.
+        """
+        condition = Q()
+        equal = Q()
+        for name, value in zip(self.ordering, values):
+            field = name.lstrip('-')
+            lookup = 'lt' if name.startswith('-') else 'gt'
+            condition |= equal & Q(**{f'{field}__{lookup}': value})
+            equal &= Q(**{field: value})
+        first = self.ordering[0]
+        bound = Q(**{f'{first.lstrip("-")}__{"lte" if first.startswith("-") else "gte"}': values[0]})
+        return bound & condition
@@ -0,0 +1,194 @@
+"""
+On-demand sampling profiler for requests.
+
+A request is profiled when it carries a valid signed X-Profile header
+(see the profile_token management command) or is picked by
+PROFILING_SAMPLE_RATE. A background thread samples the request thread's
+stack every PROFILING_INTERVAL seconds; SQL being executed at sample time
+is added as a leaf frame. Profiles are written in collapsed-stack format
+(one "frame;frame;frame count" line per stack, as consumed by
+flamegraph.pl and speedscope) to a ring buffer of at most
+PROFILING_MAX_PROFILES files in PROFILING_DIR.
+
+Requests that are not profiled only pay for a header lookup and, if
+sampling is enabled, one random() call.
+"""
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import ExitStack
+from pathlib import Path
+
+from django.conf import settings
+from django.core import signing
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = 'X-Profile'
+PROFILE_ID_HEADER = 'X-Profile-Id'
+TOKEN_SALT = 'core.profiling'
+
+_SQL_LABEL_LENGTH = 80
+
+
+def make_profile_token() -> str:
+    """
+    Create a signed token that enables profiling via the X-Profile header.
+
+    Returns:
+        Token valid for PROFILING_TOKEN_MAX_AGE seconds
+    """
+    return signing.TimestampSigner(salt=TOKEN_SALT).sign('profile')
+
+
+def _is_valid_token(token: str) -> bool:
+    """Check the signature and age of a profiling token."""
+    try:
+        signing.TimestampSigner(salt=TOKEN_SALT).unsign(token, max_age=settings.PROFILING_TOKEN_MAX_AGE)
+    except signing.BadSignature:
+        return False
+    return True
+
+
+def _frame_label(code, base_dir: str) -> str:
+    """Return 'function (path:line)' with a short path for a code object."""
+    filename = code.co_filename
+    if filename.startswith(base_dir):
+        filename = filename[len(base_dir):].lstrip(os.sep)
+    elif 'site-packages' in filename:
+        filename = filename.rsplit('site-packages' + os.sep, 1)[1]
+    return f'{code.co_name} ({filename}:{code.co_firstlineno})'
+
+
+def _sql_label(sql: str) -> str:
+    """Return a one-line, truncated label for a SQL statement."""
+    return 'SQL ' + re.sub(r'\s+', ' ', sql)[:_SQL_LABEL_LENGTH].replace(';', ',')
+
+
+class StackSampler:
+    """Samples the stack of one thread from a background thread."""
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self.current_sql: str | None = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profiling-sampler', daemon=True)
+        self._base_dir = str(settings.BASE_DIR)
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        """Take a sample every interval until stopped."""
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code, self._base_dir))
+                frame = frame.f_back
+            stack.reverse()
+            if self.current_sql is not None:
+                stack.append(_sql_label(self.current_sql))
+            self.stacks[tuple(stack)] += 1
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        """Database execute wrapper recording the statement being run."""
+        self.current_sql = sql
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.current_sql = None
+
+    def collapsed(self, root: str) -> str:
+        """
+        Render the samples in collapsed-stack format.
+
+        Args:
+            root: Label of the root frame, e.g. the request line
+
+        Returns:
+            One "frame;frame;frame count" line per distinct stack
+        """
+        return ''.join(
+            f'{";".join((root,) + stack)} {count}\n'
+            for stack, count in self.stacks.most_common()
+        )
+
+
+def write_profile(name: str, content: str) -> Path:
+    """
+    Write a profile to the ring buffer, evicting the oldest ones.
+
+    Args:
+        name: Profile file name
+        content: Collapsed stacks
+
+    Returns:
+        Path of the written profile
+    """
+    directory = Path(settings.PROFILING_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_text(content)
+
+    profiles = sorted(directory.glob('*.folded'), key=lambda p: p.name)
+    for old in profiles[:-settings.PROFILING_MAX_PROFILES]:
+        old.unlink(missing_ok=True)
+    return path
+
+
+class ProfilingMiddleware:
+    """Profile requests that are signed for profiling or randomly sampled."""
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        token = request.headers.get(PROFILE_HEADER)
+        sample_rate = settings.PROFILING_SAMPLE_RATE
+        if token is not None:
+            profile = _is_valid_token(token)
+        else:
+            profile = sample_rate > 0 and random.random() < sample_rate
+        if not profile:
+            return self.get_response(request)
+
+        sampler = StackSampler(threading.get_ident(), settings.PROFILING_INTERVAL)
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(sampler.execute_wrapper))
+                response = self.get_response(request)
+        finally:
+            sampler.stop()
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        profile_id = f'{time.strftime("%Y%m%dT%H%M%S")}-{uuid.uuid4().hex[:8]}'
+        root = f'{request.method} {request.path}'
+        try:
+            write_profile(f'{profile_id}.folded', sampler.collapsed(root))
+        except OSError:
+            logger.exception('Failed to write profile %s', profile_id)
+            return response
+
+        logger.info('Profiled %s in %.1fms: %s', root, elapsed_ms, profile_id)
+        response[PROFILE_ID_HEADER] = profile_id
+        return response
@@ -0,0 +1,134 @@
+"""
+Prebuilt OpenAPI schema served as a static artifact.
+
+The schema is generated by the openapi_schema management command into
+OPENAPI_SCHEMA_PATH and served from memory with gzip and ETag support,
+instead of introspecting every view and serializer on each request.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, HttpResponseNotModified
+from django.utils import translation
+from django.utils.cache import patch_vary_headers
+from django.views import View
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from drf_spectacular.generators import SchemaGenerator
+from drf_spectacular.renderers import OpenApiYamlRenderer
+
+logger = logging.getLogger(__name__)
+
+YAML_CONTENT_TYPE = 'application/vnd.oai.openapi'
+JSON_CONTENT_TYPE = 'application/vnd.oai.openapi+json'
+
+
+class IdentityMapJWTScheme(SimpleJWTScheme):
+    """Document IdentityMapJWTAuthentication as the SimpleJWT bearer scheme."""
+
+    target_class = 'core.authentication.IdentityMapJWTAuthentication'
+
+
+def generate_schema() -> bytes:
+    """
+    Generate the OpenAPI schema of the current code.
+
+    Returns:
+        Schema rendered as YAML
+    """
+    with translation.override(settings.LANGUAGE_CODE):
+        schema = SchemaGenerator().get_schema(request=None, public=True)
+        return OpenApiYamlRenderer().render(schema, renderer_context={})
+
+
+def get_schema_path() -> Path:
+    """
+    Get the path of the schema artifact.
+
+    Returns:
+        Path configured in OPENAPI_SCHEMA_PATH
+    """
+    return Path(settings.OPENAPI_SCHEMA_PATH)
+
+
+@dataclass(frozen=True)
+class SchemaVariant:
+    """Schema body in one format, precompressed."""
+
+    content_type: str
+    body: bytes
+    gzipped: bytes
+    etag: str
+
+    @classmethod
+    def build(cls, content_type: str, body: bytes) -> 'SchemaVariant':
+        """Compress the body and compute its ETag."""
+        return cls(
+            content_type=content_type,
+            body=body,
+            gzipped=gzip.compress(body, compresslevel=9, mtime=0),
+            etag=f'W/"{hashlib.sha256(body).hexdigest()[:32]}"',
+        )
+
+
+_variants: dict[str, SchemaVariant] = {}
+_lock = threading.Lock()
+
+
+def _load_variants() -> dict[str, SchemaVariant]:
+    """Load the schema artifact once per process."""
+    with _lock:
+        if not _variants:
+            path = get_schema_path()
+            if path.exists():
+                body = path.read_bytes()
+            else:
+                logger.warning(
+                    'OpenAPI schema artifact %s is missing, generating it in-process. '
+                    'Run "manage.py openapi_schema" to prebuild it.',
+                    path,
+                )
+                body = generate_schema()
+
+            json_body = json.dumps(yaml.safe_load(body), ensure_ascii=False).encode()
+            _variants['yaml'] = SchemaVariant.build(YAML_CONTENT_TYPE, body)
+            _variants['json'] = SchemaVariant.build(JSON_CONTENT_TYPE, json_body)
+    return _variants
+
+
+class PrebuiltSchemaView(View):
+    """Serve the prebuilt OpenAPI schema (YAML, or JSON with ?format=json)."""
+
+    http_method_names = ['get', 'head']
+
+    def get(self, request: HttpRequest) -> HttpResponse:
+        """
+        Return the schema artifact.
+
+        Args:
+            request: HTTP request
+
+        Returns:
+            Schema response, or 304 if the client's copy is current
+        """
+        schema_format = 'json' if request.GET.get('format') == 'json' else 'yaml'
+        variant = _load_variants()[schema_format]
+
+        if variant.etag in request.headers.get('If-None-Match', ''):
+            response = HttpResponseNotModified()
+        elif 'gzip' in request.headers.get('Accept-Encoding', ''):
+            response = HttpResponse(variant.gzipped, content_type=variant.content_type)
+            response['Content-Encoding'] = 'gzip'
+        else:
+            response = HttpResponse(variant.body, content_type=variant.content_type)
+
+        response['ETag'] = variant.etag
+        response['Cache-Control'] = 'public, max-age=300'
+        patch_vary_headers(response, ['Accept-Encoding'])
+        return response
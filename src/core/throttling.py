@@ -0,0 +1,204 @@
+"""
+Role-aware token bucket throttling.
+
+Bucket state lives in a memory-mapped file shared by all worker processes
+on the node, so limits hold across gunicorn workers without touching the
+database.
+"""
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+
+from django.conf import settings
+from rest_framework.request import Request
+from rest_framework.throttling import BaseThrottle
+
+HEADER = struct.Struct('<8sQ')
+SLOT = struct.Struct('<Qdd8x')
+MAGIC = b'HDTHRTL1'
+MAX_PROBES = 8
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+class SharedBucketStore:
+    """
+    Fixed-size hash table of token buckets in a memory-mapped file.
+
+    Each slot holds a key hash, the current number of tokens and the time
+    of the last update. Collisions are resolved by linear probing; when all
+    probed slots are taken, the least recently updated one is reused.
+    """
+
+    def __init__(self, path: str, slots: int) -> None:
+        self.path = path
+        self.slots = slots
+        self._pid = None
+        self._fd = None
+        self._map = None
+        self._lock = threading.Lock()
+
+    def _open(self) -> None:
+        """Map the store file, creating it if needed."""
+        if self._fd is not None:
+            self._map.close()
+            os.close(self._fd)
+
+        size = HEADER.size + SLOT.size * self.slots
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            header = os.pread(fd, HEADER.size, 0)
+            if os.fstat(fd).st_size != size or header != HEADER.pack(MAGIC, self.slots):
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, size)
+                os.pwrite(fd, HEADER.pack(MAGIC, self.slots), 0)
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+        self._fd = fd
+        self._map = mmap.mmap(fd, size)
+        # flock() is tied to the open file description, which is shared with
+        # a forked child, so every process needs a descriptor of its own.
+        self._pid = os.getpid()
+
+    def consume(
+        self,
+        key: str,
+        *,
+        capacity: float,
+        refill_rate: float,
+        cost: float = 1.0,
+    ) -> tuple[bool, float]:
+        """
+        Take tokens from a bucket.
+
+        Args:
+            key: Bucket identifier
+            capacity: Maximum number of tokens in the bucket
+            refill_rate: Tokens added per second
+            cost: Tokens required by the request
+
+        Returns:
+            Tuple of (allowed, seconds to wait until enough tokens are available)
+        """
+        key_hash = int.from_bytes(
+            hashlib.blake2b(key.encode(), digest_size=8).digest(), 'little'
+        ) or 1
+
+        with self._lock:
+            if self._pid != os.getpid():
+                self._open()
+
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                now = time.time()
+                offset, tokens, updated = self._find_slot(key_hash, now)
+                if tokens is None:
+                    tokens = capacity
+                else:
+                    elapsed = max(0.0, now - updated)
+                    tokens = min(capacity, tokens + elapsed * refill_rate)
+
+                allowed = tokens >= cost
+                if allowed:
+                    tokens -= cost
+                SLOT.pack_into(self._map, offset, key_hash, tokens, now)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+        if allowed:
+            return True, 0.0
+        return False, (cost - tokens) / refill_rate
+
+    def _find_slot(self, key_hash: int, now: float) -> tuple[int, float | None, float]:
+        """Return the slot offset for a key and its stored state, if any."""
+        start = key_hash % self.slots
+        victim_offset, victim_updated = None, now
+        for probe in range(MAX_PROBES):
+            offset = HEADER.size + SLOT.size * ((start + probe) % self.slots)
+            slot_hash, tokens, updated = SLOT.unpack_from(self._map, offset)
+            if slot_hash == key_hash:
+                return offset, tokens, updated
+            if slot_hash == 0:
+                return offset, None, now
+            if victim_offset is None or updated < victim_updated:
+                victim_offset, victim_updated = offset, updated
+        return victim_offset, None, now
+
+
+_store = None
+
+
+def get_bucket_store() -> SharedBucketStore:
+    """
+    Get the process-wide bucket store.
+
+    Returns:
+        Store backed by the file configured in THROTTLE_STORE_PATH
+    """
+    global _store
+    if _store is None:
+        _store = SharedBucketStore(
+            settings.THROTTLE_STORE_PATH,
+            settings.THROTTLE_STORE_SLOTS,
+        )
+    return _store
+
+
+def parse_rate(rate: str) -> tuple[int, int]:
+    """
+    Parse a rate string such as '100/min'.
+
+    Args:
+        rate: Number of requests and period (s, m, h or d prefix)
+
+    Returns:
+        Tuple of (number of requests, period in seconds)
+    """
+    num, period = rate.split('/')
+    return int(num), PERIODS[period[0]]
+
+
+class RoleTokenBucketThrottle(BaseThrottle):
+    """
+    Token bucket throttle keyed by user and endpoint class.
+
+    The endpoint class comes from the view's ``throttle_scope`` and the
+    limit from ``THROTTLE_RATES[scope][role]``. Anonymous requests use the
+    'anon' role and are keyed by client IP. Views without a scope, and roles
+    without a configured rate, are not throttled.
+    """
+
+    def __init__(self) -> None:
+        self.wait_seconds = None
+
+    def allow_request(self, request: Request, view) -> bool:
+        """Check whether the request fits into the caller's bucket."""
+        scope = getattr(view, 'throttle_scope', None)
+        if not scope:
+            return True
+
+        if request.user and request.user.is_authenticated:
+            role, ident = request.user.role, request.user.pk
+        else:
+            role, ident = 'anon', self.get_ident(request)
+
+        rate = settings.THROTTLE_RATES.get(scope, {}).get(role)
+        if rate is None:
+            return True
+
+        num_requests, duration = parse_rate(rate)
+        allowed, self.wait_seconds = get_bucket_store().consume(
+            f'{scope}:{role}:{ident}',
+            capacity=num_requests,
+            refill_rate=num_requests / duration,
+        )
+        return allowed
+
+    def wait(self) -> float | None:
+        """Return the number of seconds until the next request is allowed."""
+        return self.wait_seconds